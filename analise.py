@@ -0,0 +1,416 @@
+"""
+Análise prévia de viabilidade para o problema do Caminho Hamiltoniano.
+
+Este módulo reúne condições necessárias verificáveis em tempo polinomial.
+Quando alguma delas falha, o grafo certamente não possui caminho hamiltoniano
+e a busca exponencial pode ser evitada. Cada falha é identificada por um
+código de motivo.
+
+Todas as verificações (exceto as de graus de entrada e saída) são feitas sobre
+o grafo subjacente não orientado: um caminho hamiltoniano em um grafo
+orientado também é um caminho hamiltoniano no grafo subjacente.
+
+Autor: Vinicius Xavier Ramalho
+Data: Outubro 2025
+"""
+
+# Códigos de motivo para a inexistência de caminho hamiltoniano
+MOTIVO_GRAFO_VAZIO = 'grafo_vazio'
+MOTIVO_VERTICE_ISOLADO = 'vertice_isolado'
+MOTIVO_DESCONEXO = 'desconexo'
+MOTIVO_EXCESSO_GRAU_UM = 'excesso_grau_um'
+MOTIVO_EXCESSO_SEM_ENTRADA = 'excesso_sem_entrada'
+MOTIVO_EXCESSO_SEM_SAIDA = 'excesso_sem_saida'
+MOTIVO_VERTICE_DE_CORTE = 'vertice_de_corte'
+MOTIVO_DESEQUILIBRIO_BIPARTIDO = 'desequilibrio_bipartido'
+MOTIVO_GRAU_INSUFICIENTE = 'grau_insuficiente'
+MOTIVO_ARVORE_DE_BLOCOS = 'arvore_de_blocos'
+MOTIVO_BUSCA_EXAUSTIVA = 'busca_exaustiva'
+
+DESCRICOES_MOTIVOS = {
+    MOTIVO_GRAFO_VAZIO: "grafo sem vértices",
+    MOTIVO_VERTICE_ISOLADO: "existe vértice isolado",
+    MOTIVO_DESCONEXO: "grafo desconexo",
+    MOTIVO_EXCESSO_GRAU_UM: "mais vértices de grau 1 do que pontas disponíveis",
+    MOTIVO_EXCESSO_SEM_ENTRADA: "mais de um vértice sem arestas de entrada",
+    MOTIVO_EXCESSO_SEM_SAIDA: "mais de um vértice sem arestas de saída",
+    MOTIVO_VERTICE_DE_CORTE: "a remoção de um vértice deixa componentes demais",
+    MOTIVO_DESEQUILIBRIO_BIPARTIDO: "grafo bipartido com lados desequilibrados",
+    MOTIVO_GRAU_INSUFICIENTE: "existe vértice com menos de dois vizinhos (ciclo)",
+    MOTIVO_ARVORE_DE_BLOCOS: "os blocos biconexos não formam uma cadeia entre as pontas",
+    MOTIVO_BUSCA_EXAUSTIVA: "busca exaustiva sem sucesso",
+}
+
+
+def descrever_motivo(motivo):
+    """
+    Obtém a descrição legível de um código de motivo.
+
+    Args:
+        motivo (str): Código de motivo
+
+    Returns:
+        str: Descrição do motivo
+    """
+    return DESCRICOES_MOTIVOS.get(motivo, motivo)
+
+
+def vizinhancas_subjacentes(grafo):
+    """
+    Calcula as listas de vizinhos do grafo subjacente não orientado, sem laços.
+
+    Args:
+        grafo (Grafo): Grafo a ser analisado
+
+    Returns:
+        list: Lista ordenada de vizinhos de cada vértice
+    """
+    n = grafo.num_vertices
+    if not grafo.orientado:
+        return [[w for w in grafo.obter_adjacentes(v) if w != v] for v in range(n)]
+
+    vizinhos = [set() for _ in range(n)]
+    for origem in range(n):
+        for destino in grafo.obter_adjacentes(origem):
+            if destino != origem:
+                vizinhos[origem].add(destino)
+                vizinhos[destino].add(origem)
+    return [sorted(conjunto) for conjunto in vizinhos]
+
+
+def componentes_apos_remocao(vizinhos):
+    """
+    Conta, para cada vértice, os componentes que restam ao removê-lo.
+
+    Usa a busca em profundidade de Tarjan (iterativa) sobre um grafo conexo:
+    um filho c de v na árvore de busca fica separado quando low[c] >= disc[v].
+
+    Args:
+        vizinhos (list): Listas de vizinhos de um grafo conexo não orientado
+
+    Returns:
+        list: Número de componentes de G - v para cada vértice v
+    """
+    n = len(vizinhos)
+    descoberta = [-1] * n
+    baixo = [0] * n
+    separados = [0] * n
+    if n == 0:
+        return separados
+
+    descoberta[0] = baixo[0] = 0
+    tempo = 1
+    pilha = [(0, -1, iter(vizinhos[0]))]
+    while pilha:
+        vertice, pai, iterador = pilha[-1]
+        for vizinho in iterador:
+            if descoberta[vizinho] == -1:
+                descoberta[vizinho] = baixo[vizinho] = tempo
+                tempo += 1
+                pilha.append((vizinho, vertice, iter(vizinhos[vizinho])))
+                break
+            if vizinho != pai:
+                baixo[vertice] = min(baixo[vertice], descoberta[vizinho])
+        else:
+            pilha.pop()
+            if pai != -1:
+                baixo[pai] = min(baixo[pai], baixo[vertice])
+                if baixo[vertice] >= descoberta[pai]:
+                    separados[pai] += 1
+
+    # Vértices que não são raiz também deixam o lado do pai como componente
+    return [separados[v] + (1 if v != 0 else 0) for v in range(n)]
+
+
+def blocos_biconexos(vizinhos):
+    """
+    Separa o grafo em blocos (componentes biconexos), em tempo O(V + E).
+
+    Usa a mesma busca de Tarjan de componentes_apos_remocao, com uma pilha
+    de vértices: quando um filho c de v satisfaz low[c] >= disc[v], os
+    vértices empilhados a partir de c formam, junto com v, um bloco. Uma
+    ponte é um bloco de dois vértices e um vértice isolado, um bloco sozinho.
+
+    Args:
+        vizinhos (list): Listas de vizinhos de um grafo não orientado
+
+    Returns:
+        list: Blocos, cada um como lista de vértices em ordem crescente
+    """
+    n = len(vizinhos)
+    descoberta = [-1] * n
+    baixo = [0] * n
+    blocos = []
+    tempo = 0
+    for raiz in range(n):
+        if descoberta[raiz] != -1:
+            continue
+        descoberta[raiz] = baixo[raiz] = tempo
+        tempo += 1
+        if not vizinhos[raiz]:
+            blocos.append([raiz])
+            continue
+        empilhados = [raiz]
+        pilha = [(raiz, -1, iter(vizinhos[raiz]))]
+        while pilha:
+            vertice, pai, iterador = pilha[-1]
+            for vizinho in iterador:
+                if descoberta[vizinho] == -1:
+                    descoberta[vizinho] = baixo[vizinho] = tempo
+                    tempo += 1
+                    empilhados.append(vizinho)
+                    pilha.append((vizinho, vertice, iter(vizinhos[vizinho])))
+                    break
+                if vizinho != pai:
+                    baixo[vertice] = min(baixo[vertice], descoberta[vizinho])
+            else:
+                pilha.pop()
+                if pai != -1:
+                    baixo[pai] = min(baixo[pai], baixo[vertice])
+                    if baixo[vertice] >= descoberta[pai]:
+                        # Desempilha a subárvore de vertice: com pai, é um bloco
+                        bloco = [pai]
+                        while True:
+                            topo = empilhados.pop()
+                            bloco.append(topo)
+                            if topo == vertice:
+                                break
+                        blocos.append(sorted(bloco))
+    return blocos
+
+
+def cadeia_de_blocos(vizinhos):
+    """
+    Ordena os blocos do grafo ao longo de um caminho hamiltoniano.
+
+    Um caminho hamiltoniano passa por cada vértice de corte uma única vez e,
+    ao fazê-lo, esgota um lado antes de seguir para o outro. Por isso a
+    árvore de blocos e vértices de corte precisa ser um caminho: cada vértice
+    de corte pertence a exatamente dois blocos, cada bloco tem no máximo dois
+    vértices de corte e só os dois blocos das pontas são folhas. O caminho
+    percorre então os blocos em ordem, entrando e saindo de cada bloco do
+    meio pelos seus dois vértices de corte.
+
+    Args:
+        vizinhos (list): Listas de vizinhos de um grafo não orientado
+
+    Returns:
+        tuple ou None: (blocos, cortes) com blocos[i] e blocos[i + 1]
+                       unidos por cortes[i], ou None se o grafo for desconexo
+                       ou a árvore de blocos não for um caminho
+    """
+    blocos = blocos_biconexos(vizinhos)
+    if len(blocos) <= 1:
+        return blocos, []
+
+    blocos_do_vertice = [[] for _ in vizinhos]
+    for indice, bloco in enumerate(blocos):
+        for vertice in bloco:
+            blocos_do_vertice[vertice].append(indice)
+    if any(len(lista) > 2 for lista in blocos_do_vertice):
+        return None
+    cortes_do_bloco = [[v for v in bloco if len(blocos_do_vertice[v]) == 2] for bloco in blocos]
+    if any(len(cortes) != 1 and len(cortes) != 2 for cortes in cortes_do_bloco):
+        return None
+
+    # Percorre a árvore a partir de uma folha; se não alcançar todos os
+    # blocos, o grafo é desconexo
+    atual = min(i for i in range(len(blocos)) if len(cortes_do_bloco[i]) == 1)
+    ordem, cortes = [atual], []
+    anterior_corte = -1
+    while True:
+        seguintes = [c for c in cortes_do_bloco[atual] if c != anterior_corte]
+        if not seguintes:
+            break
+        anterior_corte = seguintes[0]
+        atual = [b for b in blocos_do_vertice[anterior_corte] if b != atual][0]
+        ordem.append(atual)
+        cortes.append(anterior_corte)
+    if len(ordem) != len(blocos):
+        return None
+    return [blocos[i] for i in ordem], cortes
+
+
+def _colorir_bipartido(vizinhos):
+    """
+    Tenta colorir um grafo conexo com duas cores.
+
+    Returns:
+        list ou None: Cor (0 ou 1) de cada vértice, ou None se não for bipartido
+    """
+    cores = [-1] * len(vizinhos)
+    cores[0] = 0
+    fila = [0]
+    for vertice in fila:
+        for vizinho in vizinhos[vertice]:
+            if cores[vizinho] == -1:
+                cores[vizinho] = 1 - cores[vertice]
+                fila.append(vizinho)
+            elif cores[vizinho] == cores[vertice]:
+                return None
+    return cores
+
+
+def analisar_viabilidade(grafo, vertice_inicial=None, vertice_final=None, ciclo=False):
+    """
+    Verifica condições necessárias para a existência de um caminho hamiltoniano.
+
+    As verificações custam O(V + E) no total e vão das mais baratas às mais
+    caras: vértices isolados, conexidade, vértices de grau 1, graus de entrada
+    e saída (grafos orientados), vértices de corte, cadeia de blocos
+    biconexos e equilíbrio bipartido. Pontas fixas tornam as condições mais
+    fortes: um vértice de grau 1 ou sem entrada que não seja a ponta fixada
+    já impede o caminho. Um ciclo hamiltoniano não tem pontas: todo vértice
+    precisa de dois vizinhos, o grafo não pode ter vértice de corte e, se for
+    bipartido, os lados têm o mesmo tamanho.
+
+    Args:
+        grafo (Grafo): Grafo a ser analisado
+        vertice_inicial (int, optional): Vértice onde o caminho deve começar
+        vertice_final (int, optional): Vértice onde o caminho deve terminar
+        ciclo (bool): Se True, verifica condições para um ciclo hamiltoniano
+
+    Returns:
+        str ou None: Código do motivo que prova a inexistência do caminho,
+                     ou None se nenhuma condição necessária foi violada
+    """
+    n = grafo.num_vertices
+    if n == 0:
+        return MOTIVO_GRAFO_VAZIO
+    if n == 1:
+        return None
+
+    # Pontas conhecidas (um ciclo não tem pontas: todos os vértices são internos)
+    pontas = [] if ciclo else [v for v in (vertice_inicial, vertice_final) if v is not None]
+    vagas = 0 if ciclo else 2 - len(pontas)
+
+    vizinhos = vizinhancas_subjacentes(grafo)
+    graus = [len(lista) for lista in vizinhos]
+
+    if 0 in graus:
+        return MOTIVO_VERTICE_ISOLADO
+
+    # Conexidade (fraca, no caso orientado)
+    alcancado = [False] * n
+    alcancado[0] = True
+    fila = [0]
+    for vertice in fila:
+        for vizinho in vizinhos[vertice]:
+            if not alcancado[vizinho]:
+                alcancado[vizinho] = True
+                fila.append(vizinho)
+    if len(fila) < n:
+        return MOTIVO_DESCONEXO
+
+    # Vértices de grau 1 só podem ser pontas do caminho. No ciclo orientado
+    # com dois vértices, o grafo subjacente tem grau 1 e o ciclo existe
+    grau_um = [v for v in range(n) if graus[v] == 1]
+    if ciclo and grau_um and (n > 2 or not grafo.orientado):
+        return MOTIVO_GRAU_INSUFICIENTE
+    if len([v for v in grau_um if v not in pontas]) > vagas and not ciclo:
+        return MOTIVO_EXCESSO_GRAU_UM
+
+    if grafo.orientado:
+        com_entrada = [False] * n
+        sem_saida = []
+        for origem in range(n):
+            saidas = [w for w in grafo.obter_adjacentes(origem) if w != origem]
+            if not saidas:
+                sem_saida.append(origem)
+            for destino in saidas:
+                com_entrada[destino] = True
+        sem_entrada = [v for v in range(n) if not com_entrada[v]]
+        # Só o início pode não ter entrada e só o fim pode não ter saída
+        if len(sem_entrada) > (0 if ciclo else 1):
+            return MOTIVO_EXCESSO_SEM_ENTRADA
+        if vertice_inicial is not None and sem_entrada and sem_entrada[0] != vertice_inicial:
+            return MOTIVO_EXCESSO_SEM_ENTRADA
+        if len(sem_saida) > (0 if ciclo else 1):
+            return MOTIVO_EXCESSO_SEM_SAIDA
+        if vertice_final is not None and sem_saida and sem_saida[0] != vertice_final:
+            return MOTIVO_EXCESSO_SEM_SAIDA
+
+    # G - v com 3 ou mais componentes não admite caminho passando por v;
+    # se v é uma ponta (ou o caminho é um ciclo), já 2 componentes bastam
+    componentes = componentes_apos_remocao(vizinhos)
+    if max(componentes) > (1 if ciclo else 2):
+        return MOTIVO_VERTICE_DE_CORTE
+    if any(componentes[v] > 1 for v in pontas):
+        return MOTIVO_VERTICE_DE_CORTE
+
+    # Os blocos precisam formar uma cadeia, com as pontas fixas em blocos
+    # distintos nas extremidades dela
+    if not ciclo and max(componentes) > 1:
+        cadeia = cadeia_de_blocos(vizinhos)
+        if cadeia is None:
+            return MOTIVO_ARVORE_DE_BLOCOS
+        blocos = cadeia[0]
+        extremos = [set(blocos[0]), set(blocos[-1])]
+        for ponta in pontas:
+            if ponta not in extremos[0] and ponta not in extremos[1]:
+                return MOTIVO_ARVORE_DE_BLOCOS
+        if len(pontas) == 2 and any(set(pontas) <= extremo for extremo in extremos):
+            return MOTIVO_ARVORE_DE_BLOCOS
+
+    # Em um grafo bipartido o caminho alterna os lados
+    cores = _colorir_bipartido(vizinhos)
+    if cores is not None:
+        lado_um = sum(cores)
+        lado_zero = n - lado_um
+        if abs(lado_um - lado_zero) > (0 if ciclo else 1):
+            return MOTIVO_DESEQUILIBRIO_BIPARTIDO
+        if lado_um != lado_zero:
+            # O caminho começa e termina no lado maior
+            lado_maior = 1 if lado_um > lado_zero else 0
+            if any(cores[v] != lado_maior for v in pontas):
+                return MOTIVO_DESEQUILIBRIO_BIPARTIDO
+        elif len(pontas) == 2 and cores[pontas[0]] == cores[pontas[1]]:
+            # Com lados iguais, as pontas ficam em lados opostos
+            return MOTIVO_DESEQUILIBRIO_BIPARTIDO
+
+    return None
+
+
+def classes_de_gemeos(grafo):
+    """
+    Agrupa os vértices gêmeos do grafo.
+
+    Dois vértices u e v são gêmeos quando têm a mesma vizinhança fora do par
+    (N(u) - {v} = N(v) - {u}; em grafos orientados, vale para sucessores e
+    predecessores). Qualquer permutação dentro de uma classe de gêmeos é um
+    automorfismo do grafo. No grafo completo, por exemplo, todos os vértices
+    formam uma única classe.
+
+    Args:
+        grafo (Grafo): Grafo a ser analisado
+
+    Returns:
+        list: Classes com pelo menos dois vértices, cada uma em ordem crescente
+    """
+    n = grafo.num_vertices
+    sucessores = [frozenset(w for w in grafo.obter_adjacentes(v) if w != v) for v in range(n)]
+    if grafo.orientado:
+        predecessores = [set() for _ in range(n)]
+        for origem in range(n):
+            for destino in sucessores[origem]:
+                predecessores[destino].add(origem)
+        predecessores = [frozenset(conjunto) for conjunto in predecessores]
+    else:
+        predecessores = sucessores
+
+    # Gêmeos adjacentes têm a mesma vizinhança fechada; não adjacentes, a mesma aberta
+    classes = []
+    agrupados = set()
+    for fechada in (True, False):
+        grupos = {}
+        for v in range(n):
+            if v in agrupados:
+                continue
+            extra = frozenset((v,)) if fechada else frozenset()
+            chave = (sucessores[v] | extra, predecessores[v] | extra)
+            grupos.setdefault(chave, []).append(v)
+        for grupo in grupos.values():
+            if len(grupo) > 1:
+                classes.append(grupo)
+                agrupados.update(grupo)
+    return classes
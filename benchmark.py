@@ -0,0 +1,407 @@
+"""
+Benchmark reprodutível dos motores de busca de caminho hamiltoniano.
+
+Constrói famílias padrão de instâncias em vários tamanhos, mede cada modo de
+busca com repetições e sementes fixas, registra o pico de memória e grava um
+relatório JSON. O relatório pode ser comparado com uma base armazenada para
+detectar regressões de tempo ou mudanças de resposta.
+
+Uso:
+    python benchmark.py --saida atual.json
+    python benchmark.py --saida atual.json --base base.json --tolerancia 0.25
+
+Autor: Vinicius Xavier Ramalho
+Data: Outubro 2025
+"""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import geradores
+from main import (CaminhoHamiltoniano, Grafo, criar_grafo_completo,
+                  LIMITE_VERTICES_CONTAGEM, LIMITE_VERTICES_PD,
+                  MOTOR_BIDIRECIONAL, MOTOR_POSA, MOTOR_PROGRAMACAO_DINAMICA,
+                  ORDENACAO_WARNSDORFF,
+                  STATUS_ORCAMENTO_ESGOTADO)
+
+
+VERSAO_RELATORIO = 1
+
+# Tamanhos de cada família por conjunto de instâncias
+CONJUNTOS = {
+    'rapido': {
+        'gnp': [12, 16],
+        'grade': [3, 4],
+        'cavalo': [5],
+        'completo': [8],
+        'petersen': [5, 7],
+        'torneio': [12],
+    },
+    'completo': {
+        'gnp': [12, 16, 20, 24],
+        'grade': [3, 4, 5, 6],
+        'cavalo': [5, 6],
+        'completo': [8, 12, 16],
+        'petersen': [5, 7, 9, 11],
+        'torneio': [12, 16, 20],
+    },
+}
+
+# A contagem de caminhos cresce muito depressa; só é medida até este tamanho
+LIMITE_VERTICES_BENCHMARK_CONTAGEM = 16
+
+# Acima deste tamanho as fronteiras do encontro no meio passam de centenas de MB
+LIMITE_VERTICES_BIDIRECIONAL = 28
+
+# Variação relativa de tempo tolerada antes de acusar regressão
+TOLERANCIA_PADRAO = 0.25
+
+# Abaixo deste tempo (segundos) as medições são ruído demais para comparar
+TEMPO_MINIMO_COMPARACAO = 0.005
+
+
+def gerar_gnp(n, semente):
+    """
+    Grafo aleatório G(n, p) não orientado, com p perto do limiar de hamiltonicidade.
+
+    O limiar é p = (ln n + ln ln n) / n; usa-se um valor um pouco acima dele,
+    onde as instâncias são as mais difíceis para o backtracking.
+
+    Args:
+        n (int): Número de vértices
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        Grafo: Grafo gerado
+    """
+    p = min(1.0, 1.2 * (math.log(n) + math.log(math.log(n))) / n)
+    return geradores.erdos_renyi(n, p, semente, classe=Grafo)
+
+
+def gerar_grade(lado, semente=None):
+    """Grade lado x lado não orientada."""
+    return geradores.grade(lado, lado, classe=Grafo)
+
+
+def gerar_cavalo(lado, semente=None):
+    """Grafo dos movimentos do cavalo em um tabuleiro lado x lado."""
+    return geradores.cavalo(lado, classe=Grafo)
+
+
+def gerar_completo(n, semente=None):
+    """Grafo completo, construído por criar_grafo_completo em modo silencioso."""
+    return criar_grafo_completo(n, silencioso=True)
+
+
+def gerar_petersen(k, semente=None):
+    """
+    Grafo de Petersen generalizado GP(k, 2).
+
+    GP(5, 2) é o grafo de Petersen, o menor grafo hipo-hamiltoniano: não tem
+    ciclo hamiltoniano, mas tem caminho hamiltoniano.
+
+    Args:
+        k (int): Número de vértices de cada anel (total 2k)
+
+    Returns:
+        Grafo: Grafo gerado
+    """
+    externos = list(range(k))
+    destinos = ([(i + 1) % k for i in externos] + [k + i for i in externos]
+                + [k + (i + 2) % k for i in externos])
+    origens = externos * 2 + [k + i for i in externos]
+    return geradores.grafo_de_arestas(2 * k, origens, destinos, classe=Grafo)
+
+
+def gerar_torneio(n, semente):
+    """Torneio aleatório (todo torneio tem caminho hamiltoniano, pelo teorema de Rédei)."""
+    return geradores.torneio(n, semente, classe=Grafo)
+
+
+# Família -> (gerador, se depende da semente)
+FAMILIAS = {
+    'gnp': (gerar_gnp, True),
+    'grade': (gerar_grade, False),
+    'cavalo': (gerar_cavalo, False),
+    'completo': (gerar_completo, False),
+    'petersen': (gerar_petersen, False),
+    'torneio': (gerar_torneio, True),
+}
+
+
+def _encontrar(configuracao):
+    """Cria um modo que executa encontrar_caminho com a configuração dada."""
+    def executar(grafo, timeout):
+        algoritmo = CaminhoHamiltoniano(grafo, **configuracao)
+        resultado = algoritmo.resolver(timeout=timeout)
+        return {
+            'status': resultado.status,
+            'nos_expandidos': resultado.nos_expandidos,
+        }
+    return executar
+
+
+def _encontrar_entre_pontas(configuracao):
+    """
+    Cria um modo que busca um caminho do primeiro ao último vértice.
+
+    Para motores que só se aplicam com as duas pontas fixas.
+    """
+    def executar(grafo, timeout):
+        algoritmo = CaminhoHamiltoniano(grafo, **configuracao)
+        resultado = algoritmo.resolver(0, timeout=timeout,
+                                       vertice_final=grafo.num_vertices - 1)
+        return {
+            'status': resultado.status,
+            'nos_expandidos': resultado.nos_expandidos,
+        }
+    return executar
+
+
+def _contar(grafo, timeout):
+    """Modo que conta todos os caminhos hamiltonianos pela programação dinâmica."""
+    total = CaminhoHamiltoniano(grafo).contar_caminhos(timeout=timeout)
+    if total is None:
+        return {'status': STATUS_ORCAMENTO_ESGOTADO}
+    return {'status': 'contado', 'total': total}
+
+
+# Modo -> (função de execução, número máximo de vértices ou None)
+MODOS = {
+    'backtracking': (_encontrar({}), None),
+    'podas': (_encontrar({'podas': True}), None),
+    'warnsdorff': (_encontrar({'ordenacao': ORDENACAO_WARNSDORFF, 'podas': True}), None),
+    'programacao_dinamica': (_encontrar({'motor': MOTOR_PROGRAMACAO_DINAMICA}),
+                             min(LIMITE_VERTICES_PD, 24)),
+    'contagem': (_contar, min(LIMITE_VERTICES_CONTAGEM, LIMITE_VERTICES_BENCHMARK_CONTAGEM)),
+    'posa': (_encontrar({'motor': MOTOR_POSA}), None),
+    'propagacao': (_encontrar({'propagacao': True}), None),
+    'decompor': (_encontrar({'decompor': True}), None),
+    'memo_estados': (_encontrar({'memo_estados': True, 'podas': True}), None),
+    'bidirecional': (_encontrar_entre_pontas({'motor': MOTOR_BIDIRECIONAL}),
+                     LIMITE_VERTICES_BIDIRECIONAL),
+}
+
+# Modos que rejeitam grafos orientados (as famílias orientadas são puladas)
+MODOS_APENAS_NAO_ORIENTADOS = {'posa', 'propagacao'}
+
+
+def medir(executar, grafo, repeticoes, timeout, medir_memoria=True):
+    """
+    Mede um modo de busca em um grafo.
+
+    As repetições cronometradas rodam sem tracemalloc, que deixa o código
+    mais lento; o pico de memória é medido numa execução extra.
+
+    Args:
+        executar (callable): Função do modo (grafo, timeout) -> dict
+        grafo (Grafo): Instância a resolver
+        repeticoes (int): Número de execuções cronometradas
+        timeout (float): Tempo máximo de cada execução, em segundos
+        medir_memoria (bool): Se deve fazer a execução extra com tracemalloc
+
+    Returns:
+        dict: Resposta da última execução, tempos e pico de memória (em bytes,
+              None se não medido)
+    """
+    tempos = []
+    resposta = {}
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resposta = executar(grafo, timeout)
+        tempos.append(time.perf_counter() - inicio)
+        if resposta['status'] == STATUS_ORCAMENTO_ESGOTADO:
+            break  # Repetir uma execução que estourou o orçamento não informa nada
+
+    pico = None
+    if medir_memoria:
+        tracemalloc.start()
+        try:
+            executar(grafo, timeout)
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    resposta.update({
+        'tempos': tempos,
+        'tempo_mediano': statistics.median(tempos),
+        'tempo_minimo': min(tempos),
+        'memoria_pico': pico,
+    })
+    return resposta
+
+
+def executar_benchmark(conjunto='rapido', familias=None, modos=None, sementes=(0, 1),
+                       repeticoes=3, timeout=10.0, medir_memoria=True, verbose=True):
+    """
+    Executa o benchmark sobre as famílias e modos selecionados.
+
+    Args:
+        conjunto (str): Conjunto de tamanhos ('rapido' ou 'completo')
+        familias (list, optional): Famílias a medir (padrão: todas)
+        modos (list, optional): Modos de busca a medir (padrão: todos)
+        sementes (tuple): Sementes das famílias aleatórias
+        repeticoes (int): Execuções cronometradas por medição
+        timeout (float): Tempo máximo de cada execução, em segundos
+        medir_memoria (bool): Se deve medir o pico de memória de cada modo
+        verbose (bool): Se deve imprimir cada medição
+
+    Returns:
+        dict: Relatório serializável em JSON
+    """
+    tamanhos = CONJUNTOS[conjunto]
+    familias = familias or list(FAMILIAS)
+    modos = modos or list(MODOS)
+    for familia in familias:
+        if familia not in FAMILIAS:
+            raise ValueError(f"Família desconhecida: {familia} (opções: {', '.join(FAMILIAS)})")
+    for modo in modos:
+        if modo not in MODOS:
+            raise ValueError(f"Modo desconhecido: {modo} (opções: {', '.join(MODOS)})")
+
+    medicoes = []
+    for familia in familias:
+        gerador, aleatoria = FAMILIAS[familia]
+        for tamanho in tamanhos.get(familia, []):
+            for semente in (sementes if aleatoria else (None,)):
+                grafo = gerador(tamanho, semente)
+                n = grafo.num_vertices
+                arestas = sum(len(grafo.obter_adjacentes(v)) for v in range(n))
+                if not grafo.orientado:
+                    arestas //= 2
+                for modo in modos:
+                    executar, limite = MODOS[modo]
+                    if limite is not None and n > limite:
+                        continue
+                    if grafo.orientado and modo in MODOS_APENAS_NAO_ORIENTADOS:
+                        continue
+                    medicao = {
+                        'familia': familia,
+                        'tamanho': tamanho,
+                        'semente': semente,
+                        'modo': modo,
+                        'num_vertices': n,
+                        'num_arestas': arestas,
+                    }
+                    medicao.update(medir(executar, grafo, repeticoes, timeout,
+                                         medir_memoria))
+                    medicoes.append(medicao)
+                    if verbose:
+                        memoria = ('' if medicao['memoria_pico'] is None
+                                   else f"{medicao['memoria_pico'] / 1024:10.1f} KiB")
+                        print(f"{familia:>9} {tamanho:>3} semente={semente!s:>4} "
+                              f"{modo:<21} {medicao['status']:<19} "
+                              f"{medicao['tempo_mediano'] * 1000:10.2f} ms {memoria}")
+
+    return {
+        'versao': VERSAO_RELATORIO,
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'configuracao': {
+            'conjunto': conjunto,
+            'sementes': list(sementes),
+            'repeticoes': repeticoes,
+            'timeout': timeout,
+            'medir_memoria': medir_memoria,
+        },
+        'medicoes': medicoes,
+    }
+
+
+def _chave(medicao):
+    """Identifica uma medição entre relatórios diferentes."""
+    return (medicao['familia'], medicao['tamanho'], medicao['semente'], medicao['modo'])
+
+
+def comparar_relatorios(atual, base, tolerancia=TOLERANCIA_PADRAO):
+    """
+    Compara um relatório com uma base armazenada.
+
+    Uma medição regride quando o tempo mediano passa da base em mais que a
+    tolerância relativa, ou quando a resposta muda (status ou total de
+    caminhos). Tempos muito curtos nas duas medições são ignorados.
+
+    Args:
+        atual (dict): Relatório recém-gerado
+        base (dict): Relatório de referência
+        tolerancia (float): Aumento relativo de tempo aceito (0.25 = 25%)
+
+    Returns:
+        list: Descrição de cada regressão encontrada
+    """
+    anteriores = {_chave(medicao): medicao for medicao in base['medicoes']}
+    regressoes = []
+    for medicao in atual['medicoes']:
+        anterior = anteriores.get(_chave(medicao))
+        if anterior is None:
+            continue
+        nome = '/'.join(str(parte) for parte in _chave(medicao))
+        if (medicao['status'] != anterior['status']
+                or medicao.get('total') != anterior.get('total')):
+            regressoes.append(f"{nome}: resposta mudou de {anterior['status']} "
+                              f"para {medicao['status']}")
+            continue
+        tempo, tempo_base = medicao['tempo_mediano'], anterior['tempo_mediano']
+        if max(tempo, tempo_base) < TEMPO_MINIMO_COMPARACAO:
+            continue
+        if tempo > tempo_base * (1 + tolerancia):
+            regressoes.append(f"{nome}: {tempo_base * 1000:.2f} ms -> {tempo * 1000:.2f} ms "
+                              f"(+{(tempo / tempo_base - 1) * 100:.0f}%)")
+    return regressoes
+
+
+def main(argumentos=None):
+    """
+    Interface de linha de comando do benchmark.
+
+    Args:
+        argumentos (list, optional): Argumentos da linha de comando
+
+    Returns:
+        int: Código de saída (1 se houve regressão em relação à base)
+    """
+    parser = argparse.ArgumentParser(description="Benchmark dos motores de caminho hamiltoniano")
+    parser.add_argument('--conjunto', choices=sorted(CONJUNTOS), default='rapido')
+    parser.add_argument('--familias', nargs='+', choices=list(FAMILIAS))
+    parser.add_argument('--modos', nargs='+', choices=list(MODOS))
+    parser.add_argument('--sementes', nargs='+', type=int, default=[0, 1])
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--timeout', type=float, default=10.0,
+                        help="tempo máximo de cada execução, em segundos")
+    parser.add_argument('--sem-memoria', action='store_true',
+                        help="não mede o pico de memória (tracemalloc deixa a execução lenta)")
+    parser.add_argument('--saida', help="arquivo JSON do relatório")
+    parser.add_argument('--base', help="relatório de referência para comparação")
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA_PADRAO)
+    opcoes = parser.parse_args(argumentos)
+
+    relatorio = executar_benchmark(opcoes.conjunto, opcoes.familias, opcoes.modos,
+                                   tuple(opcoes.sementes), opcoes.repeticoes, opcoes.timeout,
+                                   not opcoes.sem_memoria)
+
+    if opcoes.saida:
+        with open(opcoes.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, indent=2)
+        print(f"\nRelatório salvo em: {opcoes.saida}")
+
+    if opcoes.base:
+        with open(opcoes.base, encoding='utf-8') as arquivo:
+            base = json.load(arquivo)
+        regressoes = comparar_relatorios(relatorio, base, opcoes.tolerancia)
+        if regressoes:
+            print(f"\n{len(regressoes)} regressão(ões) em relação a {opcoes.base}:")
+            for regressao in regressoes:
+                print(f"  - {regressao}")
+            return 1
+        print(f"\nNenhuma regressão em relação a {opcoes.base}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+"""
+Cache persistente de resultados de caminho hamiltoniano.
+
+Os resultados definitivos (caminho encontrado ou inexistência provada) são
+guardados em um banco SQLite local, indexados por uma impressão digital do
+grafo. Opcionalmente, a impressão digital é calculada sobre uma forma
+canônica obtida por refinamento de cores (Weisfeiler-Leman), de modo que
+grafos que diferem só pela numeração dos vértices costumam cair na mesma
+entrada.
+
+A forma canônica é sempre segura: a impressão digital é o hash da estrutura
+renumerada, então duas chaves iguais correspondem ao mesmo grafo renumerado
+e o caminho guardado vale para ambos. Quando o refinamento não distingue
+todos os vértices, os empates são decididos pelo índice original e grafos
+isomorfos podem ter chaves diferentes (perde-se o acerto, nunca a correção).
+
+Autor: Vinicius Xavier Ramalho
+Data: Outubro 2025
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from array import array
+
+from main import (CaminhoHamiltoniano, ResultadoBusca, caminho_valido,
+                  STATUS_ENCONTRADO, STATUS_IMPOSSIVEL)
+
+
+ARQUIVO_CACHE_PADRAO = 'cache_hamiltoniano.sqlite'
+MAX_ENTRADAS_PADRAO = 10000
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS resultados (
+    chave TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    caminho TEXT NOT NULL,
+    motivo TEXT,
+    acesso INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS resultados_acesso ON resultados (acesso);
+"""
+
+
+def _listas_de_adjacencia(grafo):
+    """Sucessores e predecessores (sem laços) de cada vértice."""
+    n = grafo.num_vertices
+    sucessores = [[w for w in grafo.obter_adjacentes(v) if w != v] for v in range(n)]
+    if not grafo.orientado:
+        return sucessores, sucessores
+    predecessores = [[] for _ in range(n)]
+    for origem in range(n):
+        for destino in sucessores[origem]:
+            predecessores[destino].append(origem)
+    return sucessores, predecessores
+
+
+def ordem_canonica(grafo):
+    """
+    Ordena os vértices pelo refinamento de cores de Weisfeiler-Leman.
+
+    Cada vértice começa com a cor (grau de saída, grau de entrada). A cada
+    rodada, a nova cor é a cor atual junto com as cores dos sucessores e dos
+    predecessores; as assinaturas são ordenadas para que a numeração das
+    cores não dependa da numeração dos vértices. O refinamento para quando o
+    número de cores deixa de crescer.
+
+    Args:
+        grafo (Grafo): Grafo a ser ordenado
+
+    Returns:
+        list: Vértices em ordem canônica (empates pelo índice original)
+    """
+    n = grafo.num_vertices
+    sucessores, predecessores = _listas_de_adjacencia(grafo)
+    cores = [(len(sucessores[v]), len(predecessores[v])) for v in range(n)]
+    num_cores = -1
+    while True:
+        distintas = sorted(set(cores))
+        if len(distintas) == num_cores or len(distintas) == n:
+            break
+        num_cores = len(distintas)
+        numeracao = {cor: indice for indice, cor in enumerate(distintas)}
+        cores = [numeracao[cor] for cor in cores]
+        cores = [(cores[v],
+                  tuple(sorted(cores[w] for w in sucessores[v])),
+                  tuple(sorted(cores[w] for w in predecessores[v])))
+                 for v in range(n)]
+    return sorted(range(n), key=lambda v: (cores[v], v))
+
+
+def impressao_digital(grafo, canonico=False):
+    """
+    Calcula a impressão digital SHA-256 da estrutura do grafo.
+
+    Args:
+        grafo (Grafo): Grafo a ser identificado
+        canonico (bool): Se True, renumera os vértices por ordem_canonica antes
+
+    Returns:
+        tuple: (str, list) - impressão digital em hexadecimal e a posição de
+               cada vértice na numeração usada (identidade se não canônico)
+    """
+    n = grafo.num_vertices
+    ordem = ordem_canonica(grafo) if canonico else list(range(n))
+    posicao = [0] * n
+    for indice, vertice in enumerate(ordem):
+        posicao[vertice] = indice
+
+    resumo = hashlib.sha256()
+    resumo.update(f"{n}:{int(grafo.orientado)}:".encode())
+    for vertice in ordem:
+        vizinhos = sorted(posicao[w] for w in grafo.obter_adjacentes(vertice))
+        resumo.update(array('q', [len(vizinhos)] + vizinhos).tobytes())
+    return resumo.hexdigest(), posicao
+
+
+class CacheResultados:
+    """
+    Cache de resultados em SQLite, com descarte do menos usado recentemente (LRU).
+
+    Attributes:
+        canonico (bool): Se as chaves usam a forma canônica sob renumeração
+        max_entradas (int): Número máximo de resultados guardados
+        acertos (int): Consultas respondidas pelo cache
+        falhas (int): Consultas que exigiram uma busca
+    """
+
+    def __init__(self, arquivo=ARQUIVO_CACHE_PADRAO, max_entradas=MAX_ENTRADAS_PADRAO,
+                 canonico=False):
+        """
+        Abre (ou cria) o banco do cache.
+
+        Args:
+            arquivo (str): Caminho do banco SQLite (':memory:' para um cache volátil)
+            max_entradas (int): Número máximo de resultados guardados
+            canonico (bool): Se deve identificar grafos a menos de renumeração
+        """
+        if max_entradas <= 0:
+            raise ValueError(f"Número máximo de entradas inválido: {max_entradas}")
+        self.canonico = canonico
+        self.max_entradas = max_entradas
+        self.acertos = 0
+        self.falhas = 0
+        self._conexao = sqlite3.connect(arquivo)
+        self._conexao.executescript(_ESQUEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def __len__(self):
+        return self._conexao.execute("SELECT COUNT(*) FROM resultados").fetchone()[0]
+
+    def fechar(self):
+        """
+        Fecha a conexão com o banco.
+        """
+        self._conexao.close()
+
+    def limpar(self):
+        """
+        Remove todos os resultados guardados.
+        """
+        with self._conexao:
+            self._conexao.execute("DELETE FROM resultados")
+
+    def _chave(self, grafo, vertice_inicial, vertice_final=None, ciclo=False):
+        """
+        Calcula a chave de uma consulta e a numeração usada.
+
+        Returns:
+            tuple: (str, list) - chave e posição de cada vértice na numeração
+        """
+        digital, posicao = impressao_digital(grafo, self.canonico)
+        opcoes = {
+            'vertice_inicial': None if vertice_inicial is None else posicao[vertice_inicial],
+        }
+        # Consultas sem as opções novas mantêm as chaves já guardadas
+        if vertice_final is not None:
+            opcoes['vertice_final'] = posicao[vertice_final]
+        if ciclo:
+            opcoes['ciclo'] = True
+        return f"{digital}:{json.dumps(opcoes, sort_keys=True)}", posicao
+
+    def obter(self, grafo, vertice_inicial=None, vertice_final=None, ciclo=False):
+        """
+        Consulta o cache sem executar busca.
+
+        Um caminho guardado só é devolvido depois de conferido no grafo; uma
+        entrada que não confere é descartada.
+
+        Args:
+            grafo (Grafo): Grafo consultado
+            vertice_inicial (int, optional): Vértice onde o caminho deve começar
+            vertice_final (int, optional): Vértice onde o caminho deve terminar
+            ciclo (bool): Se a consulta é por um ciclo hamiltoniano
+
+        Returns:
+            ResultadoBusca ou None: Resultado guardado, nos rótulos do grafo consultado
+        """
+        inicio = time.perf_counter()
+        chave, posicao = self._chave(grafo, vertice_inicial, vertice_final, ciclo)
+        linha = self._conexao.execute(
+            "SELECT status, caminho, motivo FROM resultados WHERE chave = ?", (chave,)).fetchone()
+        if linha is None:
+            return None
+
+        status, caminho, motivo = linha
+        # O caminho está guardado na numeração da chave; volta aos rótulos do grafo
+        vertice_na_posicao = [0] * len(posicao)
+        for vertice, indice in enumerate(posicao):
+            vertice_na_posicao[indice] = vertice
+        caminho = [vertice_na_posicao[indice] for indice in json.loads(caminho)]
+        if status == STATUS_ENCONTRADO and not caminho_valido(grafo, caminho, vertice_inicial,
+                                                              vertice_final, ciclo):
+            with self._conexao:
+                self._conexao.execute("DELETE FROM resultados WHERE chave = ?", (chave,))
+            return None
+
+        with self._conexao:
+            self._conexao.execute("UPDATE resultados SET acesso = ? WHERE chave = ?",
+                                  (time.time_ns(), chave))
+        return ResultadoBusca(status, caminho, motivo, caminho,
+                              tempo=time.perf_counter() - inicio)
+
+    def guardar(self, grafo, resultado, vertice_inicial=None, vertice_final=None, ciclo=False):
+        """
+        Guarda um resultado definitivo, descartando os menos usados se necessário.
+
+        Resultados com orçamento esgotado não são guardados: não provam nada.
+
+        Args:
+            grafo (Grafo): Grafo resolvido
+            resultado (ResultadoBusca): Resultado da busca
+            vertice_inicial (int, optional): Vértice inicial usado na busca
+            vertice_final (int, optional): Vértice final usado na busca
+            ciclo (bool): Se a busca foi por um ciclo hamiltoniano
+        """
+        if resultado.status not in (STATUS_ENCONTRADO, STATUS_IMPOSSIVEL):
+            return
+        chave, posicao = self._chave(grafo, vertice_inicial, vertice_final, ciclo)
+        caminho = [posicao[vertice] for vertice in resultado.caminho]
+        with self._conexao:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO resultados (chave, status, caminho, motivo, acesso) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (chave, resultado.status, json.dumps(caminho), resultado.motivo, time.time_ns()))
+            excesso = len(self) - self.max_entradas
+            if excesso > 0:
+                self._conexao.execute(
+                    "DELETE FROM resultados WHERE chave IN "
+                    "(SELECT chave FROM resultados ORDER BY acesso LIMIT ?)", (excesso,))
+
+    def resolver(self, grafo, vertice_inicial=None, timeout=None, max_nos=None,
+                 vertice_final=None, ciclo=False, **configuracao):
+        """
+        Responde pelo cache ou, se não houver entrada, busca e guarda o resultado.
+
+        Args:
+            grafo (Grafo): Grafo a resolver
+            vertice_inicial (int, optional): Vértice onde o caminho deve começar
+            timeout (float, optional): Tempo máximo da busca, em segundos
+            max_nos (int, optional): Número máximo de nós expandidos
+            vertice_final (int, optional): Vértice onde o caminho deve terminar
+            ciclo (bool): Se deve procurar um ciclo hamiltoniano
+            **configuracao: Argumentos repassados a CaminhoHamiltoniano (motor,
+                            ordenacao, podas, ...)
+
+        Returns:
+            ResultadoBusca: Resultado guardado ou recém-calculado
+        """
+        valido = all(vertice is None or 0 <= vertice < grafo.num_vertices
+                     for vertice in (vertice_inicial, vertice_final))
+        resultado = self.obter(grafo, vertice_inicial, vertice_final, ciclo) if valido else None
+        if resultado is not None:
+            self.acertos += 1
+            return resultado
+
+        self.falhas += 1
+        algoritmo = CaminhoHamiltoniano(grafo, **configuracao)
+        resultado = algoritmo.resolver(vertice_inicial, timeout=timeout, max_nos=max_nos,
+                                       vertice_final=vertice_final, ciclo=ciclo)
+        if valido:
+            self.guardar(grafo, resultado, vertice_inicial, vertice_final, ciclo)
+        return resultado
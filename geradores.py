@@ -0,0 +1,343 @@
+"""
+Geradores vetorizados de grafos aleatórios e estruturados.
+
+As arestas são produzidas como arrays NumPy e o grafo é montado de uma vez,
+sem uma chamada a adicionar_aresta por aresta. Com a classe GrafoEsparso
+(padrão), grafos com 10^5 vértices são gerados em frações de segundo; Grafo e
+GrafoBitset também são aceitos, mas guardam n² posições e só servem para
+grafos pequenos.
+
+Os geradores nunca imprimem nada: entradas inválidas geram ValueError.
+
+Autor: Vinicius Xavier Ramalho
+Data: Outubro 2025
+"""
+
+import numpy as np
+
+from main import Grafo, GrafoBitset, GrafoEsparso
+
+
+def _unicos(valores):
+    """
+    Valores distintos em ordem crescente.
+
+    Equivale a np.unique, mas ordena em vez de usar tabela de dispersão, o que
+    é bem mais rápido para milhões de inteiros.
+    """
+    valores = np.sort(valores)
+    if valores.size:
+        distintos = np.empty(valores.size, dtype=bool)
+        distintos[0] = True
+        np.not_equal(valores[1:], valores[:-1], out=distintos[1:])
+        valores = valores[distintos]
+    return valores
+
+
+def grafo_de_arestas(num_vertices, origens, destinos, orientado=False, classe=GrafoEsparso):
+    """
+    Monta um grafo a partir de arrays de origens e destinos.
+
+    Arestas repetidas são mescladas; em grafos não orientados, (u, v) e (v, u)
+    são a mesma aresta.
+
+    Args:
+        num_vertices (int): Número de vértices
+        origens (array): Vértice de origem de cada aresta
+        destinos (array): Vértice de destino de cada aresta
+        orientado (bool): True se o grafo for orientado
+        classe (type): Grafo, GrafoBitset ou GrafoEsparso
+
+    Returns:
+        Grafo: Instância de classe com as arestas dadas
+
+    Raises:
+        ValueError: Se alguma aresta usar um vértice inexistente
+    """
+    origens = np.asarray(origens, dtype=np.int64).ravel()
+    destinos = np.asarray(destinos, dtype=np.int64).ravel()
+    if origens.shape != destinos.shape:
+        raise ValueError("Origens e destinos devem ter o mesmo tamanho")
+    invalidas = (origens < 0) | (origens >= num_vertices) | (destinos < 0) | (destinos >= num_vertices)
+    if invalidas.any():
+        exemplos = list(zip(origens[invalidas][:5].tolist(), destinos[invalidas][:5].tolist()))
+        raise ValueError(f"{int(invalidas.sum())} aresta(s) com vértices inválidos: {exemplos}")
+
+    if not orientado:
+        origens, destinos = (np.concatenate((origens, destinos)),
+                             np.concatenate((destinos, origens)))
+
+    grafo = classe(num_vertices, orientado=orientado)
+    if issubclass(classe, GrafoEsparso):
+        # Ordena por (origem, destino) e descarta repetições
+        chaves = _unicos(origens * num_vertices + destinos)
+        origens, destinos = np.divmod(chaves, num_vertices)
+        fins = np.cumsum(np.bincount(origens, minlength=num_vertices)).tolist()
+        vizinhos = destinos.tolist()
+        inicio = 0
+        adjacencias = grafo.adjacencias
+        for vertice, fim in enumerate(fins):
+            adjacencias[vertice] = vizinhos[inicio:fim]
+            inicio = fim
+        return grafo
+
+    matriz = np.zeros((num_vertices, num_vertices), dtype=bool)
+    matriz[origens, destinos] = True
+    if issubclass(classe, GrafoBitset):
+        # Linha de bits empacotada em bytes; o bit j da linha vira o bit j do inteiro
+        pacotes = np.packbits(matriz, axis=1, bitorder='little')
+        grafo.linhas = [int.from_bytes(linha.tobytes(), 'little') for linha in pacotes]
+    elif issubclass(classe, Grafo):
+        grafo.matriz_adj = matriz.tolist()
+    else:
+        raise ValueError(f"Classe de grafo não suportada: {classe.__name__}")
+    return grafo
+
+
+def _pares_do_indice(indices, num_vertices, orientado):
+    """
+    Converte índices de pares ordenados em (origem, destino), sem laços.
+
+    Não orientado: o índice k percorre os pares i < j linha a linha, de
+    0 a n(n-1)/2 - 1. Orientado: percorre todos os pares i != j, de 0 a
+    n(n-1) - 1.
+    """
+    n = num_vertices
+    if orientado:
+        origens, resto = np.divmod(indices, n - 1)
+        destinos = resto + (resto >= origens)
+        return origens, destinos
+
+    # Linha i começa no índice i(2n - i - 1)/2; a estimativa em ponto
+    # flutuante é corrigida nos casos de arredondamento
+    b = 2 * n - 1
+    origens = ((b - np.sqrt(b * b - 8.0 * indices)) // 2).astype(np.int64)
+    inicio = origens * (b - origens) // 2
+    passou = indices < inicio
+    origens[passou] -= 1
+    inicio = origens * (b - origens) // 2
+    faltou = indices >= inicio + (n - 1 - origens)
+    origens[faltou] += 1
+    inicio = origens * (b - origens) // 2
+    destinos = indices - inicio + origens + 1
+    return origens, destinos
+
+
+def _amostrar_distintos(aleatorio, total, quantidade):
+    """
+    Sorteia quantidade inteiros distintos de [0, total) sem gerar a permutação.
+
+    Returns:
+        array: Inteiros distintos em ordem crescente
+    """
+    escolhidos = np.empty(0, dtype=np.int64)
+    while escolhidos.size < quantidade:
+        falta = quantidade - escolhidos.size
+        extra = aleatorio.integers(0, total, size=falta + falta // 10 + 16)
+        escolhidos = _unicos(np.concatenate((escolhidos, extra)))
+    if escolhidos.size > quantidade:
+        escolhidos = np.sort(aleatorio.choice(escolhidos, quantidade, replace=False))
+    return escolhidos
+
+
+def erdos_renyi(num_vertices, p, semente=None, orientado=False, classe=GrafoEsparso):
+    """
+    Grafo aleatório G(n, p): cada par de vértices é ligado com probabilidade p.
+
+    O número de arestas é sorteado de uma binomial e os pares são sorteados
+    diretamente pelo índice, em tempo proporcional ao número de arestas.
+
+    Args:
+        num_vertices (int): Número de vértices
+        p (float): Probabilidade de cada aresta
+        semente (int, optional): Semente do gerador aleatório
+        orientado (bool): Se True, cada par ordenado (u, v) é sorteado à parte
+        classe (type): Classe do grafo gerado
+
+    Returns:
+        Grafo: Grafo gerado
+    """
+    if not 0 <= p <= 1:
+        raise ValueError(f"Probabilidade inválida: {p}")
+    aleatorio = np.random.default_rng(semente)
+    n = num_vertices
+    total = n * (n - 1) if orientado else n * (n - 1) // 2
+    quantidade = int(aleatorio.binomial(total, p)) if total else 0
+    indices = _amostrar_distintos(aleatorio, total, quantidade)
+    origens, destinos = _pares_do_indice(indices, n, orientado)
+    return grafo_de_arestas(n, origens, destinos, orientado, classe)
+
+
+def regular_aleatorio(num_vertices, grau, semente=None, tentativas=100, classe=GrafoEsparso):
+    """
+    Grafo d-regular aleatório pelo modelo de configuração.
+
+    Cada vértice recebe grau "pontas", que são embaralhadas e ligadas duas a
+    duas. Laços e arestas repetidas são desfeitos reembaralhando suas pontas
+    junto com um número igual de arestas válidas sorteadas, até não restar
+    nenhum (a distribuição resultante é aproximadamente uniforme).
+
+    Args:
+        num_vertices (int): Número de vértices
+        grau (int): Grau de todos os vértices
+        semente (int, optional): Semente do gerador aleatório
+        tentativas (int): Rodadas de correção antes de desistir
+        classe (type): Classe do grafo gerado
+
+    Returns:
+        Grafo: Grafo não orientado gerado
+
+    Raises:
+        ValueError: Se n·d for ímpar, d >= n ou as correções não convergirem
+    """
+    n = num_vertices
+    if grau < 0 or (grau >= n and n > 0) or n * grau % 2:
+        raise ValueError(f"Não existe grafo {grau}-regular com {n} vértices")
+    aleatorio = np.random.default_rng(semente)
+    pontas = np.repeat(np.arange(n, dtype=np.int64), grau)
+    aleatorio.shuffle(pontas)
+    pares = pontas.reshape(-1, 2)
+
+    for _ in range(tentativas):
+        menores = pares.min(axis=1)
+        maiores = pares.max(axis=1)
+        chaves = menores * n + maiores
+        # Ruins: laços e todas as cópias, exceto a primeira, de arestas repetidas
+        ordem = np.argsort(chaves, kind='stable')
+        ruins = np.zeros(len(pares), dtype=bool)
+        ruins[ordem[1:]] = chaves[ordem[1:]] == chaves[ordem[:-1]]
+        ruins |= menores == maiores
+        if not ruins.any():
+            return grafo_de_arestas(n, pares[:, 0], pares[:, 1], False, classe)
+        boas = np.flatnonzero(~ruins)
+        sorteadas = aleatorio.choice(boas, min(len(boas), int(ruins.sum())), replace=False)
+        refazer = np.concatenate((np.flatnonzero(ruins), sorteadas))
+        soltas = pares[refazer].ravel()
+        aleatorio.shuffle(soltas)
+        pares[refazer] = soltas.reshape(-1, 2)
+
+    raise ValueError(f"O modelo de configuração não convergiu em {tentativas} tentativas")
+
+
+def grade(linhas, colunas, toroidal=False, classe=GrafoEsparso):
+    """
+    Grade linhas x colunas; o vértice (l, c) é l·colunas + c.
+
+    Args:
+        linhas (int): Número de linhas
+        colunas (int): Número de colunas
+        toroidal (bool): Se True, liga as bordas opostas (toro)
+        classe (type): Classe do grafo gerado
+
+    Returns:
+        Grafo: Grafo não orientado gerado
+    """
+    indices = np.arange(linhas * colunas, dtype=np.int64).reshape(linhas, colunas)
+    if toroidal:
+        origens = np.concatenate((indices.ravel(), indices.ravel()))
+        destinos = np.concatenate((np.roll(indices, -1, axis=1).ravel(),
+                                   np.roll(indices, -1, axis=0).ravel()))
+        # Com uma única linha ou coluna, a volta seria um laço
+        sem_laco = origens != destinos
+        origens, destinos = origens[sem_laco], destinos[sem_laco]
+    else:
+        origens = np.concatenate((indices[:, :-1].ravel(), indices[:-1, :].ravel()))
+        destinos = np.concatenate((indices[:, 1:].ravel(), indices[1:, :].ravel()))
+    return grafo_de_arestas(linhas * colunas, origens, destinos, False, classe)
+
+
+def cavalo(linhas, colunas=None, classe=GrafoEsparso):
+    """
+    Grafo dos movimentos do cavalo em um tabuleiro linhas x colunas.
+
+    Args:
+        linhas (int): Número de linhas do tabuleiro
+        colunas (int, optional): Número de colunas (padrão: igual a linhas)
+        classe (type): Classe do grafo gerado
+
+    Returns:
+        Grafo: Grafo não orientado gerado
+    """
+    colunas = linhas if colunas is None else colunas
+    linha, coluna = np.divmod(np.arange(linhas * colunas, dtype=np.int64), colunas)
+    origens, destinos = [], []
+    # Metade dos movimentos basta: o grafo é não orientado
+    for dl, dc in ((1, 2), (2, 1), (1, -2), (2, -1)):
+        destino_linha, destino_coluna = linha + dl, coluna + dc
+        validos = ((destino_linha < linhas) & (destino_coluna >= 0)
+                   & (destino_coluna < colunas))
+        origens.append((linha * colunas + coluna)[validos])
+        destinos.append((destino_linha * colunas + destino_coluna)[validos])
+    return grafo_de_arestas(linhas * colunas, np.concatenate(origens),
+                            np.concatenate(destinos), False, classe)
+
+
+def caminho_plantado(num_vertices, p, semente=None, orientado=False, classe=GrafoEsparso):
+    """
+    Grafo G(n, p) com um caminho hamiltoniano aleatório plantado.
+
+    Útil para testar os motores em instâncias grandes com resposta conhecida.
+
+    Args:
+        num_vertices (int): Número de vértices
+        p (float): Probabilidade de cada aresta de ruído
+        semente (int, optional): Semente do gerador aleatório
+        orientado (bool): True se o grafo for orientado
+        classe (type): Classe do grafo gerado
+
+    Returns:
+        tuple: (Grafo, list) - grafo gerado e o caminho plantado
+    """
+    if not 0 <= p <= 1:
+        raise ValueError(f"Probabilidade inválida: {p}")
+    aleatorio = np.random.default_rng(semente)
+    n = num_vertices
+    caminho = aleatorio.permutation(n)
+    total = n * (n - 1) if orientado else n * (n - 1) // 2
+    quantidade = int(aleatorio.binomial(total, p)) if total else 0
+    origens, destinos = _pares_do_indice(_amostrar_distintos(aleatorio, total, quantidade),
+                                         n, orientado)
+    grafo = grafo_de_arestas(n, np.concatenate((caminho[:-1], origens)),
+                             np.concatenate((caminho[1:], destinos)), orientado, classe)
+    return grafo, caminho.tolist()
+
+
+def torneio(num_vertices, semente=None, classe=GrafoEsparso):
+    """
+    Torneio aleatório: cada par de vértices recebe um único arco, de sentido sorteado.
+
+    Todo torneio tem caminho hamiltoniano (teorema de Rédei).
+
+    Args:
+        num_vertices (int): Número de vértices
+        semente (int, optional): Semente do gerador aleatório
+        classe (type): Classe do grafo gerado
+
+    Returns:
+        Grafo: Grafo orientado gerado
+    """
+    aleatorio = np.random.default_rng(semente)
+    origens, destinos = np.triu_indices(num_vertices, k=1)
+    inverter = aleatorio.random(origens.size) < 0.5
+    origens, destinos = (np.where(inverter, destinos, origens),
+                         np.where(inverter, origens, destinos))
+    return grafo_de_arestas(num_vertices, origens, destinos, True, classe)
+
+
+def completo(num_vertices, orientado=False, classe=GrafoEsparso):
+    """
+    Grafo completo, sem laços.
+
+    Args:
+        num_vertices (int): Número de vértices
+        orientado (bool): True se o grafo for orientado (arcos nos dois sentidos)
+        classe (type): Classe do grafo gerado
+
+    Returns:
+        Grafo: Grafo gerado
+    """
+    origens, destinos = np.triu_indices(num_vertices, k=1)
+    if orientado:
+        origens, destinos = (np.concatenate((origens, destinos)),
+                             np.concatenate((destinos, origens)))
+    return grafo_de_arestas(num_vertices, origens, destinos, orientado, classe)
@@ -0,0 +1,426 @@
+"""
+Leitura e gravação de grafos em arquivo.
+
+Leitores em fluxo para listas de arestas em texto, arquivos DIMACS e
+arquivos HCP da TSPLIB: o texto é lido em blocos e convertido em arrays de
+inteiros pelo NumPy, sem manter o arquivo inteiro na memória. As arestas são
+inseridas de uma vez por adicionar_arestas.
+
+Também define um formato binário compacto (cabeçalho seguido das arestas
+empacotadas ou das linhas da matriz em bits), que é mapeado em memória e
+convertido em grafo sem interpretar aresta por aresta.
+
+Autor: Vinicius Xavier Ramalho
+Data: Outubro 2025
+"""
+
+import mmap
+import struct
+import warnings
+from itertools import chain
+
+import numpy as np
+
+from main import Grafo, GrafoBitset, GrafoEsparso
+
+
+# Caracteres lidos por vez na lista de arestas e linhas por vez nos demais leitores
+TAMANHO_BLOCO = 1 << 24
+TAMANHO_LOTE = 1 << 16
+
+# Formato binário: assinatura, versão, opções, reservado, vértices e arestas
+ASSINATURA_BINARIA = b'HAMG'
+VERSAO_BINARIA = 1
+CABECALHO_BINARIO = struct.Struct('<4sBBHqq')
+OPCAO_ORIENTADO = 1
+OPCAO_BITSET = 2
+
+FORMATO_ARESTAS = 'arestas'
+FORMATO_BITSET = 'bitset'
+FORMATOS_BINARIOS = (FORMATO_ARESTAS, FORMATO_BITSET)
+
+# Bytes que separam os números de uma lista de arestas (indexado pelo byte)
+_SEPARADORES = np.zeros(256, dtype=bool)
+_SEPARADORES[list(b' \t\r\n')] = True
+
+
+def _inteiros(texto):
+    """
+    Converte um trecho de texto com inteiros separados por espaços em array.
+
+    np.fromstring faz a conversão em C, várias vezes mais rápido que
+    converter cada palavra em Python.
+    """
+    if not texto or texto.isspace():
+        return np.empty(0, dtype=np.int64)
+    with warnings.catch_warnings():
+        # Texto que não é só inteiros gera um aviso de leitura incompleta
+        warnings.simplefilter('error')
+        try:
+            return np.fromstring(texto, dtype=np.int64, sep=' ')
+        except (DeprecationWarning, ValueError):
+            raise ValueError(f"Valor não inteiro no trecho: {texto.strip()[:80]!r}") from None
+
+
+def _pares(numeros, base):
+    """Agrupa números em pares (origem, destino) e ajusta a numeração."""
+    if numeros.size % 2:
+        raise ValueError("Número ímpar de vértices na lista de arestas")
+    return numeros.reshape(-1, 2) - base
+
+
+def _arestas_por_linha(texto, base, primeira_linha, ignorar_pesos=False):
+    """
+    Converte um trecho da lista de arestas, conferindo as colunas de cada linha.
+
+    Os números são convertidos de uma vez por _inteiros; em seguida, os
+    inícios de palavra são localizados nos bytes do trecho e contados por
+    linha, sem percorrer as linhas em Python. Linhas vazias são aceitas.
+
+    Args:
+        texto (str): Trecho com linhas completas (vírgulas já trocadas por espaços)
+        base (int): Número do primeiro vértice no arquivo
+        primeira_linha (int): Número, no arquivo, da primeira linha do trecho
+        ignorar_pesos (bool): Se aceita uma terceira coluna (peso) e a descarta
+
+    Returns:
+        numpy.ndarray: Arestas (E, 2) com a numeração ajustada
+
+    Raises:
+        ValueError: Se alguma linha não tiver duas colunas (ou três, com pesos)
+    """
+    numeros = _inteiros(texto)
+    if not numeros.size:
+        return numeros.reshape(0, 2)
+
+    dados = np.frombuffer(texto.encode('utf-8'), dtype=np.uint8)
+    separador = _SEPARADORES[dados]
+    inicio = ~separador
+    inicio[1:] &= separador[:-1]
+    # Linha (relativa ao trecho) de cada número: quebras de linha antes dele
+    linhas = np.searchsorted(np.flatnonzero(dados == ord('\n')), np.flatnonzero(inicio))
+    if linhas.size != numeros.size:
+        raise ValueError(f"Linhas mal formadas a partir da linha {primeira_linha}")
+    contagem = np.bincount(linhas)
+    aceitas = (contagem == 0) | (contagem == 2)
+    if ignorar_pesos:
+        aceitas |= contagem == 3
+    if not aceitas.all():
+        linha = int(np.argmin(aceitas))
+        raise ValueError(f"Linha {primeira_linha + linha}: {contagem[linha]} colunas "
+                         f"(esperado 'origem destino'"
+                         f"{' [peso]' if ignorar_pesos else ''})")
+
+    if ignorar_pesos and numeros.size != 2 * np.count_nonzero(contagem):
+        # Coluna de cada número dentro da sua linha; a terceira é o peso
+        coluna = np.arange(numeros.size) - (np.cumsum(contagem) - contagem)[linhas]
+        numeros = numeros[coluna < 2]
+    return numeros.reshape(-1, 2) - base
+
+
+def _montar(num_vertices, lotes, orientado, classe):
+    """Cria o grafo e insere todos os lotes de arestas de uma vez."""
+    grafo = classe(num_vertices, orientado=orientado)
+    if lotes:
+        grafo.adicionar_arestas(np.concatenate(lotes))
+    return grafo
+
+
+def ler_lista_arestas(caminho, num_vertices=None, orientado=False, base=0,
+                      classe=GrafoEsparso, tamanho_bloco=TAMANHO_BLOCO, ignorar_pesos=False):
+    """
+    Lê um arquivo com uma aresta "origem destino" por linha.
+
+    Os vértices podem ser separados por espaços, tabulações ou vírgulas.
+    Linhas vazias e linhas iniciadas por '#' ou '%' são ignoradas. Cada
+    linha precisa ter exatamente duas colunas: listas com pesos
+    ("origem destino peso") só são aceitas com ignorar_pesos=True, que
+    descarta a terceira coluna.
+
+    Args:
+        caminho (str): Caminho do arquivo
+        num_vertices (int, optional): Número de vértices (padrão: maior
+                                      vértice encontrado mais um)
+        orientado (bool): True se o grafo for orientado
+        base (int): Número do primeiro vértice no arquivo (0 ou 1)
+        classe (type): Classe do grafo criado
+        tamanho_bloco (int): Caracteres lidos por vez
+        ignorar_pesos (bool): Se aceita uma terceira coluna de peso e a descarta
+
+    Returns:
+        Grafo: Grafo lido
+
+    Raises:
+        ValueError: Se o arquivo tiver linhas mal formadas (com o número da
+                    linha) ou vértices inválidos
+    """
+    lotes = []
+    resto = ''
+    primeira_linha = 1
+    with open(caminho, encoding='utf-8') as arquivo:
+        while True:
+            bloco = arquivo.read(tamanho_bloco)
+            texto = resto + bloco
+            if bloco:
+                # A última linha pode estar incompleta: fica para o próximo bloco
+                corte = texto.rfind('\n') + 1
+                texto, resto = texto[:corte], texto[corte:]
+            if '#' in texto or '%' in texto:
+                # Comentários viram linhas vazias, preservando a numeração das linhas
+                texto = ''.join('\n' if linha.lstrip().startswith(('#', '%')) else linha
+                                for linha in texto.splitlines(True))
+            lotes.append(_arestas_por_linha(texto.replace(',', ' '), base, primeira_linha,
+                                            ignorar_pesos))
+            primeira_linha += texto.count('\n')
+            if not bloco:
+                break
+
+    if num_vertices is None:
+        num_vertices = max((int(lote.max()) + 1 for lote in lotes if lote.size), default=0)
+    return _montar(num_vertices, lotes, orientado, classe)
+
+
+def ler_dimacs(caminho, classe=GrafoEsparso, tamanho_lote=TAMANHO_LOTE):
+    """
+    Lê um grafo no formato DIMACS.
+
+    Reconhece a linha de problema "p <tipo> <vértices> <arestas>", arestas
+    não orientadas "e u v" e arcos "a u v [peso]" (o peso é ignorado). O grafo
+    é orientado se houver arcos ou se o tipo não for 'edge' nem 'col' (por
+    exemplo, 'sp'). Comentários começam com 'c'. Os vértices são numerados a
+    partir de 1.
+
+    Args:
+        caminho (str): Caminho do arquivo
+        classe (type): Classe do grafo criado
+        tamanho_lote (int): Linhas convertidas por vez
+
+    Returns:
+        Grafo: Grafo lido
+
+    Raises:
+        ValueError: Se faltar a linha de problema, houver linhas desconhecidas
+                    ou alguma aresta não tiver duas colunas (ou três, em arcos)
+    """
+    num_vertices = None
+    orientado = False
+    lotes = []
+    linhas = []
+    with open(caminho, encoding='utf-8') as arquivo:
+        for numero, linha in enumerate(arquivo, start=1):
+            tipo = linha[:1]
+            if tipo in ('e', 'a'):
+                orientado = orientado or tipo == 'a'
+                campos = linha.split()
+                if not 3 <= len(campos) <= (4 if tipo == 'a' else 3):
+                    raise ValueError(f"Linha {numero}: {len(campos) - 1} colunas após '{tipo}' "
+                                     f"(esperado 'origem destino'"
+                                     f"{' [peso]' if tipo == 'a' else ''})")
+                # Só origem e destino: pesos de arcos são descartados
+                linhas.append(campos[1] + ' ' + campos[2])
+                if len(linhas) == tamanho_lote:
+                    lotes.append(_pares(_inteiros(' '.join(linhas)), 1))
+                    linhas = []
+            elif tipo == 'p':
+                campos = linha.split()
+                if len(campos) < 4:
+                    raise ValueError(f"Linha {numero}: linha de problema incompleta")
+                num_vertices = int(campos[2])
+                # Os problemas de coloração usam arestas; os de caminhos e fluxos, arcos
+                orientado = orientado or campos[1].lower() not in ('edge', 'col')
+            elif tipo not in ('c', '\n', ''):
+                raise ValueError(f"Linha {numero}: tipo de linha DIMACS desconhecido: {linha.strip()!r}")
+    lotes.append(_pares(_inteiros(' '.join(linhas)), 1))
+
+    if num_vertices is None:
+        raise ValueError("Arquivo DIMACS sem linha de problema ('p')")
+    return _montar(num_vertices, lotes, orientado, classe)
+
+
+def ler_hcp(caminho, classe=GrafoEsparso, tamanho_lote=TAMANHO_LOTE):
+    """
+    Lê uma instância HCP (Hamiltonian Cycle Problem) da TSPLIB.
+
+    O cabeçalho deve informar DIMENSION; a seção EDGE_DATA_SECTION pode
+    estar nos formatos EDGE_LIST (pares terminados por -1) ou ADJ_LIST
+    (vértice seguido dos vizinhos e de -1, com um -1 final). Os vértices são
+    numerados a partir de 1.
+
+    Args:
+        caminho (str): Caminho do arquivo
+        classe (type): Classe do grafo criado (não orientado)
+        tamanho_lote (int): Linhas convertidas por vez
+
+    Returns:
+        Grafo: Grafo lido
+
+    Raises:
+        ValueError: Se faltar DIMENSION ou a seção de arestas
+    """
+    cabecalho = {}
+    numeros = []
+    linhas = []
+    na_secao = False
+    with open(caminho, encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            conteudo = linha.strip()
+            if not na_secao:
+                if conteudo == 'EDGE_DATA_SECTION':
+                    na_secao = True
+                elif ':' in conteudo:
+                    chave, valor = conteudo.split(':', 1)
+                    cabecalho[chave.strip().upper()] = valor.strip()
+                continue
+            if conteudo == 'EOF':
+                break
+            linhas.append(conteudo)
+            if len(linhas) == tamanho_lote:
+                numeros.append(_inteiros(' '.join(linhas)))
+                linhas = []
+    numeros.append(_inteiros(' '.join(linhas)))
+
+    if 'DIMENSION' not in cabecalho:
+        raise ValueError("Arquivo HCP sem DIMENSION")
+    if not na_secao:
+        raise ValueError("Arquivo HCP sem EDGE_DATA_SECTION")
+    num_vertices = int(cabecalho['DIMENSION'])
+    numeros = np.concatenate(numeros)
+    fins = np.flatnonzero(numeros == -1)
+
+    if cabecalho.get('EDGE_DATA_FORMAT', 'EDGE_LIST').upper() == 'ADJ_LIST':
+        # Cada lista "v w1 w2 ... -1" vira as arestas (v, w1), (v, w2), ...
+        inicios = np.concatenate(([0], fins[:-1] + 1))
+        listas = [(inicio, fim) for inicio, fim in zip(inicios.tolist(), fins.tolist()) if fim > inicio]
+        origens = np.repeat([numeros[inicio] for inicio, _ in listas],
+                            [fim - inicio - 1 for inicio, fim in listas]).astype(np.int64)
+        destinos = np.concatenate([numeros[inicio + 1:fim] for inicio, fim in listas] or
+                                  [np.empty(0, dtype=np.int64)])
+        arestas = np.column_stack((origens, destinos)) - 1
+    else:
+        fim = fins[0] if fins.size else numeros.size
+        arestas = _pares(numeros[:fim], 1)
+    return _montar(num_vertices, [arestas], False, classe)
+
+
+def _arestas_do_grafo(grafo):
+    """
+    Extrai as arestas de um grafo como array (E, 2).
+
+    Em grafos não orientados, cada aresta aparece uma única vez (origem <= destino).
+    """
+    n = grafo.num_vertices
+    listas = [grafo.obter_adjacentes(v) for v in range(n)]
+    origens = np.repeat(np.arange(n, dtype=np.int64), [len(lista) for lista in listas])
+    destinos = np.fromiter(chain.from_iterable(listas), dtype=np.int64, count=origens.size)
+    arestas = np.column_stack((origens, destinos))
+    if not grafo.orientado:
+        arestas = arestas[origens <= destinos]
+    return arestas
+
+
+def salvar_binario(grafo, caminho, formato=FORMATO_ARESTAS):
+    """
+    Grava o grafo no formato binário.
+
+    O formato 'arestas' guarda pares de inteiros de 32 bits e é o indicado
+    para grafos esparsos; 'bitset' guarda a matriz de adjacência com um bit
+    por posição (n²/8 bytes), indicado para grafos densos.
+
+    Args:
+        grafo (Grafo): Grafo a ser gravado
+        caminho (str): Caminho do arquivo
+        formato (str): 'arestas' ou 'bitset'
+    """
+    if formato not in FORMATOS_BINARIOS:
+        raise ValueError(f"Formato desconhecido: {formato} (opções: {', '.join(FORMATOS_BINARIOS)})")
+    n = grafo.num_vertices
+    opcoes = OPCAO_ORIENTADO if grafo.orientado else 0
+
+    if formato == FORMATO_BITSET:
+        opcoes |= OPCAO_BITSET
+        bytes_por_linha = (n + 7) // 8
+        if isinstance(grafo, GrafoBitset):
+            dados = b''.join(linha.to_bytes(bytes_por_linha, 'little') for linha in grafo.linhas)
+        else:
+            matriz = np.zeros((n, n), dtype=bool)
+            arestas = _arestas_do_grafo(grafo)
+            matriz[arestas[:, 0], arestas[:, 1]] = True
+            if not grafo.orientado:
+                matriz[arestas[:, 1], arestas[:, 0]] = True
+            dados = np.packbits(matriz, axis=1, bitorder='little').tobytes()
+        num_arestas = len(_arestas_do_grafo(grafo))
+    else:
+        arestas = _arestas_do_grafo(grafo)
+        dados = arestas.astype('<i4').tobytes()
+        num_arestas = len(arestas)
+
+    with open(caminho, 'wb') as arquivo:
+        arquivo.write(CABECALHO_BINARIO.pack(ASSINATURA_BINARIA, VERSAO_BINARIA,
+                                             opcoes, 0, n, num_arestas))
+        arquivo.write(dados)
+
+
+def carregar_binario(caminho, classe=None):
+    """
+    Carrega um grafo gravado por salvar_binario.
+
+    O arquivo é mapeado em memória e lido como array NumPy, sem conversão
+    aresta por aresta.
+
+    Args:
+        caminho (str): Caminho do arquivo
+        classe (type, optional): Classe do grafo criado (padrão: GrafoBitset
+                                 para o formato bitset, GrafoEsparso para arestas)
+
+    Returns:
+        Grafo: Grafo carregado
+
+    Raises:
+        ValueError: Se o arquivo não estiver no formato binário esperado
+    """
+    with open(caminho, 'rb') as arquivo, \
+            mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        if len(mapa) < CABECALHO_BINARIO.size:
+            raise ValueError(f"Arquivo binário truncado: {caminho}")
+        assinatura, versao, opcoes, _, n, num_arestas = CABECALHO_BINARIO.unpack_from(mapa)
+        if assinatura != ASSINATURA_BINARIA or versao != VERSAO_BINARIA:
+            raise ValueError(f"Arquivo não está no formato binário de grafos: {caminho}")
+        orientado = bool(opcoes & OPCAO_ORIENTADO)
+        bitset = bool(opcoes & OPCAO_BITSET)
+        inicio = CABECALHO_BINARIO.size
+
+        if bitset:
+            bytes_por_linha = (n + 7) // 8
+            tamanho = n * bytes_por_linha
+        else:
+            tamanho = num_arestas * 8
+        if len(mapa) < inicio + tamanho:
+            raise ValueError(f"Arquivo binário truncado: {caminho}")
+        dados = memoryview(mapa)[inicio:inicio + tamanho]
+        try:
+            if bitset:
+                return _grafo_de_bitset(dados, n, bytes_por_linha, orientado,
+                                        classe or GrafoBitset)
+            # A cópia em int64 não guarda referência ao mapa, que pode ser fechado
+            arestas = np.frombuffer(dados, dtype='<i4').astype(np.int64).reshape(-1, 2)
+            return _montar(n, [arestas], orientado, classe or GrafoEsparso)
+        finally:
+            dados.release()
+
+
+def _grafo_de_bitset(dados, num_vertices, bytes_por_linha, orientado, classe):
+    """Cria o grafo a partir das linhas da matriz de adjacência empacotadas em bits."""
+    grafo = classe(num_vertices, orientado=orientado)
+    if issubclass(classe, GrafoBitset):
+        # Cada linha já é a máscara de vizinhos em little-endian
+        grafo.linhas = [int.from_bytes(dados[i * bytes_por_linha:(i + 1) * bytes_por_linha], 'little')
+                        for i in range(num_vertices)]
+        return grafo
+
+    pacotes = np.frombuffer(dados, dtype=np.uint8).reshape(num_vertices, bytes_por_linha)
+    matriz = np.unpackbits(pacotes, axis=1, count=num_vertices, bitorder='little').astype(bool)
+    if issubclass(classe, GrafoEsparso):
+        grafo.adicionar_arestas(np.argwhere(matriz))
+    elif issubclass(classe, Grafo):
+        grafo.matriz_adj = matriz.tolist()
+    return grafo
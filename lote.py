@@ -0,0 +1,364 @@
+"""
+Resolução em lote de caminhos hamiltonianos com saída JSONL.
+
+Cada grafo é descrito por uma linha JSON, por exemplo:
+
+    {"id": "g1", "num_vertices": 4, "orientado": false,
+     "arestas": [[0, 1], [1, 2], [2, 3]], "vertice_inicial": 0}
+
+ou, para grafos guardados em arquivo (formatos de leitores.py):
+
+    {"id": "g2", "arquivo": "grafo.col", "formato": "dimacs"}
+
+Campos opcionais por grafo: "vertice_inicial", "vertice_final", "ciclo",
+"timeout", "max_nos" e "representacao" ('matriz', 'bitset' ou 'esparso',
+padrão). Para cada grafo é produzida uma linha JSON com o identificador, a
+posição na entrada e os campos de ResultadoBusca (situação, caminho, tempo,
+estatísticas). Descrições inválidas e falhas durante a busca geram uma
+linha com status 'erro', sem interromper o lote.
+
+A entrada é consumida aos poucos e o número de grafos em andamento é
+limitado, de modo que a memória não cresce com o tamanho do lote. Nada é
+impresso nem visualizado durante a resolução.
+
+Autor: Vinicius Xavier Ramalho
+Data: Outubro 2025
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from main import (CaminhoHamiltoniano, Grafo, GrafoBitset, GrafoEsparso,
+                  MOTORES, ORDENACOES, PODAS)
+
+
+_log = logging.getLogger(__name__)
+
+# Situação das descrições que não puderam ser resolvidas
+STATUS_ERRO = 'erro'
+
+REPRESENTACOES = {
+    'matriz': Grafo,
+    'bitset': GrafoBitset,
+    'esparso': GrafoEsparso,
+}
+
+# Formatos aceitos no campo "arquivo" e a função de leitura correspondente
+FORMATOS_ARQUIVO = ('arestas', 'dimacs', 'hcp', 'binario')
+
+# Grafos em andamento por processo trabalhador (inclui os já resolvidos que
+# aguardam sua vez na saída ordenada)
+PENDENTES_POR_TRABALHADOR = 2
+
+
+def _ler_arquivo(descricao, classe):
+    """
+    Lê o grafo do arquivo indicado na descrição.
+
+    Os leitores dependem do NumPy e só são importados quando necessários.
+    """
+    import leitores
+
+    formato = descricao.get('formato', 'arestas')
+    caminho = descricao['arquivo']
+    if formato == 'arestas':
+        return leitores.ler_lista_arestas(caminho, descricao.get('num_vertices'),
+                                          descricao.get('orientado', False),
+                                          descricao.get('base', 0), classe,
+                                          ignorar_pesos=descricao.get('ignorar_pesos', False))
+    if formato == 'dimacs':
+        return leitores.ler_dimacs(caminho, classe)
+    if formato == 'hcp':
+        return leitores.ler_hcp(caminho, classe)
+    if formato == 'binario':
+        return leitores.carregar_binario(caminho, classe)
+    raise ValueError(f"Formato desconhecido: {formato} (opções: {', '.join(FORMATOS_ARQUIVO)})")
+
+
+def montar_grafo(descricao):
+    """
+    Constrói o grafo de uma descrição do lote.
+
+    Args:
+        descricao (dict): Descrição com "num_vertices" e "arestas" ou com "arquivo"
+
+    Returns:
+        Grafo: Grafo descrito
+
+    Raises:
+        ValueError: Se a descrição estiver incompleta ou usar vértices inexistentes
+    """
+    representacao = descricao.get('representacao', 'esparso')
+    if representacao not in REPRESENTACOES:
+        raise ValueError(f"Representação desconhecida: {representacao} "
+                         f"(opções: {', '.join(REPRESENTACOES)})")
+    classe = REPRESENTACOES[representacao]
+    if 'arquivo' in descricao:
+        return _ler_arquivo(descricao, classe)
+
+    if 'num_vertices' not in descricao:
+        raise ValueError("A descrição deve ter 'num_vertices' e 'arestas' ou 'arquivo'")
+    num_vertices = descricao['num_vertices']
+    if not isinstance(num_vertices, int) or num_vertices < 0:
+        raise ValueError(f"Número de vértices inválido: {num_vertices!r}")
+    grafo = classe(num_vertices, orientado=bool(descricao.get('orientado', False)))
+    grafo.adicionar_arestas(descricao.get('arestas', []))
+    return grafo
+
+
+def resolver_descricao(indice, descricao, configuracao=None, timeout=None, max_nos=None):
+    """
+    Resolve um grafo do lote e monta sua linha de saída.
+
+    Nunca levanta exceções: qualquer falha (descrição inválida ou erro
+    inesperado durante a busca) vira uma linha com status 'erro' e a
+    mensagem correspondente.
+
+    Args:
+        indice (int): Posição do grafo na entrada
+        descricao (dict ou str): Descrição do grafo (ou a linha JSON com ela)
+        configuracao (dict, optional): Argumentos nomeados para CaminhoHamiltoniano
+        timeout (float, optional): Tempo máximo padrão da busca, em segundos
+        max_nos (int, optional): Número máximo padrão de nós expandidos
+
+    Returns:
+        dict: Linha de saída, serializável em JSON
+    """
+    linha = {'indice': indice, 'id': indice}
+    try:
+        if isinstance(descricao, str):
+            descricao = json.loads(descricao)
+        if not isinstance(descricao, dict):
+            raise ValueError("Cada descrição deve ser um objeto JSON")
+        linha['id'] = descricao.get('id', indice)
+
+        grafo = montar_grafo(descricao)
+        vertice_inicial = descricao.get('vertice_inicial')
+        vertice_final = descricao.get('vertice_final')
+        for nome, vertice in (('inicial', vertice_inicial), ('final', vertice_final)):
+            if vertice is not None and not 0 <= vertice < grafo.num_vertices:
+                raise ValueError(f"Vértice {nome} inválido ({vertice})")
+
+        algoritmo = CaminhoHamiltoniano(grafo, **(configuracao or {}))
+        resultado = algoritmo.resolver(vertice_inicial,
+                                       timeout=descricao.get('timeout', timeout),
+                                       max_nos=descricao.get('max_nos', max_nos),
+                                       vertice_final=vertice_final,
+                                       ciclo=bool(descricao.get('ciclo', False)))
+    except Exception as erro:
+        # Qualquer falha fica restrita a este grafo; o rastreamento só
+        # aparece no log de depuração
+        _log.debug("Falha ao resolver o grafo %s do lote", linha['id'], exc_info=True)
+        linha['status'] = STATUS_ERRO
+        linha['erro'] = f"{type(erro).__name__}: {erro}"
+        return linha
+
+    linha['num_vertices'] = grafo.num_vertices
+    linha.update(resultado.para_dicionario())
+    return linha
+
+
+def resolver_lote(descricoes, workers=1, timeout=None, max_nos=None, ordenado=True,
+                  max_pendentes=None, **configuracao):
+    """
+    Resolve uma sequência de grafos, produzindo uma linha de saída por grafo.
+
+    A sequência é consumida sob demanda: no máximo max_pendentes grafos
+    ficam em andamento (ou, na saída ordenada, resolvidos à espera dos
+    anteriores) ao mesmo tempo.
+
+    Se um processo trabalhador morrer, os grafos em andamento naquele
+    momento saem com status 'erro' e o restante do lote segue num pool novo.
+
+    Args:
+        descricoes (iterable): Descrições dos grafos (dicts ou linhas JSON)
+        workers (int, optional): Número de processos (None usa todos os
+                                 núcleos; 1 resolve no próprio processo)
+        timeout (float, optional): Tempo máximo de cada busca, em segundos
+        max_nos (int, optional): Número máximo de nós expandidos por busca
+        ordenado (bool): Se True, as linhas saem na ordem da entrada; se
+                         False, saem à medida que os grafos são resolvidos
+        max_pendentes (int, optional): Limite de grafos em andamento
+                                       (padrão: 2 por processo)
+        **configuracao: Argumentos repassados a CaminhoHamiltoniano (motor,
+                        ordenacao, podas, estatisticas, ...)
+
+    Yields:
+        dict: Linha de saída de cada grafo (ver resolver_descricao)
+
+    Raises:
+        ValueError: Se o número de processos, o limite de pendentes ou a
+                    configuração do algoritmo forem inválidos
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Número de processos inválido: {workers}")
+    if max_pendentes is None:
+        max_pendentes = PENDENTES_POR_TRABALHADOR * workers
+    if max_pendentes < 1:
+        raise ValueError(f"Limite de grafos pendentes inválido: {max_pendentes}")
+    # Configurações inválidas falham antes de o lote começar, não em cada linha
+    CaminhoHamiltoniano(Grafo(0), **configuracao)
+
+    if workers == 1:
+        for indice, descricao in enumerate(descricoes):
+            yield resolver_descricao(indice, descricao, configuracao, timeout, max_nos)
+        return
+
+    entradas = enumerate(descricoes)
+    esgotada = False
+    # Futuro -> (índice, descrição) de cada grafo em andamento
+    pendentes = {}
+    # Linhas resolvidas que aguardam as anteriores (só na saída ordenada)
+    prontas = {}
+    proximo = 0
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        while True:
+            while not esgotada and len(pendentes) + len(prontas) < max_pendentes:
+                try:
+                    indice, descricao = next(entradas)
+                except StopIteration:
+                    esgotada = True
+                    break
+                futuro = executor.submit(resolver_descricao, indice, descricao,
+                                         configuracao, timeout, max_nos)
+                pendentes[futuro] = (indice, descricao)
+            if not pendentes:
+                break
+
+            concluidos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+            resultados = [_coletar(futuro, *pendentes.pop(futuro)) for futuro in concluidos]
+            if any(quebrou for _, quebrou in resultados):
+                # Um processo morreu (falta de memória, falha em código nativo)
+                # e levou o pool junto: os grafos em andamento viram erros, sem
+                # saber qual deles foi o culpado, e o lote segue num pool novo
+                resultados += [_coletar(futuro, *pendentes[futuro])
+                               for futuro in wait(pendentes)[0]]
+                pendentes.clear()
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = ProcessPoolExecutor(max_workers=workers)
+            for linha, _ in resultados:
+                if ordenado:
+                    prontas[linha['indice']] = linha
+                else:
+                    yield linha
+            while proximo in prontas:
+                yield prontas.pop(proximo)
+                proximo += 1
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _coletar(futuro, indice, descricao):
+    """
+    Obtém a linha de saída de um grafo resolvido em outro processo.
+
+    resolver_descricao não levanta exceções, mas o processo que a executa
+    pode morrer ou o resultado pode não voltar; nesses casos a linha tem
+    status 'erro'.
+
+    Args:
+        futuro (Future): Futuro da chamada a resolver_descricao
+        indice (int): Posição do grafo na entrada
+        descricao (dict ou str): Descrição do grafo
+
+    Returns:
+        tuple: (dict, bool) - (linha de saída, se o pool de processos se perdeu)
+    """
+    try:
+        return futuro.result(), False
+    except Exception as erro:
+        _log.debug("Falha no processo que resolvia o grafo %s do lote", indice, exc_info=True)
+        linha = {'indice': indice,
+                 'id': descricao.get('id', indice) if isinstance(descricao, dict) else indice,
+                 'status': STATUS_ERRO,
+                 'erro': f"{type(erro).__name__}: {erro}"}
+        return linha, isinstance(erro, BrokenProcessPool)
+
+
+def ler_descricoes(arquivo):
+    """
+    Lê as linhas não vazias de um arquivo JSONL, sem interpretá-las.
+
+    A decodificação do JSON fica com os processos trabalhadores, e uma linha
+    malformada vira uma linha de erro na saída.
+
+    Args:
+        arquivo (file): Arquivo de texto aberto
+
+    Yields:
+        str: Cada linha não vazia
+    """
+    for linha in arquivo:
+        if linha.strip():
+            yield linha
+
+
+def main(argumentos=None):
+    """
+    Interface de linha de comando da resolução em lote.
+
+    Returns:
+        int: Código de saída (1 se alguma descrição gerou erro)
+    """
+    parser = argparse.ArgumentParser(description="Resolve um lote de grafos descritos em JSONL")
+    parser.add_argument('entrada', help="arquivo JSONL com um grafo por linha ('-' para stdin)")
+    parser.add_argument('--saida', help="arquivo JSONL de resultados (padrão: stdout)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="número de processos (0 usa todos os núcleos)")
+    parser.add_argument('--timeout', type=float,
+                        help="tempo máximo de cada busca, em segundos")
+    parser.add_argument('--max-nos', type=int, help="número máximo de nós expandidos por busca")
+    parser.add_argument('--max-pendentes', type=int,
+                        help="limite de grafos em andamento (padrão: 2 por processo)")
+    parser.add_argument('--fora-de-ordem', action='store_true',
+                        help="emite cada resultado assim que ficar pronto")
+    parser.add_argument('--motor', choices=MOTORES, default=MOTORES[0])
+    parser.add_argument('--ordenacao', choices=ORDENACOES, default=ORDENACOES[0])
+    parser.add_argument('--podas', nargs='*', choices=PODAS, default=[])
+    parser.add_argument('--semente', type=int)
+    parser.add_argument('--sem-pre-analise', action='store_true')
+    parser.add_argument('--estatisticas', action='store_true',
+                        help="inclui as estatísticas detalhadas de cada busca")
+    opcoes = parser.parse_args(argumentos)
+
+    entrada = sys.stdin if opcoes.entrada == '-' else open(opcoes.entrada, encoding='utf-8')
+    saida = sys.stdout if opcoes.saida is None else open(opcoes.saida, 'w', encoding='utf-8')
+    contagem = {}
+    inicio = time.perf_counter()
+    try:
+        linhas = resolver_lote(ler_descricoes(entrada), workers=opcoes.workers or None,
+                               timeout=opcoes.timeout, max_nos=opcoes.max_nos,
+                               ordenado=not opcoes.fora_de_ordem,
+                               max_pendentes=opcoes.max_pendentes,
+                               motor=opcoes.motor, ordenacao=opcoes.ordenacao,
+                               podas=opcoes.podas, semente=opcoes.semente,
+                               pre_analise=not opcoes.sem_pre_analise,
+                               estatisticas=opcoes.estatisticas)
+        for linha in linhas:
+            saida.write(json.dumps(linha) + '\n')
+            saida.flush()
+            contagem[linha['status']] = contagem.get(linha['status'], 0) + 1
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if saida is not sys.stdout:
+            saida.close()
+
+    # O resumo vai para stderr para não misturar com os resultados em stdout
+    resumo = ', '.join(f"{status}: {total}" for status, total in sorted(contagem.items()))
+    print(f"{sum(contagem.values())} grafo(s) em {time.perf_counter() - inicio:.2f}s"
+          f" ({resumo or 'nenhum'})", file=sys.stderr)
+    return 1 if contagem.get(STATUS_ERRO) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
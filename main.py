@@ -8,220 +8,3315 @@ Autor: Vinicius Xavier Ramalho
 Data: Outubro 2025
 """
 
+import json
+import multiprocessing
+import os
+import random
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import groupby, permutations, product
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele, os lotes de arestas são validados em Python
+    np = None
+
+from analise import (analisar_viabilidade, cadeia_de_blocos, classes_de_gemeos,
+                     descrever_motivo, vizinhancas_subjacentes,
+                     MOTIVO_ARVORE_DE_BLOCOS, MOTIVO_BUSCA_EXAUSTIVA)
+
+
+# Motores de busca disponíveis em CaminhoHamiltoniano
+MOTOR_BACKTRACKING = 'backtracking'
+MOTOR_PROGRAMACAO_DINAMICA = 'programacao_dinamica'
+MOTOR_POSA = 'posa'
+MOTOR_BIDIRECIONAL = 'bidirecional'
+MOTORES = (MOTOR_BACKTRACKING, MOTOR_PROGRAMACAO_DINAMICA, MOTOR_POSA, MOTOR_BIDIRECIONAL)
+
+# Tentativas independentes do motor heurístico de Pósa antes de desistir
+REINICIOS_POSA = 10
+
+# A tabela da programação dinâmica guarda, para cada subconjunto de vértices,
+# uma máscara de 32 bits com as pontas possíveis (2^n entradas de 4 bytes).
+# O laço sobre os subconjuntos é em Python: por volta de n = 25 (32M
+# subconjuntos, 128 MB) ele já leva minutos
+LIMITE_VERTICES_PD = 25
+
+# A contagem guarda um inteiro por par (subconjunto, vértice final): n · 2^n
+# posições de lista, 8 bytes cada (com n = 20, cerca de 170 MB; com 24, 3 GB)
+LIMITE_VERTICES_CONTAGEM = 20
+
+# executar_busca_caminho só exibe o total de caminhos até este tamanho
+LIMITE_VERTICES_CONTAGEM_EXIBICAO = 14
+
+# Estratégias de ordenação dos vizinhos no backtracking
+ORDENACAO_INDICE = 'indice'
+ORDENACAO_WARNSDORFF = 'warnsdorff'
+ORDENACAO_ALEATORIA = 'aleatoria'
+ORDENACOES = (ORDENACAO_INDICE, ORDENACAO_WARNSDORFF, ORDENACAO_ALEATORIA)
+
+# Regras de poda do backtracking
+PODA_SEM_VIZINHOS = 'sem_vizinhos'
+PODA_EXTREMIDADES = 'extremidades'
+PODA_DESCONEXAO = 'desconexao'
+PODAS = (PODA_SEM_VIZINHOS, PODA_EXTREMIDADES, PODA_DESCONEXAO)
+# Descarte pelas restrições de vértice final (enumeração canônica)
+PODA_FINAIS = 'finais'
+# Descarte pela propagação de arestas forçadas (ver _PropagacaoArestas)
+PODA_PROPAGACAO = 'propagacao'
+
+# Situação de cada aresta durante a propagação de arestas forçadas
+ARESTA_LIVRE = 0
+ARESTA_USADA = 1
+ARESTA_PROIBIDA = 2
+
+# Capacidade padrão da tabela de estados mortos (memo_estados=True)
+MEMO_ESTADOS_PADRAO = 1 << 20
+
+# A cada quantos nós expandidos a busca consulta seu critério de parada
+INTERVALO_VERIFICACAO = 1024
+
+# Situação final de uma busca por caminho hamiltoniano
+STATUS_ENCONTRADO = 'encontrado'
+STATUS_IMPOSSIVEL = 'impossivel'
+STATUS_ORCAMENTO_ESGOTADO = 'orcamento_esgotado'
+
+# Como CaminhoHamiltoniano.atualizar obteve a resposta depois de alterações no grafo
+ATUALIZACAO_CERTIFICADO = 'certificado'
+ATUALIZACAO_REPARO = 'reparo'
+ATUALIZACAO_BUSCA = 'busca'
+
+
+def _vertices_da_mascara(mascara):
+    """
+    Converte uma máscara de bits na lista ordenada dos vértices presentes.
+    
+    Args:
+        mascara (int): Máscara onde o bit i indica o vértice i
+        
+    Returns:
+        list: Lista de vértices em ordem crescente
+    """
+    vertices = []
+    while mascara:
+        bit = mascara & -mascara
+        vertices.append(bit.bit_length() - 1)
+        mascara ^= bit
+    return vertices
+
+def _caminho_na_mascara(origem, destino, mascara, seguintes, anteriores):
+    """
+    Caminho de origem a destino que visita exatamente os vértices da máscara.
+    
+    Usado por CaminhoHamiltoniano._bidirecional para refazer cada metade
+    depois da junção, sem guardar as camadas da busca inteira: as camadas
+    (máscara -> pontas) são recalculadas só entre os subconjuntos da
+    máscara, que tem cerca de n/2 vértices, e o caminho é lido de trás para
+    frente. O caminho precisa existir.
+    
+    Args:
+        origem (int): Primeiro vértice do caminho
+        destino (int): Último vértice do caminho
+        mascara (int): Vértices a visitar (inclui origem e destino)
+        seguintes (list): Máscara dos vizinhos de saída de cada vértice
+        anteriores (list): Máscara dos vizinhos de entrada de cada vértice
+        
+    Returns:
+        list: Vértices do caminho, de origem a destino
+    """
+    camadas = [{1 << origem: 1 << origem}]
+    for _ in range(bin(mascara).count('1') - 1):
+        nova = {}
+        for visitados, pontas in camadas[-1].items():
+            alcancaveis = 0
+            while pontas:
+                bit = pontas & -pontas
+                alcancaveis |= seguintes[bit.bit_length() - 1]
+                pontas ^= bit
+            alcancaveis &= mascara & ~visitados
+            while alcancaveis:
+                bit = alcancaveis & -alcancaveis
+                nova[visitados | bit] = nova.get(visitados | bit, 0) | bit
+                alcancaveis ^= bit
+        camadas.append(nova)
+    
+    caminho = []
+    candidatos = 1 << destino
+    for posicao in range(len(camadas) - 1, -1, -1):
+        vertice = (candidatos & -candidatos).bit_length() - 1
+        caminho.append(vertice)
+        mascara ^= 1 << vertice
+        if posicao:
+            candidatos = camadas[posicao - 1][mascara] & anteriores[vertice]
+    return caminho[::-1]
+
+def _validar_arestas(arestas, num_vertices):
+    """
+    Valida um lote de arestas de uma só vez.
+    
+    Args:
+        arestas: Iterável de pares (origem, destino) ou array NumPy de forma (E, 2)
+        num_vertices (int): Número de vértices do grafo
+        
+    Returns:
+        tuple: (origens, destinos) - arrays NumPy ou, sem NumPy, listas de
+               inteiros de mesmo tamanho
+        
+    Raises:
+        ValueError: Se o lote não for formado por pares ou se alguma aresta
+                    usar um vértice inexistente (a mensagem indica as linhas)
+    """
+    if np is not None:
+        if not isinstance(arestas, np.ndarray):
+            arestas = list(arestas)
+        matriz = np.asarray(arestas, dtype=np.int64)
+        if matriz.size == 0:
+            return matriz.reshape(0), matriz.reshape(0)
+        if matriz.ndim != 2 or matriz.shape[1] != 2:
+            raise ValueError(f"As arestas devem formar um array (E, 2), não {matriz.shape}")
+        invalidas = np.flatnonzero(((matriz < 0) | (matriz >= num_vertices)).any(axis=1))
+        if invalidas.size:
+            linhas = invalidas[:10].tolist()
+            _erro_arestas(invalidas.size, linhas, matriz[linhas].tolist())
+        return matriz[:, 0], matriz[:, 1]
+    
+    origens, destinos, invalidas = [], [], []
+    for linha, par in enumerate(arestas):
+        if len(par) != 2:
+            raise ValueError(f"Linha {linha}: a aresta deve ser um par, não {par!r}")
+        origem, destino = int(par[0]), int(par[1])
+        if not (0 <= origem < num_vertices and 0 <= destino < num_vertices):
+            invalidas.append(linha)
+        origens.append(origem)
+        destinos.append(destino)
+    if invalidas:
+        linhas = invalidas[:10]
+        _erro_arestas(len(invalidas), linhas, [[origens[i], destinos[i]] for i in linhas])
+    return origens, destinos
+
+
+def _erro_arestas(total, linhas, pares):
+    """Gera o erro de um lote com arestas inválidas, listando as primeiras."""
+    detalhes = ', '.join(f"linha {linha}: ({origem}, {destino})"
+                         for linha, (origem, destino) in zip(linhas, pares))
+    if total > len(linhas):
+        detalhes += f", ... (+{total - len(linhas)})"
+    raise ValueError(f"{total} aresta(s) com vértices inválidos: {detalhes}")
+
+
+def _agrupar_por_origem(origens, destinos, num_vertices, simetrico=False):
+    """
+    Agrupa um lote de arestas pela origem, sem repetições.
+    
+    Args:
+        origens: Vértice de origem de cada aresta (lista ou array)
+        destinos: Vértice de destino de cada aresta (lista ou array)
+        num_vertices (int): Número de vértices do grafo
+        simetrico (bool): Se True, cada aresta entra também no sentido inverso
+        
+    Yields:
+        tuple: (origem, lista ordenada de destinos), em ordem crescente de origem
+    """
+    if np is not None:
+        # Ordenar e descartar vizinhos iguais é mais rápido que np.unique em lotes grandes
+        chaves = origens * num_vertices + destinos
+        if simetrico:
+            chaves = np.concatenate((chaves, destinos * num_vertices + origens))
+        chaves.sort()
+        chaves = chaves[np.diff(chaves, prepend=-1) != 0]
+        origens_unicas, destinos_unicos = np.divmod(chaves, num_vertices)
+        inicios = np.flatnonzero(np.diff(origens_unicas, prepend=-1))
+        origens_unicas = origens_unicas[inicios].tolist()
+        inicios = inicios.tolist()
+        fins = inicios[1:] + [len(chaves)]
+        destinos_unicos = destinos_unicos.tolist()
+        for origem, inicio, fim in zip(origens_unicas, inicios, fins):
+            yield origem, destinos_unicos[inicio:fim]
+        return
+    
+    pares = set(zip(origens, destinos))
+    if simetrico:
+        pares.update(zip(destinos, origens))
+    for origem, grupo in groupby(sorted(pares), key=lambda par: par[0]):
+        yield origem, [destino for _, destino in grupo]
+
+
+def caminho_valido(grafo, caminho, vertice_inicial=None, vertice_final=None, ciclo=False):
+    """
+    Verifica em O(n) se uma sequência é um caminho hamiltoniano do grafo.
+    
+    Args:
+        grafo (Grafo): Grafo de referência
+        caminho (list): Sequência de vértices
+        vertice_inicial (int, optional): Vértice em que o caminho deve começar
+        vertice_final (int, optional): Vértice em que o caminho deve terminar
+        ciclo (bool): Se True, exige também a aresta do último vértice de
+                      volta ao primeiro (ciclo hamiltoniano)
+        
+    Returns:
+        bool: True se o caminho visita cada vértice uma vez por arestas do grafo
+    """
+    n = grafo.num_vertices
+    if len(caminho) != n or sorted(caminho) != list(range(n)):
+        return False
+    if vertice_inicial is not None and caminho[0] != vertice_inicial:
+        return False
+    if vertice_final is not None and caminho[-1] != vertice_final:
+        return False
+    if ciclo and n and (not grafo.tem_aresta(caminho[-1], caminho[0])
+                  or (n == 2 and not grafo.orientado)):
+        # Com dois vértices, o ciclo não orientado repetiria a única aresta
+        return False
+    return all(grafo.tem_aresta(origem, destino) for origem, destino in zip(caminho, caminho[1:]))
+
+
 class Grafo:
     """
     Classe para representar um grafo que pode ser orientado ou não orientado.
     """
     
-    def __init__(self, num_vertices, orientado=False):
+    def __init__(self, num_vertices, orientado=False):
+        """
+        Inicializa o grafo.
+        
+        Args:
+            num_vertices (int): Número de vértices no grafo
+            orientado (bool): True se o grafo for orientado, False caso contrário
+        """
+        self.num_vertices = num_vertices
+        self.orientado = orientado
+        # Matriz de adjacência para representar o grafo
+        self.matriz_adj = [[False for _ in range(num_vertices)] 
+                          for _ in range(num_vertices)]
+        # Contadores de alterações, usados para reaproveitar resultados anteriores
+        self.num_insercoes = 0
+        self.num_remocoes = 0
+        
+    def adicionar_aresta(self, origem, destino):
+        """
+        Adiciona uma aresta ao grafo.
+        
+        Args:
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+        """
+        if 0 <= origem < self.num_vertices and 0 <= destino < self.num_vertices:
+            self.matriz_adj[origem][destino] = True
+            # Se o grafo não for orientado, adiciona a aresta inversa
+            if not self.orientado:
+                self.matriz_adj[destino][origem] = True
+            self.num_insercoes += 1
+        else:
+            print(f"Erro: Vértices inválidos ({origem}, {destino})")
+    
+    def remover_aresta(self, origem, destino):
+        """
+        Remove uma aresta do grafo.
+        
+        Args:
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+        """
+        if 0 <= origem < self.num_vertices and 0 <= destino < self.num_vertices:
+            self.matriz_adj[origem][destino] = False
+            if not self.orientado:
+                self.matriz_adj[destino][origem] = False
+            self.num_remocoes += 1
+    
+    def _lote(self, arestas):
+        """
+        Valida um lote de arestas e o agrupa por origem.
+        
+        Em grafos não orientados, cada aresta entra nos dois sentidos.
+        
+        Args:
+            arestas: Iterável de pares (origem, destino) ou array NumPy (E, 2)
+            
+        Returns:
+            generator: Pares (origem, lista ordenada de destinos)
+        """
+        origens, destinos = _validar_arestas(arestas, self.num_vertices)
+        return _agrupar_por_origem(origens, destinos, self.num_vertices,
+                                   simetrico=not self.orientado)
+    
+    def adicionar_arestas(self, arestas):
+        """
+        Adiciona um lote de arestas ao grafo.
+        
+        O lote inteiro é validado antes de qualquer alteração: se houver uma
+        aresta inválida, nenhuma é adicionada.
+        
+        Args:
+            arestas: Iterável de pares (origem, destino) ou array NumPy (E, 2)
+            
+        Raises:
+            ValueError: Se alguma aresta usar um vértice inexistente
+        """
+        for origem, destinos in self._lote(arestas):
+            linha = self.matriz_adj[origem]
+            for destino in destinos:
+                linha[destino] = True
+        self.num_insercoes += 1
+    
+    def remover_arestas(self, arestas):
+        """
+        Remove um lote de arestas do grafo (arestas inexistentes são ignoradas).
+        
+        Args:
+            arestas: Iterável de pares (origem, destino) ou array NumPy (E, 2)
+            
+        Raises:
+            ValueError: Se alguma aresta usar um vértice inexistente
+        """
+        for origem, destinos in self._lote(arestas):
+            linha = self.matriz_adj[origem]
+            for destino in destinos:
+                linha[destino] = False
+        self.num_remocoes += 1
+    
+    def tem_aresta(self, origem, destino):
+        """
+        Verifica se existe uma aresta entre dois vértices.
+        
+        Args:
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+            
+        Returns:
+            bool: True se a aresta existe, False caso contrário
+        """
+        if 0 <= origem < self.num_vertices and 0 <= destino < self.num_vertices:
+            return self.matriz_adj[origem][destino]
+        return False
+    
+    def obter_adjacentes(self, vertice):
+        """
+        Obtém todos os vértices adjacentes a um dado vértice.
+        
+        Args:
+            vertice (int): Vértice para buscar adjacentes
+            
+        Returns:
+            list: Lista de vértices adjacentes
+        """
+        adjacentes = []
+        for i in range(self.num_vertices):
+            if self.matriz_adj[vertice][i]:
+                adjacentes.append(i)
+        return adjacentes
+    
+    def mascara_adjacentes(self, vertice):
+        """
+        Obtém os vértices adjacentes a um dado vértice como máscara de bits.
+        
+        Args:
+            vertice (int): Vértice para buscar adjacentes
+            
+        Returns:
+            int: Máscara onde o bit i indica a aresta vertice -> i
+        """
+        mascara = 0
+        for i in range(self.num_vertices):
+            if self.matriz_adj[vertice][i]:
+                mascara |= 1 << i
+        return mascara
+    
+    def obter_adjacentes_nao_visitados(self, vertice, mascara_visitados):
+        """
+        Obtém os vértices adjacentes que ainda não foram visitados.
+        
+        Args:
+            vertice (int): Vértice para buscar adjacentes
+            mascara_visitados (int): Máscara de bits dos vértices já visitados
+            
+        Returns:
+            list: Lista de vértices adjacentes não visitados
+        """
+        return _vertices_da_mascara(self.mascara_adjacentes(vertice) & ~mascara_visitados)
+    
+    def grau(self, vertice):
+        """
+        Calcula o grau (de saída, em grafos orientados) de um vértice.
+        
+        Args:
+            vertice (int): Vértice a ser consultado
+            
+        Returns:
+            int: Número de vértices adjacentes
+        """
+        return sum(1 for existe in self.matriz_adj[vertice] if existe)
+    
+    def imprimir_grafo(self):
+        """
+        Imprime a representação do grafo.
+        """
+        tipo = "Orientado" if self.orientado else "Não Orientado"
+        print(f"\nGrafo {tipo} com {self.num_vertices} vértices:")
+        print("Matriz de Adjacência:")
+        for i in range(self.num_vertices):
+            linha = [self.tem_aresta(i, j) for j in range(self.num_vertices)]
+            print(f"  {i}: {linha}")
+        
+        self._imprimir_arestas()
+    
+    def _imprimir_arestas(self):
+        """
+        Imprime a lista de arestas do grafo.
+        """
+        print("\nLista de Arestas:")
+        for i in range(self.num_vertices):
+            adjacentes = self.obter_adjacentes(i)
+            if adjacentes:
+                for j in adjacentes:
+                    if self.orientado or i <= j:  # Evita duplicatas em grafos não orientados
+                        simbolo = "->" if self.orientado else "--"
+                        print(f"  {i} {simbolo} {j}")
+
+
+class GrafoBitset(Grafo):
+    """
+    Grafo que armazena cada linha da matriz de adjacência como um inteiro.
+    
+    O bit j da linha i indica a aresta i -> j. Vizinhança, vizinhos não
+    visitados (linha & ~visitados) e grau passam a ser operações sobre
+    palavras inteiras em vez de varreduras de listas de booleanos.
+    """
+    
+    def __init__(self, num_vertices, orientado=False):
+        """
+        Inicializa o grafo.
+        
+        Args:
+            num_vertices (int): Número de vértices no grafo
+            orientado (bool): True se o grafo for orientado, False caso contrário
+        """
+        self.num_vertices = num_vertices
+        self.orientado = orientado
+        # Uma máscara de bits por vértice
+        self.linhas = [0] * num_vertices
+        self.num_insercoes = 0
+        self.num_remocoes = 0
+        # Matriz de booleanos já construída, com as linhas e os contadores de
+        # alterações do momento em que foi feita
+        self._matriz = None
+        self._versao_matriz = None
+    
+    @property
+    def matriz_adj(self):
+        """
+        Matriz de adjacência equivalente à da classe Grafo.
+        
+        Construída a partir das máscaras em O(n²) no primeiro acesso e
+        reaproveitada até a próxima alteração do grafo (ou substituição de
+        self.linhas). A busca não a usa: ela trabalha direto nas máscaras.
+        A lista retornada é compartilhada entre os acessos e não deve ser
+        alterada; alterações nela não afetam o grafo.
+        
+        Returns:
+            list: Matriz n×n de booleanos
+        """
+        versao = (self.num_insercoes, self.num_remocoes)
+        linhas, versao_matriz = self._versao_matriz or (None, None)
+        if linhas is not self.linhas or versao_matriz != versao:
+            self._matriz = [[bool(linha >> j & 1) for j in range(self.num_vertices)]
+                            for linha in self.linhas]
+            self._versao_matriz = (self.linhas, versao)
+        return self._matriz
+    
+    def adicionar_aresta(self, origem, destino):
+        """
+        Adiciona uma aresta ao grafo.
+        
+        Args:
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+        """
+        if 0 <= origem < self.num_vertices and 0 <= destino < self.num_vertices:
+            self.linhas[origem] |= 1 << destino
+            # Se o grafo não for orientado, adiciona a aresta inversa
+            if not self.orientado:
+                self.linhas[destino] |= 1 << origem
+            self.num_insercoes += 1
+        else:
+            print(f"Erro: Vértices inválidos ({origem}, {destino})")
+    
+    def remover_aresta(self, origem, destino):
+        """
+        Remove uma aresta do grafo.
+        
+        Args:
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+        """
+        if 0 <= origem < self.num_vertices and 0 <= destino < self.num_vertices:
+            self.linhas[origem] &= ~(1 << destino)
+            if not self.orientado:
+                self.linhas[destino] &= ~(1 << origem)
+            self.num_remocoes += 1
+    
+    def adicionar_arestas(self, arestas):
+        """
+        Adiciona um lote de arestas ao grafo (ver Grafo.adicionar_arestas).
+        
+        Args:
+            arestas: Iterável de pares (origem, destino) ou array NumPy (E, 2)
+            
+        Raises:
+            ValueError: Se alguma aresta usar um vértice inexistente
+        """
+        for origem, destinos in self._lote(arestas):
+            mascara = 0
+            for destino in destinos:
+                mascara |= 1 << destino
+            self.linhas[origem] |= mascara
+        self.num_insercoes += 1
+    
+    def remover_arestas(self, arestas):
+        """
+        Remove um lote de arestas do grafo (ver Grafo.remover_arestas).
+        
+        Args:
+            arestas: Iterável de pares (origem, destino) ou array NumPy (E, 2)
+            
+        Raises:
+            ValueError: Se alguma aresta usar um vértice inexistente
+        """
+        for origem, destinos in self._lote(arestas):
+            mascara = 0
+            for destino in destinos:
+                mascara |= 1 << destino
+            self.linhas[origem] &= ~mascara
+        self.num_remocoes += 1
+    
+    def tem_aresta(self, origem, destino):
+        """
+        Verifica se existe uma aresta entre dois vértices.
+        
+        Args:
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+            
+        Returns:
+            bool: True se a aresta existe, False caso contrário
+        """
+        if 0 <= origem < self.num_vertices and 0 <= destino < self.num_vertices:
+            return bool(self.linhas[origem] >> destino & 1)
+        return False
+    
+    def obter_adjacentes(self, vertice):
+        """
+        Obtém todos os vértices adjacentes a um dado vértice.
+        
+        Args:
+            vertice (int): Vértice para buscar adjacentes
+            
+        Returns:
+            list: Lista de vértices adjacentes
+        """
+        return _vertices_da_mascara(self.linhas[vertice])
+    
+    def mascara_adjacentes(self, vertice):
+        """
+        Obtém os vértices adjacentes a um dado vértice como máscara de bits.
+        
+        Args:
+            vertice (int): Vértice para buscar adjacentes
+            
+        Returns:
+            int: Máscara onde o bit i indica a aresta vertice -> i
+        """
+        return self.linhas[vertice]
+    
+    def grau(self, vertice):
+        """
+        Calcula o grau (de saída, em grafos orientados) de um vértice.
+        
+        Args:
+            vertice (int): Vértice a ser consultado
+            
+        Returns:
+            int: Número de vértices adjacentes
+        """
+        return bin(self.linhas[vertice]).count('1')
+
+
+class GrafoEsparso(Grafo):
+    """
+    Grafo representado por listas de adjacência ordenadas.
+    
+    Usa memória O(V + E) em vez da matriz n×n da classe Grafo, o que permite
+    trabalhar com grafos grandes e esparsos (por exemplo, malhas viárias com
+    centenas de milhares de vértices). A iteração sobre vizinhos custa O(grau)
+    e a consulta de aresta O(log grau), por busca binária.
+    """
+    
+    def __init__(self, num_vertices, orientado=False):
+        """
+        Inicializa o grafo.
+        
+        Args:
+            num_vertices (int): Número de vértices no grafo
+            orientado (bool): True se o grafo for orientado, False caso contrário
+        """
+        self.num_vertices = num_vertices
+        self.orientado = orientado
+        # Lista ordenada de vizinhos de cada vértice
+        self.adjacencias = [[] for _ in range(num_vertices)]
+        self.num_insercoes = 0
+        self.num_remocoes = 0
+    
+    def _inserir(self, origem, destino):
+        """Insere destino na lista ordenada de origem, se ainda não existir."""
+        vizinhos = self.adjacencias[origem]
+        indice = bisect_left(vizinhos, destino)
+        if indice == len(vizinhos) or vizinhos[indice] != destino:
+            vizinhos.insert(indice, destino)
+    
+    def _retirar(self, origem, destino):
+        """Retira destino da lista ordenada de origem, se existir."""
+        vizinhos = self.adjacencias[origem]
+        indice = bisect_left(vizinhos, destino)
+        if indice < len(vizinhos) and vizinhos[indice] == destino:
+            del vizinhos[indice]
+    
+    def adicionar_aresta(self, origem, destino):
+        """
+        Adiciona uma aresta ao grafo.
+        
+        Args:
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+        """
+        if 0 <= origem < self.num_vertices and 0 <= destino < self.num_vertices:
+            self._inserir(origem, destino)
+            # Se o grafo não for orientado, adiciona a aresta inversa
+            if not self.orientado:
+                self._inserir(destino, origem)
+            self.num_insercoes += 1
+        else:
+            print(f"Erro: Vértices inválidos ({origem}, {destino})")
+    
+    def remover_aresta(self, origem, destino):
+        """
+        Remove uma aresta do grafo.
+        
+        Args:
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+        """
+        if 0 <= origem < self.num_vertices and 0 <= destino < self.num_vertices:
+            self._retirar(origem, destino)
+            if not self.orientado:
+                self._retirar(destino, origem)
+            self.num_remocoes += 1
+    
+    def adicionar_arestas(self, arestas):
+        """
+        Adiciona um lote de arestas ao grafo (ver Grafo.adicionar_arestas).
+        
+        Cada lista de adjacência tocada é mesclada uma única vez com os novos
+        vizinhos, em vez de uma inserção ordenada por aresta.
+        
+        Args:
+            arestas: Iterável de pares (origem, destino) ou array NumPy (E, 2)
+            
+        Raises:
+            ValueError: Se alguma aresta usar um vértice inexistente
+        """
+        adjacencias = self.adjacencias
+        for origem, destinos in self._lote(arestas):
+            atuais = adjacencias[origem]
+            adjacencias[origem] = sorted(set(atuais).union(destinos)) if atuais else destinos
+        self.num_insercoes += 1
+    
+    def remover_arestas(self, arestas):
+        """
+        Remove um lote de arestas do grafo (ver Grafo.remover_arestas).
+        
+        Args:
+            arestas: Iterável de pares (origem, destino) ou array NumPy (E, 2)
+            
+        Raises:
+            ValueError: Se alguma aresta usar um vértice inexistente
+        """
+        for origem, destinos in self._lote(arestas):
+            retirar = set(destinos)
+            self.adjacencias[origem] = [vizinho for vizinho in self.adjacencias[origem]
+                                        if vizinho not in retirar]
+        self.num_remocoes += 1
+    
+    def tem_aresta(self, origem, destino):
+        """
+        Verifica se existe uma aresta entre dois vértices.
+        
+        Args:
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+            
+        Returns:
+            bool: True se a aresta existe, False caso contrário
+        """
+        if 0 <= origem < self.num_vertices and 0 <= destino < self.num_vertices:
+            vizinhos = self.adjacencias[origem]
+            indice = bisect_left(vizinhos, destino)
+            return indice < len(vizinhos) and vizinhos[indice] == destino
+        return False
+    
+    def obter_adjacentes(self, vertice):
+        """
+        Obtém todos os vértices adjacentes a um dado vértice.
+        
+        Args:
+            vertice (int): Vértice para buscar adjacentes
+            
+        Returns:
+            list: Lista de vértices adjacentes
+        """
+        return list(self.adjacencias[vertice])
+    
+    def mascara_adjacentes(self, vertice):
+        """
+        Obtém os vértices adjacentes a um dado vértice como máscara de bits.
+        
+        Args:
+            vertice (int): Vértice para buscar adjacentes
+            
+        Returns:
+            int: Máscara onde o bit i indica a aresta vertice -> i
+        """
+        mascara = 0
+        for vizinho in self.adjacencias[vertice]:
+            mascara |= 1 << vizinho
+        return mascara
+    
+    def obter_adjacentes_nao_visitados(self, vertice, mascara_visitados):
+        """
+        Obtém os vértices adjacentes que ainda não foram visitados.
+        
+        Args:
+            vertice (int): Vértice para buscar adjacentes
+            mascara_visitados (int): Máscara de bits dos vértices já visitados
+            
+        Returns:
+            list: Lista de vértices adjacentes não visitados
+        """
+        return [vizinho for vizinho in self.adjacencias[vertice]
+                if not mascara_visitados >> vizinho & 1]
+    
+    def grau(self, vertice):
+        """
+        Calcula o grau (de saída, em grafos orientados) de um vértice.
+        
+        Args:
+            vertice (int): Vértice a ser consultado
+            
+        Returns:
+            int: Número de vértices adjacentes
+        """
+        return len(self.adjacencias[vertice])
+    
+    def imprimir_grafo(self):
+        """
+        Imprime a representação do grafo (listas de adjacência, sem matriz).
+        """
+        tipo = "Orientado" if self.orientado else "Não Orientado"
+        print(f"\nGrafo {tipo} com {self.num_vertices} vértices:")
+        print("Listas de Adjacência:")
+        for i in range(self.num_vertices):
+            print(f"  {i}: {self.adjacencias[i]}")
+        
+        self._imprimir_arestas()
+
+
+class ResultadoBusca:
+    """
+    Resultado estruturado de uma busca por caminho hamiltoniano.
+    
+    Attributes:
+        status (str): 'encontrado', 'impossivel' (provado pela pré-análise ou
+                      pela busca completa) ou 'orcamento_esgotado'
+        caminho (list): Caminho hamiltoniano, vazio se não encontrado
+        motivo (str): Código do motivo quando o status é 'impossivel'
+        maior_caminho (list): Maior caminho simples visto durante a busca
+        nos_expandidos (int): Número de nós expandidos
+        tempo (float): Tempo de parede da busca, em segundos
+        estatisticas (EstatisticasBusca): Estatísticas detalhadas, se coletadas
+    """
+    
+    def __init__(self, status, caminho=None, motivo=None, maior_caminho=None,
+                 nos_expandidos=0, tempo=0.0, estatisticas=None):
+        """
+        Inicializa o resultado.
+        
+        Args:
+            status (str): Situação final da busca
+            caminho (list, optional): Caminho hamiltoniano encontrado
+            motivo (str, optional): Código do motivo da resposta negativa
+            maior_caminho (list, optional): Maior caminho simples encontrado
+            nos_expandidos (int): Número de nós expandidos
+            tempo (float): Tempo de parede da busca, em segundos
+            estatisticas (EstatisticasBusca, optional): Estatísticas detalhadas
+        """
+        self.status = status
+        self.caminho = caminho or []
+        self.motivo = motivo
+        self.maior_caminho = maior_caminho or []
+        self.nos_expandidos = nos_expandidos
+        self.tempo = tempo
+        self.estatisticas = estatisticas
+    
+    @property
+    def encontrou(self):
+        """bool: True se um caminho hamiltoniano foi encontrado."""
+        return self.status == STATUS_ENCONTRADO
+    
+    def para_dicionario(self):
+        """
+        Converte o resultado em dicionário serializável em JSON.
+        
+        Returns:
+            dict: Campos do resultado
+        """
+        return {
+            'status': self.status,
+            'caminho': self.caminho,
+            'motivo': self.motivo,
+            'maior_caminho': self.maior_caminho,
+            'nos_expandidos': self.nos_expandidos,
+            'tempo': self.tempo,
+            'estatisticas': (self.estatisticas.para_dicionario()
+                             if self.estatisticas is not None else None),
+        }
+    
+    def __repr__(self):
+        return (f"ResultadoBusca(status={self.status!r}, caminho={self.caminho!r}, "
+                f"motivo={self.motivo!r})")
+
+
+class EstatisticasBusca:
+    """
+    Contadores opcionais do backtracking, para entender por que uma busca é lenta.
+    
+    Attributes:
+        nos_expandidos (int): Vértices colocados no caminho durante a busca
+        retrocessos (int): Vezes em que a busca desfez um vértice sem alternativas
+        podas (dict): Estados descartados por cada regra de poda
+        nos_por_profundidade (list): Nós expandidos em cada posição do caminho
+        tempo_por_inicio (dict): Tempo gasto a partir de cada vértice inicial
+        tempo_parede (float): Tempo de parede total, em segundos
+        tempo_cpu (float): Tempo de CPU do processo durante a busca, em segundos
+        memo (dict): Contadores da tabela de estados mortos, se usada
+                     (ver TabelaTransposicao.para_dicionario)
+    
+    Na busca paralela, os processos trabalhadores não devolvem seus
+    contadores: só o total de nós expandidos e os tempos são registrados.
+    """
+    
+    def __init__(self, num_vertices=0):
+        """
+        Inicializa os contadores zerados.
+        
+        Args:
+            num_vertices (int): Número de vértices do grafo (profundidades possíveis)
+        """
+        self.nos_expandidos = 0
+        self.retrocessos = 0
+        self.podas = {poda: 0 for poda in PODAS + (PODA_FINAIS, PODA_PROPAGACAO)}
+        self.nos_por_profundidade = [0] * num_vertices
+        self.tempo_por_inicio = {}
+        self.tempo_parede = 0.0
+        self.tempo_cpu = 0.0
+        self.memo = None
+    
+    @property
+    def profundidade_maxima(self):
+        """int: Maior posição do caminho alcançada (-1 se nada foi expandido)."""
+        for profundidade in range(len(self.nos_por_profundidade) - 1, -1, -1):
+            if self.nos_por_profundidade[profundidade]:
+                return profundidade
+        return -1
+    
+    def fator_ramificacao(self):
+        """
+        Fator de ramificação efetivo em cada profundidade.
+        
+        Returns:
+            list: Para cada profundidade d, nós em d + 1 divididos por nós em d
+        """
+        nos = self.nos_por_profundidade
+        return [nos[d + 1] / nos[d] if nos[d] else 0.0 for d in range(len(nos) - 1)]
+    
+    def para_dicionario(self):
+        """
+        Converte as estatísticas em dicionário serializável em JSON.
+        
+        Returns:
+            dict: Contadores, histograma e tempos
+        """
+        return {
+            'nos_expandidos': self.nos_expandidos,
+            'retrocessos': self.retrocessos,
+            'podas': dict(self.podas),
+            'profundidade_maxima': self.profundidade_maxima,
+            'nos_por_profundidade': list(self.nos_por_profundidade),
+            'fator_ramificacao': self.fator_ramificacao(),
+            'tempo_por_inicio': {str(v): t for v, t in self.tempo_por_inicio.items()},
+            'tempo_parede': self.tempo_parede,
+            'tempo_cpu': self.tempo_cpu,
+            'memo': self.memo,
+        }
+    
+    def para_json(self, **kwargs):
+        """
+        Exporta as estatísticas como texto JSON.
+        
+        Args:
+            **kwargs: Argumentos repassados a json.dumps (por exemplo, indent)
+            
+        Returns:
+            str: Estatísticas em JSON
+        """
+        return json.dumps(self.para_dicionario(), **kwargs)
+
+
+class TabelaTransposicao:
+    """
+    Tabela limitada de estados do backtracking que não levam a nenhum caminho.
+    
+    Um estado é o par (máscara dos visitados, vértice atual). Os caminhos
+    que completam um estado dependem só dele (e das pontas finais aceitas),
+    não da ordem em que os vértices foram visitados nem do vértice inicial:
+    um estado cuja subárvore foi explorada por inteiro sem sucesso pode ser
+    descartado sempre que a busca voltar a ele por outra ordem. Quando a
+    tabela enche, sai o estado consultado ou registrado há mais tempo (LRU).
+    
+    Attributes:
+        capacidade (int): Número máximo de estados guardados
+        consultas (int): Estados procurados na tabela
+        acertos (int): Consultas que encontraram o estado
+        registros (int): Estados mortos registrados
+        descartes (int): Estados removidos para abrir espaço
+    """
+    
+    def __init__(self, capacidade=MEMO_ESTADOS_PADRAO):
+        """
+        Cria a tabela vazia.
+        
+        Args:
+            capacidade (int): Número máximo de estados guardados
+        """
+        if capacidade <= 0:
+            raise ValueError(f"Capacidade inválida da tabela de estados: {capacidade}")
+        self.capacidade = capacidade
+        self.consultas = 0
+        self.acertos = 0
+        self.registros = 0
+        self.descartes = 0
+        self._estados = OrderedDict()
+    
+    def __len__(self):
+        return len(self._estados)
+    
+    @property
+    def taxa_acertos(self):
+        """float: Fração das consultas que encontraram o estado (0.0 sem consultas)."""
+        return self.acertos / self.consultas if self.consultas else 0.0
+    
+    def contem(self, mascara, vertice):
+        """
+        Consulta se um estado já foi provado morto.
+        
+        Args:
+            mascara (int): Máscara de bits dos vértices visitados (inclui vertice)
+            vertice (int): Vértice atual
+            
+        Returns:
+            bool: True se o estado está na tabela
+        """
+        self.consultas += 1
+        chave = (mascara, vertice)
+        if chave not in self._estados:
+            return False
+        self._estados.move_to_end(chave)
+        self.acertos += 1
+        return True
+    
+    def registrar(self, mascara, vertice):
+        """
+        Guarda um estado morto, descartando o menos usado recentemente se necessário.
+        
+        Args:
+            mascara (int): Máscara de bits dos vértices visitados (inclui vertice)
+            vertice (int): Vértice atual
+        """
+        self._estados[(mascara, vertice)] = None
+        self.registros += 1
+        if len(self._estados) > self.capacidade:
+            self._estados.popitem(last=False)
+            self.descartes += 1
+    
+    def limpar(self):
+        """
+        Remove todos os estados, mantendo os contadores.
+        """
+        self._estados.clear()
+    
+    def para_dicionario(self):
+        """
+        Converte os contadores em dicionário serializável em JSON.
+        
+        Returns:
+            dict: Capacidade, ocupação, contadores e taxa de acertos
+        """
+        return {
+            'capacidade': self.capacidade,
+            'ocupacao': len(self._estados),
+            'consultas': self.consultas,
+            'acertos': self.acertos,
+            'registros': self.registros,
+            'descartes': self.descartes,
+            'taxa_acertos': self.taxa_acertos,
+        }
+
+
+class _PropagacaoArestas:
+    """
+    Arestas usadas, proibidas e livres de um ciclo hamiltoniano parcial.
+    
+    Um caminho hamiltoniano de G é um ciclo hamiltoniano de G + z, onde o
+    vértice virtual z (índice n) é vizinho de todos: as arestas de z ligam as
+    duas pontas do caminho. No ciclo, todo vértice tem grau exatamente 2, o
+    que permite propagar decisões:
+    - um vértice com só duas arestas possíveis precisa usar as duas;
+    - um vértice com duas arestas usadas não pode usar as demais;
+    - uma aresta entre as pontas de um mesmo fragmento (trecho de arestas
+      usadas) fecharia um subciclo e é proibida, salvo se fechar o ciclo todo.
+    
+    Toda alteração é registrada numa trilha, e desfazer(marca) volta ao
+    estado do momento em que a marca foi obtida.
+    
+    Attributes:
+        estado (bytearray): ARESTA_LIVRE, ARESTA_USADA ou ARESTA_PROIBIDA de cada aresta
+        usadas (list): Arestas usadas em cada vértice
+        possiveis (list): Arestas usadas ou livres em cada vértice
+        virtuais (list): Aresta entre cada vértice e o vértice virtual
+    """
+    
+    def __init__(self, adjacentes):
+        """
+        Monta as arestas de G + z, todas livres.
+        
+        Args:
+            adjacentes (list): Listas de adjacência simétricas de um grafo não orientado
+        """
+        n = len(adjacentes)
+        self.num_vertices = n
+        self.origens = []
+        self.destinos = []
+        self.incidentes = [[] for _ in range(n + 1)]
+        self._indice = {}
+        for origem in range(n):
+            for destino in adjacentes[origem]:
+                if origem < destino:
+                    self._criar(origem, destino)
+        self.virtuais = [self._criar(v, n) for v in range(n)]
+        
+        self.estado = bytearray(len(self.origens))
+        self.usadas = [0] * (n + 1)
+        self.possiveis = [len(lista) for lista in self.incidentes]
+        # Para a ponta de cada fragmento, a ponta oposta (v isolado: ele mesmo)
+        self.outra_ponta = list(range(n + 1))
+        self.num_usadas = 0
+        self.trilha = []
+        # Vértices cujas contagens mudaram e ainda não foram examinados
+        self.fila = list(range(n + 1))
+    
+    def _criar(self, origem, destino):
+        aresta = len(self.origens)
+        self.origens.append(origem)
+        self.destinos.append(destino)
+        self.incidentes[origem].append(aresta)
+        self.incidentes[destino].append(aresta)
+        self._indice[(origem, destino)] = self._indice[(destino, origem)] = aresta
+        return aresta
+    
+    def aresta(self, origem, destino):
+        """int ou None: Índice da aresta entre dois vértices, se existir."""
+        return self._indice.get((origem, destino))
+    
+    def marca(self):
+        """int: Posição atual da trilha, para desfazer(marca)."""
+        return len(self.trilha)
+    
+    def usar(self, aresta):
+        """
+        Coloca uma aresta no ciclo, unindo os fragmentos das suas pontas.
+        
+        Returns:
+            bool: False se a aresta está proibida, excede o grau 2 ou fecharia
+                  um subciclo
+        """
+        situacao = self.estado[aresta]
+        if situacao != ARESTA_LIVRE:
+            return situacao == ARESTA_USADA
+        u, v = self.origens[aresta], self.destinos[aresta]
+        usadas = self.usadas
+        if usadas[u] == 2 or usadas[v] == 2:
+            return False
+        outra_ponta = self.outra_ponta
+        a, b = outra_ponta[u], outra_ponta[v]
+        if a == v and self.num_usadas != self.num_vertices:
+            return False  # Subciclo: só a última aresta pode fechar o ciclo
+        
+        self.estado[aresta] = ARESTA_USADA
+        self.trilha.append(aresta)
+        usadas[u] += 1
+        usadas[v] += 1
+        self.num_usadas += 1
+        self.fila.append(u)
+        self.fila.append(v)
+        if a == v:
+            return True
+        
+        self.trilha.append((a, outra_ponta[a]))
+        self.trilha.append((b, outra_ponta[b]))
+        outra_ponta[a] = b
+        outra_ponta[b] = a
+        # A aresta entre as novas pontas fecharia um subciclo
+        if self.num_usadas < self.num_vertices:
+            fechamento = self._indice.get((a, b))
+            if fechamento is not None and fechamento != aresta and not self.proibir(fechamento):
+                return False
+        return True
+    
+    def proibir(self, aresta):
+        """
+        Exclui uma aresta do ciclo.
+        
+        Returns:
+            bool: False se a aresta já está em uso ou se alguma ponta fica
+                  com menos de duas arestas possíveis
+        """
+        situacao = self.estado[aresta]
+        if situacao != ARESTA_LIVRE:
+            return situacao == ARESTA_PROIBIDA
+        u, v = self.origens[aresta], self.destinos[aresta]
+        self.estado[aresta] = ARESTA_PROIBIDA
+        self.trilha.append(aresta)
+        possiveis = self.possiveis
+        possiveis[u] -= 1
+        possiveis[v] -= 1
+        self.fila.append(u)
+        self.fila.append(v)
+        return possiveis[u] >= 2 and possiveis[v] >= 2
+    
+    def propagar(self):
+        """
+        Aplica as regras de grau até não haver mais decisões forçadas.
+        
+        Returns:
+            bool: False se alguma contradição foi encontrada
+        """
+        fila = self.fila
+        estado = self.estado
+        while fila:
+            vertice = fila.pop()
+            usadas, possiveis = self.usadas[vertice], self.possiveis[vertice]
+            if possiveis < 2:
+                fila.clear()
+                return False
+            if usadas == 2 and possiveis > 2:
+                for aresta in self.incidentes[vertice]:
+                    if estado[aresta] == ARESTA_LIVRE and not self.proibir(aresta):
+                        fila.clear()
+                        return False
+            elif possiveis == 2 and usadas < 2:
+                for aresta in self.incidentes[vertice]:
+                    if estado[aresta] == ARESTA_LIVRE and not self.usar(aresta):
+                        fila.clear()
+                        return False
+        return True
+    
+    def desfazer(self, marca):
+        """
+        Desfaz as alterações feitas depois de marca, em ordem inversa.
+        """
+        trilha = self.trilha
+        while len(trilha) > marca:
+            item = trilha.pop()
+            if type(item) is tuple:
+                self.outra_ponta[item[0]] = item[1]
+                continue
+            u, v = self.origens[item], self.destinos[item]
+            if self.estado[item] == ARESTA_USADA:
+                self.usadas[u] -= 1
+                self.usadas[v] -= 1
+                self.num_usadas -= 1
+            else:
+                self.possiveis[u] += 1
+                self.possiveis[v] += 1
+            self.estado[item] = ARESTA_LIVRE
+        self.fila.clear()
+
+
+class CaminhoHamiltoniano:
+    """
+    Classe para encontrar Caminhos Hamiltonianos em grafos.
+    """
+    
+    def __init__(self, grafo, motor=MOTOR_BACKTRACKING, ordenacao=ORDENACAO_INDICE,
+                 semente=None, podas=(), pre_analise=True, estatisticas=False,
+                 callback_progresso=None, intervalo_progresso=10000,
+                 reinicios=REINICIOS_POSA, propagacao=False, decompor=False,
+                 memo_estados=None):
+        """
+        Inicializa o algoritmo com um grafo.
+        
+        Args:
+            grafo (Grafo): Instância do grafo a ser analisado
+            motor (str): Motor de busca usado por encontrar_caminho:
+                         'backtracking' (padrão), 'programacao_dinamica'
+                         (Held-Karp sobre máscaras de bits, O(2^n · n)) ou
+                         'posa' (heurística de rotações para grafos não
+                         orientados grandes; não prova inexistência) ou
+                         'bidirecional' (encontro no meio entre o início e
+                         uma ponta final única, para instâncias difíceis de
+                         20 a 28 vértices; sem as duas pontas fixas, usa a
+                         programação dinâmica)
+            ordenacao (str): Ordem em que o backtracking tenta os vizinhos:
+                             'indice' (padrão), 'warnsdorff' (menos vizinhos
+                             livres primeiro) ou 'aleatoria'
+            semente (int, optional): Semente da ordenação aleatória
+            podas (iterable ou bool): Regras de poda do backtracking, entre
+                                      'sem_vizinhos', 'extremidades' e
+                                      'desconexao'. True ativa todas.
+            pre_analise (bool): Se deve verificar condições necessárias em
+                                tempo polinomial antes da busca exponencial
+            estatisticas (bool): Se deve coletar EstatisticasBusca em
+                                 self.estatisticas. Desligadas, a busca só
+                                 conta os nós expandidos.
+            callback_progresso (callable, optional): Função chamada com as
+                                                     EstatisticasBusca a cada
+                                                     intervalo_progresso nós
+                                                     (implica estatisticas=True)
+            intervalo_progresso (int): Nós expandidos entre chamadas do callback
+            reinicios (int): Tentativas independentes do motor 'posa'
+            propagacao (bool): Se o backtracking deve propagar arestas
+                               forçadas e proibir subciclos (só em grafos
+                               não orientados; substitui as podas)
+            decompor (bool): Se encontrar_caminho deve separar o grafo em
+                             blocos biconexos e resolver cada bloco como um
+                             subproblema com pontas fixas (não se aplica ao
+                             motor 'posa' nem à busca por ciclo)
+            memo_estados (int ou bool, optional): Capacidade da tabela de
+                                                  estados mortos do
+                                                  backtracking (ver
+                                                  TabelaTransposicao); True
+                                                  usa MEMO_ESTADOS_PADRAO e
+                                                  None a desliga. Não se
+                                                  aplica com propagacao.
+        """
+        if motor not in MOTORES:
+            raise ValueError(f"Motor desconhecido: {motor} (opções: {', '.join(MOTORES)})")
+        if ordenacao not in ORDENACOES:
+            raise ValueError(f"Ordenação desconhecida: {ordenacao} "
+                             f"(opções: {', '.join(ORDENACOES)})")
+        if intervalo_progresso <= 0:
+            raise ValueError(f"Intervalo de progresso inválido: {intervalo_progresso}")
+        if reinicios <= 0:
+            raise ValueError(f"Número de reinícios inválido: {reinicios}")
+        if propagacao and grafo.orientado:
+            raise ValueError("A propagação de arestas forçadas só se aplica a grafos não orientados")
+        if memo_estados is True:
+            memo_estados = MEMO_ESTADOS_PADRAO
+        elif not memo_estados:
+            memo_estados = None
+        elif memo_estados < 0:
+            raise ValueError(f"Capacidade inválida da tabela de estados: {memo_estados}")
+        if decompor and motor == MOTOR_POSA:
+            raise ValueError("A decomposição em blocos exige pontas fixas, que o motor 'posa' não aceita")
+        if podas is True:
+            podas = PODAS
+        elif not podas:
+            podas = ()
+        for poda in podas:
+            if poda not in PODAS:
+                raise ValueError(f"Poda desconhecida: {poda} (opções: {', '.join(PODAS)})")
+        
+        self.grafo = grafo
+        self.motor = motor
+        self.ordenacao = ordenacao
+        self.semente = semente
+        self.podas = frozenset(podas)
+        self.pre_analise = pre_analise
+        self.reinicios = reinicios
+        self.propagacao = propagacao
+        self.decompor = decompor
+        self.memo_estados = memo_estados
+        # Tabela de estados mortos da última busca (TabelaTransposicao)
+        self.memo = None
+        # Instrumentação opcional (ver EstatisticasBusca)
+        self.coletar_estatisticas = estatisticas or callback_progresso is not None
+        self.callback_progresso = callback_progresso
+        self.intervalo_progresso = intervalo_progresso
+        self.estatisticas = None
+        # Código do motivo da última resposta negativa (ver analise.py)
+        self.motivo = None
+        self.caminho = []
+        self.visitados = [False] * grafo.num_vertices
+        # Situação e resultado estruturado da última busca
+        self.status = None
+        self.resultado = None
+        # Critério de parada externo, consultado periodicamente pela busca
+        self._verificar_parada = None
+        self._interrompido = False
+        # Orçamento da busca (ver _definir_orcamento)
+        self._prazo = None
+        self._limite_nos = None
+        self._inicio = time.perf_counter()
+        self._nos_expandidos = 0
+        self._maior_caminho = []
+        # Vértice inicial e contadores de alterações do grafo na última busca
+        self._certificado = None
+        self.modo_atualizacao = None
+        
+    def _preparar_busca(self):
+        """
+        Reinicia o estado da busca e guarda as listas de adjacência.
+        
+        As listas são obtidas uma única vez por chamada, em vez de uma vez
+        por nó expandido como na versão recursiva.
+        """
+        n = self.grafo.num_vertices
+        self.caminho = [-1] * n
+        self.visitados = [False] * n
+        self._adjacentes = [self.grafo.obter_adjacentes(v) for v in range(n)]
+        # Em GrafoBitset, a busca escolhe os vizinhos livres pelas próprias linhas de bits
+        self._mascaras = None
+        if isinstance(self.grafo, GrafoBitset):
+            self._mascaras = [self.grafo.mascara_adjacentes(v) for v in range(n)]
+        self._aleatorio = random.Random(self.semente)
+        self._interrompido = False
+        self._nos_expandidos = 0
+        self._maior_caminho = []
+        # Restrições opcionais da busca: vértices que podem encerrar o caminho
+        # e, para cada vértice, o gêmeo que precisa ser visitado antes dele
+        self._finais = None
+        self._gemeo_anterior = None
+        # Ponta final única, quando houver, e quem pode chegar a ela
+        self._alvo = None
+        self._entra_no_alvo = None
+        # Regra responsável pelo último estado descartado
+        self._ultima_poda = None
+        self._proximo_progresso = self.intervalo_progresso
+        # Os estados mortos valem para todos os inícios da mesma busca
+        self.memo = None
+        if self.memo_estados is not None and not self.propagacao:
+            self.memo = TabelaTransposicao(self.memo_estados)
+        if self.coletar_estatisticas:
+            self.estatisticas = EstatisticasBusca(n)
+            self._cpu_inicial = time.process_time()
+        
+        if self.podas:
+            # Listas de predecessores, necessárias para as contagens de entrada
+            if self.grafo.orientado:
+                self._predecessores = [[] for _ in range(n)]
+                for origem in range(n):
+                    for destino in self._adjacentes[origem]:
+                        self._predecessores[destino].append(origem)
+            else:
+                self._predecessores = self._adjacentes
+            self._marcas = [0] * n
+            self._carimbo = 0
+    
+    def _definir_orcamento(self, timeout=None, max_nos=None):
+        """
+        Define os limites de tempo e de nós expandidos da próxima busca.
+        
+        Args:
+            timeout (float, optional): Tempo máximo, em segundos
+            max_nos (int, optional): Número máximo de nós expandidos
+        """
+        self._inicio = time.perf_counter()
+        self._prazo = None if timeout is None else time.monotonic() + timeout
+        self._limite_nos = max_nos
+    
+    def _deve_parar(self):
+        """
+        Indica se a busca deve ser interrompida (orçamento esgotado ou parada externa).
+        
+        Returns:
+            bool: True se a busca deve parar
+        """
+        if self._limite_nos is not None and self._nos_expandidos >= self._limite_nos:
+            return True
+        if self._prazo is not None and time.monotonic() >= self._prazo:
+            return True
+        return self._verificar_parada is not None and self._verificar_parada()
+    
+    def _proxima_verificacao(self):
+        """
+        Calcula o número de nós expandidos em que a busca deve consultar _deve_parar.
+        
+        Returns:
+            int: Contagem de nós da próxima verificação
+        """
+        proxima = self._nos_expandidos + INTERVALO_VERIFICACAO
+        if self._limite_nos is not None:
+            proxima = min(proxima, self._limite_nos)
+        if self.callback_progresso is not None:
+            proxima = min(proxima, self._proximo_progresso)
+        return proxima
+    
+    def _notificar_progresso(self):
+        """
+        Chama o callback de progresso se o intervalo configurado foi atingido.
+        """
+        if self.callback_progresso is None or self._nos_expandidos < self._proximo_progresso:
+            return
+        while self._proximo_progresso <= self._nos_expandidos:
+            self._proximo_progresso += self.intervalo_progresso
+        self.estatisticas.nos_expandidos = self._nos_expandidos
+        self.estatisticas.tempo_parede = time.perf_counter() - self._inicio
+        self.estatisticas.tempo_cpu = time.process_time() - self._cpu_inicial
+        self.callback_progresso(self.estatisticas)
+    
+    def _configuracao(self):
+        """
+        Parâmetros de construção, usados para recriar o algoritmo em outros processos.
+        
+        Returns:
+            dict: Argumentos nomeados para CaminhoHamiltoniano
+        """
+        return {
+            'motor': self.motor,
+            'ordenacao': self.ordenacao,
+            'semente': self.semente,
+            'podas': tuple(self.podas),
+            'pre_analise': self.pre_analise,
+            'reinicios': self.reinicios,
+            'propagacao': self.propagacao,
+            'decompor': self.decompor,
+            'memo_estados': self.memo_estados,
+        }
+    
+    def _candidatos(self, vertice, mascara=None):
+        """
+        Iterador sobre os vizinhos de um vértice na ordem configurada.
+        
+        Com GrafoBitset, os vizinhos livres saem de uma única operação sobre
+        a linha do vértice (linha & ~visitados), sem percorrer a lista.
+        
+        Args:
+            vertice (int): Vértice cujos vizinhos serão tentados
+            mascara (int, optional): Máscara dos vértices visitados, usada
+                                     com as linhas de bits de GrafoBitset
+            
+        Returns:
+            iterator: Vizinhos a tentar, na ordem de tentativa
+        """
+        gemeo_anterior = self._gemeo_anterior
+        mascaras = self._mascaras if mascara is not None else None
+        if mascaras is not None:
+            # Os visitados não mudam entre tentativas irmãs, então filtrar aqui é exato
+            livres = _vertices_da_mascara(mascaras[vertice] & ~mascara)
+            if self.ordenacao == ORDENACAO_INDICE and gemeo_anterior is None:
+                return iter(livres)
+        elif self.ordenacao == ORDENACAO_INDICE and gemeo_anterior is None:
+            return iter(self._adjacentes[vertice])
+        else:
+            livres = [v for v in self._adjacentes[vertice] if not self.visitados[v]]
+        
+        visitados = self.visitados
+        if gemeo_anterior is not None:
+            # Gêmeos entram no caminho em ordem crescente de índice
+            livres = [v for v in livres
+                      if gemeo_anterior[v] < 0 or visitados[gemeo_anterior[v]]]
+        if self.ordenacao == ORDENACAO_ALEATORIA:
+            self._aleatorio.shuffle(livres)
+        elif self.podas:
+            # Regra de Warnsdorff usando as contagens de saída mantidas pelas podas
+            livres.sort(key=self._saida.__getitem__)
+        elif mascaras is not None:
+            livres.sort(key=lambda v: bin(mascaras[v] & ~mascara).count('1'))
+        else:
+            adjacentes = self._adjacentes
+            livres.sort(key=lambda v: sum(1 for w in adjacentes[v] if not visitados[w]))
+        return iter(livres)
+    
+    def _forcado(self, vertice):
+        """
+        Indica se um vértice não visitado só pode ser a última ponta do caminho.
+        
+        Em grafos orientados isso ocorre quando ele não tem sucessores livres;
+        em não orientados, quando ele tem no máximo uma aresta utilizável
+        (para a ponta atual ou para vértices livres).
+        """
+        if self.grafo.orientado:
+            return self._saida[vertice] == 0
+        return self._entrada[vertice] <= 1
+    
+    def _iniciar_podas(self, vertice_inicial):
+        """
+        Calcula as contagens usadas pelas podas para um novo vértice inicial.
+        
+        Para cada vértice livre w, _entrada[w] conta por onde o caminho ainda
+        pode chegar a w (predecessores livres mais a ponta atual) e _saida[w]
+        conta para onde ele pode seguir (sucessores livres).
+        
+        Args:
+            vertice_inicial (int): Vértice inicial, já marcado como visitado
+            
+        Returns:
+            bool: False se o estado inicial já viola alguma regra de poda
+        """
+        n = self.grafo.num_vertices
+        self._entrada = [len(self._predecessores[v]) for v in range(n)]
+        self._saida = [len(self._adjacentes[v]) for v in range(n)]
+        for vertice in self._predecessores[vertice_inicial]:
+            self._saida[vertice] -= 1
+        
+        self._num_forcados = 0
+        entradas_ok = True
+        for vertice in range(n):
+            if vertice != vertice_inicial:
+                if self._forcado(vertice):
+                    self._num_forcados += 1
+                if self._entrada[vertice] == 0:
+                    entradas_ok = False
+        return self._estado_viavel(vertice_inicial, n - 1, entradas_ok)
+    
+    def _estado_viavel(self, ponta, restantes, entradas_ok):
+        """
+        Aplica as regras de poda ativas ao estado atual da busca.
+        
+        Args:
+            ponta (int): Vértice na ponta atual do caminho
+            restantes (int): Número de vértices ainda não visitados
+            entradas_ok (bool): False se algum vértice livre ficou sem entrada
+            
+        Returns:
+            bool: False se o estado não pode levar a um caminho hamiltoniano
+        """
+        if restantes == 0:
+            return True
+        if PODA_SEM_VIZINHOS in self.podas and not entradas_ok:
+            self._ultima_poda = PODA_SEM_VIZINHOS
+            return False
+        if PODA_EXTREMIDADES in self.podas and self._num_forcados > 1:
+            self._ultima_poda = PODA_EXTREMIDADES
+            return False
+        if PODA_DESCONEXAO in self.podas and not self._alcanca_todos(ponta, restantes):
+            self._ultima_poda = PODA_DESCONEXAO
+            return False
+        return True
+    
+    def _alcanca_todos(self, ponta, restantes):
+        """
+        Verifica se todos os vértices livres são alcançáveis a partir da ponta
+        passando apenas por vértices livres.
+        """
+        self._carimbo += 1
+        carimbo = self._carimbo
+        marcas = self._marcas
+        visitados = self.visitados
+        adjacentes = self._adjacentes
+        
+        alcancados = 0
+        fila = [ponta]
+        for vertice in fila:
+            for vizinho in adjacentes[vertice]:
+                if not visitados[vizinho] and marcas[vizinho] != carimbo:
+                    marcas[vizinho] = carimbo
+                    alcancados += 1
+                    fila.append(vizinho)
+        return alcancados == restantes
+    
+    def _avancar(self, anterior, vertice, restantes):
+        """
+        Atualiza as contagens das podas quando o caminho avança de anterior para vertice.
+        
+        Só os sucessores livres da ponta anterior perdem uma entrada (deixam de
+        ser vizinhos da ponta) e só os predecessores livres do novo vértice
+        perdem uma saída. Os sucessores de vertice trocam um predecessor livre
+        pela ponta, sem alteração líquida.
+        
+        Args:
+            anterior (int): Ponta anterior do caminho
+            vertice (int): Nova ponta, já marcada como visitada
+            restantes (int): Número de vértices ainda não visitados
+            
+        Returns:
+            bool: False se o novo estado pode ser podado
+        """
+        visitados = self.visitados
+        entrada = self._entrada
+        saida = self._saida
+        entradas_ok = True
+        
+        if self._forcado(vertice):
+            self._num_forcados -= 1
+        
+        for w in self._adjacentes[anterior]:
+            if not visitados[w]:
+                forcado = self._forcado(w)
+                entrada[w] -= 1
+                if entrada[w] == 0:
+                    entradas_ok = False
+                if self._forcado(w) != forcado:
+                    self._num_forcados += -1 if forcado else 1
+        
+        for w in self._predecessores[vertice]:
+            if not visitados[w]:
+                forcado = self._forcado(w)
+                saida[w] -= 1
+                if self._forcado(w) != forcado:
+                    self._num_forcados += -1 if forcado else 1
+        
+        return self._estado_viavel(vertice, restantes, entradas_ok)
+    
+    def _recuar(self, anterior, vertice):
+        """
+        Desfaz as atualizações de _avancar (vertice ainda marcado como visitado).
+        
+        Args:
+            anterior (int): Ponta anterior do caminho
+            vertice (int): Ponta sendo removida do caminho
+        """
+        visitados = self.visitados
+        entrada = self._entrada
+        saida = self._saida
+        
+        for w in self._predecessores[vertice]:
+            if not visitados[w]:
+                forcado = self._forcado(w)
+                saida[w] += 1
+                if self._forcado(w) != forcado:
+                    self._num_forcados += -1 if forcado else 1
+        
+        for w in self._adjacentes[anterior]:
+            if not visitados[w]:
+                forcado = self._forcado(w)
+                entrada[w] += 1
+                if self._forcado(w) != forcado:
+                    self._num_forcados += -1 if forcado else 1
+        
+        if self._forcado(vertice):
+            self._num_forcados += 1
+    
+    def _gerar_caminhos(self, vertice_inicial):
+        """
+        Backtracking iterativo que gera os caminhos hamiltonianos a partir de um vértice.
+        
+        A recursão foi substituída por uma pilha explícita de iteradores sobre
+        os vizinhos: o topo da pilha guarda de onde continuar no vértice da
+        posição atual. Não há limite de profundidade (grafos com milhares de
+        vértices não esbarram no limite de recursão do Python) nem custo de
+        criação de quadros de função por nó.
+        
+        Se self._finais estiver definido, só são aceitos caminhos que terminam
+        em um vértice marcado, e a busca recua assim que todos os vértices
+        marcados já foram usados antes do fim. Com uma única ponta final
+        (self._alvo), a busca também recua quando o último predecessor livre
+        dela é usado antes da penúltima posição: o alvo ficaria inalcançável.
+        
+        Com a tabela de estados mortos (self.memo), cada estado cuja subárvore
+        foi esgotada sem produzir caminho é registrado ao recuar, e um vizinho
+        que levaria a um estado registrado nem chega a ser expandido. Estados
+        com menos de três vértices livres não são registrados: refazê-los é
+        mais barato que consultá-los. Uma busca interrompida não registra os
+        estados que deixou pela metade.
+        
+        O caminho gerado é o próprio self.caminho; quem precisar guardá-lo
+        deve copiá-lo antes de pedir o próximo.
+        
+        Args:
+            vertice_inicial (int): Vértice onde o caminho deve começar
+            
+        Yields:
+            list: Caminho hamiltoniano completo (self.caminho)
+        """
+        if self.propagacao:
+            yield from self._gerar_caminhos_propagando(vertice_inicial)
+            return
+        
+        n = self.grafo.num_vertices
+        visitados = self.visitados
+        caminho = self.caminho
+        podas = bool(self.podas)
+        finais = self._finais
+        nos = self._nos_expandidos
+        proxima_verificacao = self._proxima_verificacao()
+        # Com as estatísticas desligadas, o custo extra é um teste de None por nó
+        estatisticas = self.estatisticas if self.coletar_estatisticas else None
+        # Máscara dos visitados (tabela de estados mortos e GrafoBitset) e
+        # maior posição com caminho na subárvore
+        memo = self.memo
+        com_mascara = memo is not None or self._mascaras is not None
+        mascara = 1 << vertice_inicial
+        vivos = -1
+        ultima_registrada = n - 3
+        
+        # A ordem aleatória depende só da semente e do início, como na busca paralela
+        if self.semente is not None:
+            self._aleatorio = random.Random(f"{self.semente}:{vertice_inicial}")
+        
+        # Marca o vértice inicial como visitado
+        visitados[vertice_inicial] = True
+        caminho[0] = vertice_inicial
+        if not self._maior_caminho:
+            self._maior_caminho = [vertice_inicial]
+        maior_posicao = len(self._maior_caminho) - 1
+        
+        if n == 1:
+            if finais is None or finais[vertice_inicial]:
+                yield caminho
+            visitados[vertice_inicial] = False
+            caminho[0] = -1
+            return
+        
+        # Quantos vértices livres ainda podem encerrar o caminho
+        finais_livres = 0
+        if finais is not None:
+            finais_livres = sum(1 for v in range(n) if finais[v] and v != vertice_inicial)
+        
+        # Quantos vértices livres ainda podem preceder a ponta final única
+        alvo = self._alvo
+        entra_no_alvo = self._entra_no_alvo
+        reserva = 0
+        if alvo is not None:
+            reserva = sum(1 for v in range(n) if entra_no_alvo[v] and v != vertice_inicial)
+        
+        if ((finais is not None and finais_livres == 0)
+                or (alvo is not None and reserva == 0 and n > 2)
+                or (podas and not self._iniciar_podas(vertice_inicial))):
+            visitados[vertice_inicial] = False
+            caminho[0] = -1
+            return
+        
+        posicao = 0
+        pilha = [self._candidatos(vertice_inicial, mascara)]
+        while pilha:
+            # Próximo vizinho não visitado do vértice no topo da pilha
+            for proximo_vertice in pilha[-1]:
+                if not visitados[proximo_vertice]:
+                    break
+            else:
+                # Backtrack: vizinhos esgotados, desfaz a escolha atual
+                pilha.pop()
+                if estatisticas is not None:
+                    estatisticas.retrocessos += 1
+                vertice = caminho[posicao]
+                if memo is not None:
+                    if posicao > vivos:
+                        if 0 < posicao <= ultima_registrada:
+                            memo.registrar(mascara, vertice)
+                    else:
+                        vivos = posicao - 1
+                if com_mascara:
+                    mascara ^= 1 << vertice
+                if posicao > 0:
+                    if podas:
+                        self._recuar(caminho[posicao - 1], vertice)
+                    if finais is not None and finais[vertice]:
+                        finais_livres += 1
+                    if alvo is not None and entra_no_alvo[vertice]:
+                        reserva += 1
+                visitados[vertice] = False
+                caminho[posicao] = -1
+                posicao -= 1
+                continue
+            
+            if com_mascara:
+                if (memo is not None and posicao < ultima_registrada
+                        and memo.contem(mascara | 1 << proximo_vertice, proximo_vertice)):
+                    continue
+                mascara |= 1 << proximo_vertice
+            
+            posicao += 1
+            visitados[proximo_vertice] = True
+            caminho[posicao] = proximo_vertice
+            
+            nos += 1
+            if estatisticas is not None:
+                estatisticas.nos_por_profundidade[posicao] += 1
+            if nos >= proxima_verificacao:
+                self._nos_expandidos = nos
+                if self._deve_parar():
+                    self._interrompido = True
+                    return
+                self._notificar_progresso()
+                proxima_verificacao = self._proxima_verificacao()
+            
+            if posicao > maior_posicao:
+                # Melhor resposta parcial até agora, caso o orçamento se esgote
+                maior_posicao = posicao
+                self._maior_caminho = caminho[:posicao + 1]
+            
+            # Se visitamos todos os vértices, encontramos um caminho hamiltoniano
+            if posicao == n - 1:
+                if finais is None or finais[proximo_vertice]:
+                    self._nos_expandidos = nos
+                    vivos = posicao - 1
+                    yield caminho
+                if com_mascara:
+                    mascara ^= 1 << proximo_vertice
+                visitados[proximo_vertice] = False
+                caminho[posicao] = -1
+                posicao -= 1
+                continue
+            
+            viavel = True
+            if finais is not None and finais[proximo_vertice]:
+                # Um vértice final usado no meio do caminho não pode mais encerrá-lo
+                finais_livres -= 1
+                viavel = finais_livres > 0
+                self._ultima_poda = PODA_FINAIS
+            if alvo is not None and entra_no_alvo[proximo_vertice]:
+                # O último predecessor livre do alvo só pode vir logo antes dele
+                reserva -= 1
+                if reserva == 0 and posicao < n - 2:
+                    viavel = False
+                    self._ultima_poda = PODA_FINAIS
+            if podas and viavel:
+                viavel = self._avancar(caminho[posicao - 1], proximo_vertice, n - 1 - posicao)
+                if not viavel:
+                    self._recuar(caminho[posicao - 1], proximo_vertice)
+            
+            if viavel:
+                pilha.append(self._candidatos(proximo_vertice, mascara))
+            else:
+                # Poda: o novo estado não pode levar a um caminho hamiltoniano
+                if estatisticas is not None:
+                    estatisticas.podas[self._ultima_poda] += 1
+                if finais is not None and finais[proximo_vertice]:
+                    finais_livres += 1
+                if alvo is not None and entra_no_alvo[proximo_vertice]:
+                    reserva += 1
+                if com_mascara:
+                    mascara ^= 1 << proximo_vertice
+                visitados[proximo_vertice] = False
+                caminho[posicao] = -1
+                posicao -= 1
+        
+        self._nos_expandidos = nos
+    
+    def _gerar_caminhos_propagando(self, vertice_inicial):
+        """
+        Backtracking iterativo com propagação de arestas forçadas.
+        
+        Cada avanço do caminho usa uma aresta em _PropagacaoArestas e propaga
+        suas consequências: vértices que ficam com duas arestas possíveis
+        passam a ter as duas forçadas, e arestas que fechariam subciclos são
+        proibidas. Quando a ponta tem uma aresta forçada para um vértice
+        livre, só ela é tentada. Ao recuar, a trilha desfaz tudo o que foi
+        decidido depois do avanço.
+        
+        As restrições de vértice final (self._finais) viram arestas proibidas
+        entre o vértice virtual e os vértices que não podem encerrar o caminho.
+        
+        Args:
+            vertice_inicial (int): Vértice onde o caminho deve começar
+            
+        Yields:
+            list: Caminho hamiltoniano completo (self.caminho)
+        """
+        n = self.grafo.num_vertices
+        visitados = self.visitados
+        caminho = self.caminho
+        finais = self._finais
+        nos = self._nos_expandidos
+        proxima_verificacao = self._proxima_verificacao()
+        estatisticas = self.estatisticas if self.coletar_estatisticas else None
+        
+        if self.semente is not None:
+            self._aleatorio = random.Random(f"{self.semente}:{vertice_inicial}")
+        
+        visitados[vertice_inicial] = True
+        caminho[0] = vertice_inicial
+        if not self._maior_caminho:
+            self._maior_caminho = [vertice_inicial]
+        maior_posicao = len(self._maior_caminho) - 1
+        
+        if n == 1:
+            if finais is None or finais[vertice_inicial]:
+                yield caminho
+            visitados[vertice_inicial] = False
+            caminho[0] = -1
+            return
+        
+        # O início é uma ponta: sua aresta para o vértice virtual é usada, e só
+        # os vértices finais permitidos podem ter a outra
+        rede = _PropagacaoArestas(self._adjacentes)
+        viavel = rede.usar(rede.virtuais[vertice_inicial])
+        if finais is not None:
+            for vertice in range(n):
+                if viavel and vertice != vertice_inicial and not finais[vertice]:
+                    viavel = rede.proibir(rede.virtuais[vertice])
+        if not (viavel and rede.propagar()):
+            visitados[vertice_inicial] = False
+            caminho[0] = -1
+            return
+        
+        posicao = 0
+        # Marca da trilha antes do avanço para cada posição do caminho
+        marcas = [0] * n
+        pilha = [self._candidatos_propagacao(rede, vertice_inicial)]
+        while pilha:
+            for proximo_vertice in pilha[-1]:
+                if not visitados[proximo_vertice]:
+                    break
+            else:
+                pilha.pop()
+                if estatisticas is not None:
+                    estatisticas.retrocessos += 1
+                if posicao > 0:
+                    rede.desfazer(marcas[posicao])
+                vertice = caminho[posicao]
+                visitados[vertice] = False
+                caminho[posicao] = -1
+                posicao -= 1
+                continue
+            
+            marca = rede.marca()
+            viavel = (rede.usar(rede.aresta(caminho[posicao], proximo_vertice))
+                      and rede.propagar())
+            nos += 1
+            if nos >= proxima_verificacao:
+                self._nos_expandidos = nos
+                if self._deve_parar():
+                    self._interrompido = True
+                    return
+                self._notificar_progresso()
+                proxima_verificacao = self._proxima_verificacao()
+            if not viavel:
+                # Contradição: o avanço não pode levar a um caminho hamiltoniano
+                rede.desfazer(marca)
+                if estatisticas is not None:
+                    estatisticas.podas[PODA_PROPAGACAO] += 1
+                continue
+            
+            posicao += 1
+            marcas[posicao] = marca
+            visitados[proximo_vertice] = True
+            caminho[posicao] = proximo_vertice
+            if estatisticas is not None:
+                estatisticas.nos_por_profundidade[posicao] += 1
+            if posicao > maior_posicao:
+                maior_posicao = posicao
+                self._maior_caminho = caminho[:posicao + 1]
+            
+            if posicao == n - 1:
+                # A propagação já garante que a última ponta pode encerrar o caminho
+                self._nos_expandidos = nos
+                yield caminho
+                rede.desfazer(marca)
+                visitados[proximo_vertice] = False
+                caminho[posicao] = -1
+                posicao -= 1
+                continue
+            
+            pilha.append(self._candidatos_propagacao(rede, proximo_vertice))
+        
+        self._nos_expandidos = nos
+    
+    def _candidatos_propagacao(self, rede, vertice):
+        """
+        Vizinhos livres que a ponta pode tentar, segundo a propagação.
+        
+        Args:
+            rede (_PropagacaoArestas): Estado atual das arestas
+            vertice (int): Ponta atual do caminho
+            
+        Returns:
+            iterator: Vizinhos a tentar, na ordem de tentativa
+        """
+        n = self.grafo.num_vertices
+        visitados = self.visitados
+        estado = rede.estado
+        forcados, livres = [], []
+        for aresta in rede.incidentes[vertice]:
+            vizinho = rede.origens[aresta] + rede.destinos[aresta] - vertice
+            if vizinho == n or visitados[vizinho]:
+                continue
+            if estado[aresta] == ARESTA_USADA:
+                forcados.append(vizinho)
+            elif estado[aresta] == ARESTA_LIVRE:
+                livres.append(vizinho)
+        if forcados:
+            # A ponta já tem uma aresta forçada para um vértice livre
+            return iter(forcados)
+        
+        gemeo_anterior = self._gemeo_anterior
+        if gemeo_anterior is not None:
+            livres = [v for v in livres
+                      if gemeo_anterior[v] < 0 or visitados[gemeo_anterior[v]]]
+        if self.ordenacao == ORDENACAO_ALEATORIA:
+            self._aleatorio.shuffle(livres)
+        elif self.ordenacao == ORDENACAO_WARNSDORFF:
+            livres.sort(key=rede.possiveis.__getitem__)
+        else:
+            livres.sort()
+        return iter(livres)
+    
+    def _backtrack(self, vertice_inicial):
+        """
+        Algoritmo de backtracking para encontrar o caminho hamiltoniano.
+        
+        Ao retornar True, self.caminho contém o caminho encontrado.
+        
+        Args:
+            vertice_inicial (int): Vértice onde o caminho deve começar
+            
+        Returns:
+            bool: True se encontrou um caminho hamiltoniano, False caso contrário
+        """
+        return next(self._gerar_caminhos(vertice_inicial), None) is not None
+    
+    def _programacao_dinamica(self, vertice_inicial=None):
+        """
+        Programação dinâmica de Held-Karp sobre subconjuntos de vértices.
+        
+        Para cada máscara de vértices visitados guarda outra máscara com os
+        vértices em que um caminho simples cobrindo exatamente aquele conjunto
+        pode terminar. As máscaras são processadas em ordem crescente, de modo
+        que todo subconjunto é finalizado antes de seus superconjuntos. O
+        caminho é reconstruído de trás para frente: o pai de (máscara, v) é
+        qualquer ponta u de (máscara sem v) com aresta u -> v.
+        
+        Tempo O(2^n · n) e memória O(2^n), independentemente da estrutura
+        do grafo. Com self._finais, só as pontas marcadas encerram o caminho;
+        com uma ponta final única, ela só entra no subconjunto completo.
+        
+        Args:
+            vertice_inicial (int, optional): Vértice onde o caminho deve começar.
+                                           Se None, qualquer vértice pode iniciar.
+            
+        Returns:
+            bool: True se encontrou um caminho hamiltoniano, False caso contrário
+        """
+        n = self.grafo.num_vertices
+        if n > LIMITE_VERTICES_PD:
+            raise ValueError(f"Programação dinâmica limitada a {LIMITE_VERTICES_PD} vértices "
+                             f"(grafo tem {n})")
+        if n == 0:
+            return False
+        
+        # Máscaras de sucessores e predecessores de cada vértice
+        sucessores = [self.grafo.mascara_adjacentes(v) for v in range(n)]
+        predecessores = [0] * n
+        for origem in range(n):
+            for destino in _vertices_da_mascara(sucessores[origem]):
+                predecessores[destino] |= 1 << origem
+        
+        completo = (1 << n) - 1
+        finais = completo
+        if self._finais is not None:
+            finais = sum(1 << v for v in range(n) if self._finais[v])
+        # Bit do alvo, que nenhum subconjunto incompleto pode ter como ponta
+        reservado = 0 if self._alvo is None else 1 << self._alvo
+        # O orçamento é consultado antes de alocar a tabela de 2^n entradas; um
+        # limite de nós menor que o número de subconjuntos nunca seria suficiente
+        if self._deve_parar() or (self._limite_nos is not None
+                                  and self._limite_nos < completo - 1):
+            self._interrompido = True
+            return False
+        pontas = array('I', [0]) * (1 << n)
+        inicios = range(n) if vertice_inicial is None else [vertice_inicial]
+        for vertice in inicios:
+            if n == 1 or 1 << vertice != reservado:
+                pontas[1 << vertice] = 1 << vertice
+        
+        for mascara in range(1, completo):
+            # Consulta o orçamento a cada 4096 subconjuntos (cada um conta como um nó)
+            if not mascara & 0xFFF:
+                self._nos_expandidos = mascara
+                if self._deve_parar():
+                    self._interrompido = True
+                    return False
+                self._notificar_progresso()
+            
+            atuais = pontas[mascara]
+            if not atuais:
+                continue
+            
+            # União dos sucessores de todas as pontas possíveis
+            alcancaveis = 0
+            while atuais:
+                bit = atuais & -atuais
+                alcancaveis |= sucessores[bit.bit_length() - 1]
+                atuais ^= bit
+            
+            # Cada sucessor ainda não visitado estende o subconjunto
+            alcancaveis &= ~mascara
+            if mascara | reservado != completo:
+                alcancaveis &= ~reservado
+            while alcancaveis:
+                bit = alcancaveis & -alcancaveis
+                pontas[mascara | bit] |= bit
+                alcancaveis ^= bit
+        
+        if not pontas[completo] & finais:
+            return False
+        
+        # Reconstrução pelos ponteiros implícitos, sempre escolhendo o menor índice
+        mascara = completo
+        candidatos = pontas[completo] & finais
+        for posicao in range(n - 1, -1, -1):
+            vertice = (candidatos & -candidatos).bit_length() - 1
+            self.caminho[posicao] = vertice
+            self.visitados[vertice] = True
+            mascara ^= 1 << vertice
+            candidatos = pontas[mascara] & predecessores[vertice]
+        
+        return True
+    
+    def _bidirecional(self, vertice_inicial=None):
+        """
+        Busca bidirecional com encontro no meio entre duas pontas fixas.
+        
+        Só se aplica quando o caminho tem início fixo e ponta final única
+        (self._alvo), como em resolver(v, vertice_final=w) ou num ciclo cujo
+        início tem um só predecessor aceito. Nos demais casos a busca é
+        delegada à programação dinâmica, com o limite LIMITE_VERTICES_PD.
+        
+        Duas fronteiras avançam em sentidos opostos. A da frente parte do
+        início e guarda, para cada máscara de vértices visitados, as pontas em
+        que um caminho cobrindo a máscara pode terminar (como no Held-Karp); a
+        de trás parte do alvo e guarda os vértices em que um caminho cobrindo
+        a máscara até o alvo pode começar. A cada passo avança o lado com
+        menos estados, e só a camada atual de cada lado é mantida. Quando as
+        profundidades somam n, um caminho hamiltoniano é um estado de trás
+        junto com o estado da frente de máscara complementar, desde que alguma
+        ponta da frente tenha aresta para um começo de trás. As duas metades
+        do caminho são então refeitas por _caminho_na_mascara, cada uma
+        restrita à sua máscara.
+        
+        Cada fronteira tem no máximo C(n - 2, n/2 - 1) máscaras, contra as 2^n
+        da programação dinâmica, e o orçamento de nós conta os estados
+        expandidos. O motor vale a pena entre uns 20 e 28 vértices, em
+        instâncias difíceis (poucos caminhos ou nenhum) e não muito densas:
+        abaixo disso a programação dinâmica é igualmente rápida, e com 28
+        vértices as fronteiras já ocupam centenas de megabytes (em grafos
+        densos, alguns gigabytes). Em grafos com muitos caminhos, o
+        backtracking costuma achar um bem antes da junção.
+        
+        Args:
+            vertice_inicial (int, optional): Vértice onde o caminho deve começar.
+                                           Se None, a busca é feita pela
+                                           programação dinâmica.
+            
+        Returns:
+            bool: True se encontrou um caminho hamiltoniano, False caso contrário
+        """
+        alvo = self._alvo
+        if vertice_inicial is None or alvo is None:
+            return self._programacao_dinamica(vertice_inicial)
+        n = self.grafo.num_vertices
+        if n == 1:
+            self.caminho[0] = 0
+            self.visitados[0] = True
+            return True
+        if alvo == vertice_inicial:
+            return False
+        
+        # Máscaras de sucessores e predecessores de cada vértice (sem laços)
+        sucessores = [self.grafo.mascara_adjacentes(v) & ~(1 << v) for v in range(n)]
+        predecessores = [0] * n
+        for origem in range(n):
+            for destino in _vertices_da_mascara(sucessores[origem]):
+                predecessores[destino] |= 1 << origem
+        
+        # O alvo nunca está na frente, e o início nunca está atrás
+        completo = (1 << n) - 1
+        inicio, fim = 1 << vertice_inicial, 1 << alvo
+        frente, profundidade_frente = {inicio: inicio}, 1
+        tras, profundidade_tras = {fim: fim}, 1
+        nos = 2
+        proxima_verificacao = self._proxima_verificacao()
+        
+        while profundidade_frente + profundidade_tras < n:
+            # Avança o lado com a menor fronteira
+            avanca_frente = len(frente) <= len(tras)
+            if avanca_frente:
+                camada, vizinhos, proibidos = frente, sucessores, fim
+            else:
+                camada, vizinhos, proibidos = tras, predecessores, inicio
+            nova = {}
+            for mascara, pontas in camada.items():
+                alcancaveis = 0
+                while pontas:
+                    bit = pontas & -pontas
+                    alcancaveis |= vizinhos[bit.bit_length() - 1]
+                    pontas ^= bit
+                alcancaveis &= completo & ~mascara & ~proibidos
+                while alcancaveis:
+                    bit = alcancaveis & -alcancaveis
+                    nova[mascara | bit] = nova.get(mascara | bit, 0) | bit
+                    alcancaveis ^= bit
+                
+                nos += 1
+                if nos >= proxima_verificacao:
+                    self._nos_expandidos = nos
+                    if self._deve_parar():
+                        self._interrompido = True
+                        return False
+                    self._notificar_progresso()
+                    proxima_verificacao = self._proxima_verificacao()
+            if not nova:
+                self._nos_expandidos = nos
+                return False
+            if avanca_frente:
+                frente, profundidade_frente = nova, profundidade_frente + 1
+            else:
+                tras, profundidade_tras = nova, profundidade_tras + 1
+        self._nos_expandidos = nos
+        
+        # Junção: estado de trás com o estado da frente de máscara complementar
+        for mascara_tras, primeiros in tras.items():
+            mascara_frente = completo ^ mascara_tras
+            ultimos = frente.get(mascara_frente, 0)
+            while ultimos and primeiros:
+                bit = primeiros & -primeiros
+                primeiros ^= bit
+                ligacoes = ultimos & predecessores[bit.bit_length() - 1]
+                if ligacoes:
+                    ponta = (ligacoes & -ligacoes).bit_length() - 1
+                    caminho = (_caminho_na_mascara(vertice_inicial, ponta, mascara_frente,
+                                                   sucessores, predecessores)
+                               + _caminho_na_mascara(alvo, bit.bit_length() - 1, mascara_tras,
+                                                     predecessores, sucessores)[::-1])
+                    for posicao, vertice in enumerate(caminho):
+                        self.caminho[posicao] = vertice
+                        self.visitados[vertice] = True
+                    return True
+        return False
+    
+    def _posa(self, vertice_inicial=None):
         """
-        Inicializa o grafo.
+        Heurística aleatória de extensões e rotações de Pósa.
+        
+        O caminho cresce pela ponta final, sempre para o vizinho livre com
+        menos vizinhos livres (regra de Warnsdorff, que evita deixar vértices
+        encurralados para o fim). Quando a ponta v não tem vizinhos livres,
+        o caminho é invertido se a outra ponta tiver (sem vértice inicial
+        fixo) ou sofre uma rotação de Pósa: se v é vizinha de caminho[i], o
+        trecho caminho[i+1:] é invertido e caminho[i+1] vira a nova ponta. Dá-se
+        preferência à rotação mais curta cuja nova ponta tenha vizinho livre;
+        sem nenhuma assim, a rotação é sorteada. Depois de n rotações sem
+        crescimento, a tentativa recomeça, até self.reinicios tentativas.
+        
+        Os graus livres são atualizados a cada vértice visitado, de modo que
+        as extensões custam O(V + E) por tentativa. Com NumPy, as inversões
+        são feitas em bloco.
+        
+        Não prova inexistência: se nenhuma tentativa completar o caminho, a
+        busca termina como orçamento esgotado.
         
         Args:
-            num_vertices (int): Número de vértices no grafo
-            orientado (bool): True se o grafo for orientado, False caso contrário
+            vertice_inicial (int, optional): Vértice onde o caminho deve começar.
+                                           Se None, as tentativas começam por
+                                           vértices de grau mínimo.
+        
+        Returns:
+            bool: True se encontrou um caminho hamiltoniano, False caso contrário
+        
+        Raises:
+            ValueError: Se o grafo for orientado (as rotações exigem arestas
+                        nos dois sentidos)
         """
-        self.num_vertices = num_vertices
-        self.orientado = orientado
-        # Matriz de adjacência para representar o grafo
-        self.matriz_adj = [[False for _ in range(num_vertices)] 
-                          for _ in range(num_vertices)]
+        if self.grafo.orientado:
+            raise ValueError("O motor 'posa' só se aplica a grafos não orientados")
+        if self._finais is not None:
+            raise ValueError("O motor 'posa' não aceita vertice_final nem ciclo")
+        n = self.grafo.num_vertices
+        if n == 0:
+            return False
         
-    def adicionar_aresta(self, origem, destino):
+        adjacentes = [[w for w in lista if w != v] if v in lista else lista
+                      for v, lista in enumerate(self._adjacentes)]
+        graus = [len(lista) for lista in adjacentes]
+        if vertice_inicial is not None:
+            inicios = [vertice_inicial]
+        else:
+            # Vértices de grau mínimo (os de grau 1, por exemplo) só podem ser pontas
+            grau_minimo = min(graus)
+            inicios = [v for v in range(n) if graus[v] == grau_minimo]
+        aleatorio = self._aleatorio
+        nos = self._nos_expandidos
+        proxima_verificacao = self._proxima_verificacao()
+        
+        for _ in range(self.reinicios):
+            # Vizinhos ainda fora do caminho de cada vértice
+            livres = graus.copy()
+            visitados = [False] * n
+            if np is not None:
+                caminho = np.full(n, -1, dtype=np.int64)
+                posicao = np.full(n, -1, dtype=np.int64)
+            else:
+                caminho = [-1] * n
+                posicao = [-1] * n
+            
+            def visitar(vertice, indice):
+                caminho[indice] = vertice
+                posicao[vertice] = indice
+                visitados[vertice] = True
+                for vizinho in adjacentes[vertice]:
+                    livres[vizinho] -= 1
+            
+            def inverter(inicio, fim):
+                """Inverte caminho[inicio:fim], atualizando as posições."""
+                if np is not None:
+                    trecho = caminho[inicio:fim][::-1].copy()
+                    caminho[inicio:fim] = trecho
+                    posicao[trecho] = np.arange(inicio, fim)
+                else:
+                    trecho = caminho[inicio:fim]
+                    trecho.reverse()
+                    caminho[inicio:fim] = trecho
+                    for indice, vertice in enumerate(trecho, inicio):
+                        posicao[vertice] = indice
+            
+            visitar(aleatorio.choice(inicios), 0)
+            tamanho = 1
+            sem_progresso = 0
+            while tamanho < n:
+                nos += 1
+                if nos >= proxima_verificacao:
+                    self._nos_expandidos = nos
+                    if self._deve_parar():
+                        self._interrompido = True
+                        return False
+                    self._notificar_progresso()
+                    proxima_verificacao = self._proxima_verificacao()
+                
+                ponta = int(caminho[tamanho - 1])
+                vizinhos = adjacentes[ponta]
+                escolhido, menor = -1, n
+                # Começa de uma posição sorteada para variar os desempates entre tentativas
+                deslocamento = aleatorio.randrange(len(vizinhos)) if vizinhos else 0
+                for vizinho in vizinhos[deslocamento:] + vizinhos[:deslocamento]:
+                    if not visitados[vizinho] and livres[vizinho] < menor:
+                        escolhido, menor = vizinho, livres[vizinho]
+                if escolhido != -1:
+                    visitar(escolhido, tamanho)
+                    tamanho += 1
+                    sem_progresso = 0
+                    continue
+                
+                if vertice_inicial is None and livres[int(caminho[0])]:
+                    inverter(0, tamanho)
+                    continue
+                
+                if sem_progresso >= n:
+                    break
+                candidatos = [int(posicao[u]) for u in vizinhos]
+                candidatos = [i for i in candidatos if i < tamanho - 2]
+                if not candidatos:
+                    break
+                promissores = [i for i in candidatos if livres[int(caminho[i + 1])]]
+                i = max(promissores) if promissores else aleatorio.choice(candidatos)
+                inverter(i + 1, tamanho)
+                sem_progresso += 1
+            
+            if tamanho > len(self._maior_caminho):
+                self._maior_caminho = [int(v) for v in caminho[:tamanho]]
+            if tamanho == n:
+                break
+        
+        self._nos_expandidos = nos
+        if len(self._maior_caminho) < n or not caminho_valido(self.grafo, self._maior_caminho,
+                                                             vertice_inicial):
+            # Heurística sem sucesso: o resultado é inconclusivo
+            self._interrompido = True
+            return False
+        self.caminho = self._maior_caminho.copy()
+        self.visitados = [True] * n
+        return True
+    
+    def _buscar(self, vertice_inicial):
         """
-        Adiciona uma aresta ao grafo.
+        Executa o motor configurado a partir de um vértice inicial.
         
         Args:
-            origem (int): Vértice de origem
-            destino (int): Vértice de destino
+            vertice_inicial (int): Vértice onde o caminho deve começar
+            
+        Returns:
+            bool: True se encontrou um caminho hamiltoniano, False caso contrário
         """
-        if 0 <= origem < self.num_vertices and 0 <= destino < self.num_vertices:
-            self.matriz_adj[origem][destino] = True
-            # Se o grafo não for orientado, adiciona a aresta inversa
-            if not self.orientado:
-                self.matriz_adj[destino][origem] = True
-        else:
-            print(f"Erro: Vértices inválidos ({origem}, {destino})")
+        if self.motor == MOTOR_PROGRAMACAO_DINAMICA:
+            return self._programacao_dinamica(vertice_inicial)
+        if self.motor == MOTOR_POSA:
+            return self._posa(vertice_inicial)
+        if self.motor == MOTOR_BIDIRECIONAL:
+            return self._bidirecional(vertice_inicial)
+        return self._backtrack(vertice_inicial)
     
-    def remover_aresta(self, origem, destino):
+    def _resolver_por_blocos(self, vertice_inicial=None, vertice_final=None, workers=1):
         """
-        Remove uma aresta do grafo.
+        Resolve o grafo bloco a bloco, se ele tiver vértices de corte.
+        
+        Os blocos biconexos são encadeados por analise.cadeia_de_blocos e cada
+        um vira um subproblema independente com pontas fixas: o primeiro bloco
+        termina no primeiro vértice de corte, os do meio vão de um vértice de
+        corte ao seguinte e o último começa no último vértice de corte. Os
+        caminhos dos blocos são costurados nos rótulos originais. Em grafos
+        orientados, sem pontas que decidam o sentido, a cadeia é tentada nos
+        dois sentidos.
         
         Args:
-            origem (int): Vértice de origem
-            destino (int): Vértice de destino
+            vertice_inicial (int, optional): Vértice onde o caminho deve começar
+            vertice_final (int, optional): Vértice onde o caminho deve terminar
+            workers (int, optional): Processos para resolver os blocos em
+                                     paralelo (None usa todos os núcleos)
+            
+        Returns:
+            bool ou None: True se encontrou um caminho hamiltoniano, False caso
+                          contrário, ou None se o grafo for um único bloco
         """
-        if 0 <= origem < self.num_vertices and 0 <= destino < self.num_vertices:
-            self.matriz_adj[origem][destino] = False
-            if not self.orientado:
-                self.matriz_adj[destino][origem] = False
+        cadeia = cadeia_de_blocos(vizinhancas_subjacentes(self.grafo))
+        if cadeia is None:
+            self.motivo = MOTIVO_ARVORE_DE_BLOCOS
+            return False
+        blocos, cortes = cadeia
+        if len(blocos) <= 1:
+            return None
+        
+        # Sentidos da cadeia compatíveis com as pontas fixas
+        sentidos = []
+        for ordem in (1, -1):
+            blocos_sentido, cortes_sentido = blocos[::ordem], cortes[::ordem]
+            if vertice_inicial is not None and (vertice_inicial not in blocos_sentido[0]
+                                                or vertice_inicial == cortes_sentido[0]):
+                continue
+            if vertice_final is not None and (vertice_final not in blocos_sentido[-1]
+                                              or vertice_final == cortes_sentido[-1]):
+                continue
+            sentidos.append((blocos_sentido, cortes_sentido))
+        if not self.grafo.orientado:
+            # Sem orientação, um sentido é o outro percorrido ao contrário
+            sentidos = sentidos[:1]
+        if not sentidos:
+            self.motivo = MOTIVO_ARVORE_DE_BLOCOS
+            return False
+        
+        for blocos_sentido, cortes_sentido in sentidos:
+            subproblemas = []
+            for indice, bloco in enumerate(blocos_sentido):
+                inicio = cortes_sentido[indice - 1] if indice > 0 else vertice_inicial
+                final = cortes_sentido[indice] if indice < len(cortes_sentido) else vertice_final
+                subproblemas.append((bloco, inicio, final))
+            caminhos = self._resolver_blocos(subproblemas, workers)
+            if caminhos is not None:
+                caminho = caminhos[0]
+                for trecho in caminhos[1:]:
+                    # Cada trecho começa no vértice de corte que encerra o anterior
+                    caminho.extend(trecho[1:])
+                self.caminho = caminho
+                self.visitados = [True] * self.grafo.num_vertices
+                self.motivo = None
+                return True
+            if self._interrompido:
+                break
+        
+        if self._interrompido:
+            self.motivo = None
+        return False
     
-    def tem_aresta(self, origem, destino):
+    def _resolver_blocos(self, subproblemas, workers=1):
         """
-        Verifica se existe uma aresta entre dois vértices.
+        Resolve os subproblemas de _resolver_por_blocos, do menor bloco ao maior.
+        
+        Basta um bloco sem caminho para que não haja caminho no grafo inteiro:
+        os demais são então abandonados. Em sequência, o orçamento restante
+        passa de um bloco ao seguinte; em paralelo, cada bloco recebe o
+        orçamento inteiro e os trabalhadores são interrompidos pela primeira
+        resposta negativa.
         
         Args:
-            origem (int): Vértice de origem
-            destino (int): Vértice de destino
+            subproblemas (list): Tuplas (vértices do bloco, início, final), com
+                                 início e final nos rótulos originais ou None
+            workers (int, optional): Número de processos (None usa todos os núcleos)
             
         Returns:
-            bool: True se a aresta existe, False caso contrário
+            list ou None: Caminho de cada bloco nos rótulos originais, ou None
+                          se algum bloco não tem caminho (self.motivo) ou o
+                          orçamento se esgotou (self._interrompido)
         """
-        if 0 <= origem < self.num_vertices and 0 <= destino < self.num_vertices:
-            return self.matriz_adj[origem][destino]
-        return False
+        configuracao = dict(self._configuracao(), decompor=False)
+        tarefas = []
+        for bloco, inicio, final in subproblemas:
+            local = {vertice: indice for indice, vertice in enumerate(bloco)}
+            subgrafo = type(self.grafo)(len(bloco), self.grafo.orientado)
+            subgrafo.adicionar_arestas([(local[v], local[w]) for v in bloco
+                                        for w in self._adjacentes[v]
+                                        if w in local and (v < w or self.grafo.orientado and v != w)])
+            tarefas.append((subgrafo, None if inicio is None else local[inicio],
+                            None if final is None else local[final]))
+        ordem = sorted(range(len(tarefas)), key=lambda indice: len(subproblemas[indice][0]))
+        caminhos = [None] * len(tarefas)
+        
+        def registrar(indice, resultado):
+            # Guarda o resultado de um bloco; False se a busca deve parar
+            bloco = subproblemas[indice][0]
+            self._nos_expandidos += resultado.nos_expandidos
+            if len(resultado.maior_caminho) > len(self._maior_caminho):
+                self._maior_caminho = [bloco[v] for v in resultado.maior_caminho]
+            if resultado.status == STATUS_ENCONTRADO:
+                caminhos[indice] = [bloco[v] for v in resultado.caminho]
+                return True
+            if resultado.status == STATUS_IMPOSSIVEL:
+                self.motivo = resultado.motivo
+            else:
+                self._interrompido = True
+            return False
+        
+        if workers is not None and workers <= 1:
+            for indice in ordem:
+                timeout = max_nos = None
+                if self._prazo is not None:
+                    timeout = max(0.0, self._prazo - time.monotonic())
+                if self._limite_nos is not None:
+                    max_nos = max(0, self._limite_nos - self._nos_expandidos)
+                resultado = _resolver_bloco(*tarefas[indice], configuracao, timeout, max_nos,
+                                            self._verificar_parada)
+                if not registrar(indice, resultado):
+                    return None
+            return caminhos
+        
+        timeout = None if self._prazo is None else max(0.0, self._prazo - time.monotonic())
+        parar = multiprocessing.Value('b', 0, lock=False)
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                                 initializer=_inicializar_blocos, initargs=(parar,)) as executor:
+            futuros = {executor.submit(_resolver_bloco, *tarefas[indice], configuracao,
+                                       timeout, self._limite_nos): indice
+                       for indice in ordem}
+            pendentes = set(futuros)
+            while pendentes:
+                prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                # Registra todos os prontos antes de decidir: um all() sobre o
+                # gerador pararia no primeiro bloco sem caminho
+                resultados = [registrar(futuros[futuro], futuro.result()) for futuro in prontos]
+                if not all(resultados):
+                    parar.value = 1
+                    for futuro in pendentes:
+                        futuro.cancel()
+                    return None
+        return caminhos
     
-    def obter_adjacentes(self, vertice):
+    def _buscar_em_paralelo(self, workers):
         """
-        Obtém todos os vértices adjacentes a um dado vértice.
+        Distribui os vértices iniciais do backtracking entre processos.
+        
+        Cada processo recebe o grafo uma única vez e busca a partir dos
+        inícios que lhe forem entregues. Quando um início k tem sucesso, os
+        inícios maiores que k são cancelados (ou interrompidos, se já estiverem
+        em execução), mas os menores continuam: o resultado é sempre o do
+        menor início com caminho, idêntico ao da busca sequencial.
         
         Args:
-            vertice (int): Vértice para buscar adjacentes
+            workers (int): Número de processos
             
         Returns:
-            list: Lista de vértices adjacentes
+            bool: True se encontrou um caminho hamiltoniano, False caso contrário
         """
-        adjacentes = []
-        for i in range(self.num_vertices):
-            if self.matriz_adj[vertice][i]:
-                adjacentes.append(i)
-        return adjacentes
+        n = self.grafo.num_vertices
+        # Menor início com caminho encontrado até agora (n = nenhum; -1 = cancelar tudo)
+        limite = multiprocessing.Value('i', n, lock=False)
+        melhor_inicio, melhor_caminho = n, None
+        
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_inicializar_trabalhador,
+                                 initargs=(self.grafo, self._configuracao(), limite,
+                                           self._limite_nos)) as executor:
+            futuros = {executor.submit(_buscar_a_partir_de, v): v for v in range(n)}
+            pendentes = set(futuros)
+            while pendentes:
+                espera = None
+                if self._prazo is not None:
+                    espera = max(0.0, self._prazo - time.monotonic())
+                prontos, pendentes = wait(pendentes, timeout=espera,
+                                          return_when=FIRST_COMPLETED)
+                if not prontos:
+                    # Tempo esgotado: interrompe todos os trabalhadores
+                    limite.value = -1
+                    for futuro in pendentes:
+                        futuro.cancel()
+                    self._interrompido = True
+                    break
+                
+                for futuro in prontos:
+                    if futuro.cancelled():
+                        continue
+                    caminho, maior_caminho, nos, esgotado = futuro.result()
+                    self._nos_expandidos += nos
+                    self._interrompido = self._interrompido or esgotado
+                    if len(maior_caminho) > len(self._maior_caminho):
+                        self._maior_caminho = maior_caminho
+                    if caminho is not None and futuros[futuro] < melhor_inicio:
+                        melhor_inicio, melhor_caminho = futuros[futuro], caminho
+                        limite.value = melhor_inicio
+                # Só interessam inícios menores que o melhor já encontrado
+                for futuro in pendentes:
+                    if futuros[futuro] > melhor_inicio:
+                        futuro.cancel()
+                pendentes = {f for f in pendentes if futuros[f] < melhor_inicio}
+        
+        if melhor_caminho is None:
+            return False
+        self.caminho = melhor_caminho
+        for vertice in melhor_caminho:
+            self.visitados[vertice] = True
+        return True
     
-    def imprimir_grafo(self):
+    def encontrar_caminho(self, vertice_inicial=None, workers=1, timeout=None, max_nos=None,
+                          vertice_final=None, ciclo=False):
         """
-        Imprime a representação do grafo.
+        Encontra um caminho hamiltoniano no grafo.
+        
+        Args:
+            vertice_inicial (int, optional): Vértice para iniciar a busca.
+                                           Se None, tenta todos os vértices.
+            workers (int, optional): Número de processos para tentar os vértices
+                                     iniciais em paralelo (None usa todos os
+                                     núcleos). Só se aplica ao backtracking
+                                     sem vértice inicial nem final; o resultado
+                                     é o mesmo da busca sequencial. Com
+                                     decompor=True, os blocos é que são
+                                     resolvidos em paralelo.
+            timeout (float, optional): Tempo máximo da busca, em segundos
+            max_nos (int, optional): Número máximo de nós expandidos (na busca
+                                     paralela, vale para cada vértice inicial;
+                                     na programação dinâmica, conta subconjuntos)
+            vertice_final (int, optional): Vértice onde o caminho deve terminar
+            ciclo (bool): Se True, procura um ciclo hamiltoniano: o caminho
+                          devolvido tem n vértices e o último é ligado ao
+                          primeiro. Sem vértice inicial, o ciclo começa no
+                          vértice 0 (ou termina no vértice final, se dado).
+            
+        Returns:
+            tuple: (bool, list) - (encontrou_caminho, caminho). Os detalhes da
+                   busca (status, motivo da resposta negativa, maior caminho
+                   parcial) ficam em self.resultado.
         """
-        tipo = "Orientado" if self.orientado else "Não Orientado"
-        print(f"\nGrafo {tipo} com {self.num_vertices} vértices:")
-        print("Matriz de Adjacência:")
-        for i in range(self.num_vertices):
-            print(f"  {i}: {self.matriz_adj[i]}")
+        self._preparar_busca()
+        self._definir_orcamento(timeout, max_nos)
+        self.motivo = None
+        self._certificado = (vertice_inicial, vertice_final, ciclo,
+                             self.grafo.num_insercoes, self.grafo.num_remocoes)
+        n = self.grafo.num_vertices
         
-        print("\nLista de Arestas:")
-        for i in range(self.num_vertices):
-            adjacentes = self.obter_adjacentes(i)
-            if adjacentes:
-                for j in adjacentes:
-                    if self.orientado or i <= j:  # Evita duplicatas em grafos não orientados
-                        simbolo = "->" if self.orientado else "--"
-                        print(f"  {i} {simbolo} {j}")
-
-
-class CaminhoHamiltoniano:
-    """
-    Classe para encontrar Caminhos Hamiltonianos em grafos.
-    """
+        if vertice_inicial is not None and not 0 <= vertice_inicial < n:
+            print(f"Erro: Vértice inicial inválido ({vertice_inicial})")
+            return self._concluir(False)
+        if vertice_final is not None and not 0 <= vertice_final < n:
+            print(f"Erro: Vértice final inválido ({vertice_final})")
+            return self._concluir(False)
+        
+        # Condições necessárias baratas evitam a busca exponencial
+        if self.pre_analise:
+            self.motivo = analisar_viabilidade(self.grafo, vertice_inicial, vertice_final, ciclo)
+            if self.motivo is not None:
+                return self._concluir(False)
+        
+        if self.decompor and not ciclo:
+            encontrou = self._resolver_por_blocos(vertice_inicial, vertice_final, workers)
+            if encontrou is not None:
+                return self._concluir(encontrou)
+        
+        girar = False
+        if ciclo and n:
+            # Um ciclo pode ser lido a partir de qualquer vértice: o início é
+            # fixado e o caminho precisa terminar num predecessor dele. Com só
+            # o final dado, o ciclo começa nele e depois é girado
+            if vertice_inicial is None:
+                girar = vertice_final is not None
+                vertice_inicial = vertice_final if girar else 0
+            self._finais = [self.grafo.tem_aresta(v, vertice_inicial) for v in range(n)]
+            if n == 2 and not self.grafo.orientado:
+                # O ciclo não orientado de dois vértices repetiria a única aresta
+                self._finais = [False] * n
+            if vertice_final is not None and not girar:
+                self._finais = [v == vertice_final and self._finais[v] for v in range(n)]
+        elif vertice_final is not None:
+            self._finais = [v == vertice_final for v in range(n)]
+        
+        if self._finais is not None:
+            marcados = [v for v in range(n) if self._finais[v]]
+            if len(marcados) == 1:
+                # Ponta final única: as podas reservam um predecessor livre para ela
+                self._alvo = marcados[0]
+                self._entra_no_alvo = [v != self._alvo and self.grafo.tem_aresta(v, self._alvo)
+                                       for v in range(n)]
+        
+        encontrou = False
+        if vertice_inicial is not None:
+            # Busca a partir do vértice inicial especificado
+            encontrou = self._buscar(vertice_inicial)
+        elif self.motor == MOTOR_PROGRAMACAO_DINAMICA:
+            # A programação dinâmica considera todos os inícios numa única passada
+            encontrou = self._programacao_dinamica()
+        elif self.motor == MOTOR_POSA:
+            # A heurística escolhe os inícios por conta própria
+            encontrou = self._posa()
+        elif self.motor == MOTOR_BIDIRECIONAL:
+            # Sem início fixo, o encontro no meio cede à programação dinâmica
+            encontrou = self._bidirecional()
+        elif (workers is None or workers > 1) and n > 1 and self._finais is None:
+            # Tenta os vértices iniciais em paralelo
+            encontrou = self._buscar_em_paralelo(workers or os.cpu_count())
+        else:
+            # Tenta encontrar um caminho hamiltoniano começando de cada vértice
+            for vertice in range(n):
+                inicio = time.perf_counter()
+                encontrou = self._backtrack(vertice)
+                if self.estatisticas is not None:
+                    self.estatisticas.tempo_por_inicio[vertice] = time.perf_counter() - inicio
+                if encontrou or self._interrompido:
+                    break
+        
+        if encontrou and girar:
+            self.caminho = self.caminho[1:] + self.caminho[:1]
+        if not encontrou and not self._interrompido:
+            self.motivo = MOTIVO_BUSCA_EXAUSTIVA
+        return self._concluir(encontrou)
     
-    def __init__(self, grafo):
+    def _concluir(self, encontrou):
         """
-        Inicializa o algoritmo com um grafo.
+        Registra o resultado estruturado da busca em self.resultado.
         
         Args:
-            grafo (Grafo): Instância do grafo a ser analisado
+            encontrou (bool): Se um caminho hamiltoniano foi encontrado
+            
+        Returns:
+            tuple: (bool, list) - (encontrou_caminho, caminho)
         """
-        self.grafo = grafo
-        self.caminho = []
-        self.visitados = [False] * grafo.num_vertices
+        caminho = self.caminho.copy() if encontrou else []
+        if encontrou:
+            self.status = STATUS_ENCONTRADO
+            self._maior_caminho = caminho.copy()
+        elif self._interrompido:
+            self.status = STATUS_ORCAMENTO_ESGOTADO
+        else:
+            self.status = STATUS_IMPOSSIVEL
+        
+        self._fechar_estatisticas()
+        self.resultado = ResultadoBusca(self.status, caminho, self.motivo,
+                                        self._maior_caminho.copy(), self._nos_expandidos,
+                                        time.perf_counter() - self._inicio, self.estatisticas)
+        return encontrou, caminho
+    
+    def _fechar_estatisticas(self):
+        """
+        Registra os totais e os tempos finais nas estatísticas, se coletadas.
+        """
+        if self.estatisticas is None:
+            return
+        self.estatisticas.nos_expandidos = self._nos_expandidos
+        self.estatisticas.tempo_parede = time.perf_counter() - self._inicio
+        self.estatisticas.tempo_cpu = time.process_time() - self._cpu_inicial
+        if self.memo is not None:
+            self.estatisticas.memo = self.memo.para_dicionario()
+    
+    def resolver(self, vertice_inicial=None, workers=1, timeout=None, max_nos=None,
+                 vertice_final=None, ciclo=False):
+        """
+        Busca um caminho hamiltoniano e retorna o resultado estruturado.
         
-    def _backtrack(self, vertice_atual, posicao):
+        Recebe os mesmos argumentos de encontrar_caminho. Com orçamento
+        esgotado, o resultado traz o maior caminho simples visto até então.
+        
+        Returns:
+            ResultadoBusca: Situação, caminho e estatísticas da busca
         """
-        Algoritmo de backtracking para encontrar o caminho hamiltoniano.
+        self.encontrar_caminho(vertice_inicial, workers=workers, timeout=timeout,
+                               max_nos=max_nos, vertice_final=vertice_final, ciclo=ciclo)
+        return self.resultado
+    
+    def atualizar(self, timeout=None, max_nos=None, max_rotacoes=None):
+        """
+        Refaz a última busca de encontrar_caminho depois de alterações no grafo.
+        
+        Reaproveita a resposta anterior sempre que possível:
+        - um caminho continua válido se nenhuma de suas arestas foi removida
+          (inserções nunca o invalidam), o que é conferido em O(n);
+        - uma prova de inexistência continua válida se nenhuma aresta foi
+          inserida (remoções não criam caminhos);
+        - um caminho quebrado por remoções é reparado localmente, unindo os
+          trechos que sobraram por extensões e rotações (_reparar_caminho);
+          buscas com vertice_final ou ciclo não são reparadas.
+        Só se nada disso resolver é feita uma busca completa. A forma usada
+        fica em self.modo_atualizacao ('certificado', 'reparo' ou 'busca').
         
         Args:
-            vertice_atual (int): Vértice atual sendo visitado
-            posicao (int): Posição atual no caminho
+            timeout (float, optional): Tempo máximo da busca completa, em segundos
+            max_nos (int, optional): Número máximo de nós expandidos na busca completa
+            max_rotacoes (int, optional): Rotações permitidas no reparo (padrão: n)
             
         Returns:
-            bool: True se encontrou um caminho hamiltoniano, False caso contrário
+            tuple: (bool, list) - (encontrou_caminho, caminho), como em encontrar_caminho
         """
-        # Marca o vértice atual como visitado
-        self.visitados[vertice_atual] = True
-        self.caminho[posicao] = vertice_atual
+        if self._certificado is None or self.resultado is None:
+            self.modo_atualizacao = ATUALIZACAO_BUSCA
+            return self.encontrar_caminho(timeout=timeout, max_nos=max_nos)
         
-        # Se visitamos todos os vértices, encontramos um caminho hamiltoniano
-        if posicao == self.grafo.num_vertices - 1:
-            return True
+        inicio = time.perf_counter()
+        vertice_inicial, vertice_final, ciclo, insercoes, remocoes = self._certificado
+        anterior = self.resultado
+        caminho = None
+        if anterior.status == STATUS_IMPOSSIVEL and self.grafo.num_insercoes == insercoes:
+            caminho = []
+            self.modo_atualizacao = ATUALIZACAO_CERTIFICADO
+        elif anterior.status == STATUS_ENCONTRADO:
+            if (self.grafo.num_remocoes == remocoes
+                    or caminho_valido(self.grafo, anterior.caminho, vertice_inicial,
+                                      vertice_final, ciclo)):
+                caminho = anterior.caminho.copy()
+                self.modo_atualizacao = ATUALIZACAO_CERTIFICADO
+            elif vertice_final is None and not ciclo:
+                caminho = self._reparar_caminho(anterior.caminho, vertice_inicial, max_rotacoes)
+                self.modo_atualizacao = ATUALIZACAO_REPARO
         
-        # Tenta todos os vértices adjacentes não visitados
-        for proximo_vertice in self.grafo.obter_adjacentes(vertice_atual):
-            if not self.visitados[proximo_vertice]:
-                if self._backtrack(proximo_vertice, posicao + 1):
-                    return True
+        if caminho is None:
+            self.modo_atualizacao = ATUALIZACAO_BUSCA
+            return self.encontrar_caminho(vertice_inicial, timeout=timeout, max_nos=max_nos,
+                                          vertice_final=vertice_final, ciclo=ciclo)
         
-        # Backtrack: desfaz a escolha atual
-        self.visitados[vertice_atual] = False
-        self.caminho[posicao] = -1
-        return False
+        self._certificado = (vertice_inicial, vertice_final, ciclo,
+                             self.grafo.num_insercoes, self.grafo.num_remocoes)
+        self.caminho = caminho
+        self.visitados = [bool(caminho)] * self.grafo.num_vertices
+        self.status = STATUS_ENCONTRADO if caminho else STATUS_IMPOSSIVEL
+        self.resultado = ResultadoBusca(self.status, caminho.copy(), anterior.motivo,
+                                        caminho.copy(), 0, time.perf_counter() - inicio)
+        return bool(caminho), caminho.copy()
     
-    def encontrar_caminho(self, vertice_inicial=None):
+    def _reparar_caminho(self, caminho, vertice_inicial=None, max_rotacoes=None):
         """
-        Encontra um caminho hamiltoniano no grafo.
+        Tenta refazer um caminho hamiltoniano a partir de um caminho quebrado.
+        
+        As arestas do caminho antigo que ainda existem formam trechos. A partir
+        do trecho que contém o início (ou do mais longo), o caminho novo é
+        estendido pela ponta final até um vizinho ainda fora dele, seguindo
+        em seguida o trecho antigo desse vizinho. De preferência o vizinho é a
+        ponta de um trecho, para não cortá-lo. Quando a ponta não tem vizinhos
+        livres, o caminho é estendido pela outra ponta (sem vértice inicial
+        fixo) ou, em grafos não orientados, sofre uma rotação de Pósa: se a
+        ponta v é vizinha de caminho[i], o trecho caminho[i+1:] é invertido e
+        caminho[i+1] vira a nova ponta.
         
         Args:
-            vertice_inicial (int, optional): Vértice para iniciar a busca.
-                                           Se None, tenta todos os vértices.
+            caminho (list): Caminho hamiltoniano anterior
+            vertice_inicial (int, optional): Vértice em que o caminho deve começar
+            max_rotacoes (int, optional): Número máximo de rotações (padrão: n)
             
         Returns:
-            tuple: (bool, list) - (encontrou_caminho, caminho)
+            list ou None: Caminho hamiltoniano reparado, ou None se o reparo falhou
         """
-        self.caminho = [-1] * self.grafo.num_vertices
-        self.visitados = [False] * self.grafo.num_vertices
+        grafo = self.grafo
+        n = grafo.num_vertices
+        if len(caminho) != n or (vertice_inicial is not None and caminho[0] != vertice_inicial):
+            return None
+        orientado = grafo.orientado
+        adjacentes = [grafo.obter_adjacentes(v) for v in range(n)]
+        if orientado:
+            predecessores = [[] for _ in range(n)]
+            for origem in range(n):
+                for destino in adjacentes[origem]:
+                    predecessores[destino].append(origem)
+        else:
+            predecessores = adjacentes
+        
+        # Ligações do caminho antigo que continuam no grafo
+        seguinte = [-1] * n
+        anterior = [-1] * n
+        for origem, destino in zip(caminho, caminho[1:]):
+            if grafo.tem_aresta(origem, destino):
+                seguinte[origem] = destino
+                anterior[destino] = origem
+        
+        def trecho(vertice, ligacao):
+            """Percorre o trecho antigo a partir de vertice, até um vértice já usado."""
+            percorrido = []
+            while vertice != -1 and not visitados[vertice]:
+                percorrido.append(vertice)
+                visitados[vertice] = True
+                vertice = ligacao[vertice]
+            return percorrido
         
-        # Se um vértice inicial foi especificado
+        def livre(vertice):
+            return vertice == -1 or visitados[vertice]
+        
+        def extensao(ponta, vizinhos, para_frente):
+            """
+            Escolhe um vizinho fora do caminho e a ligação a seguir a partir dele.
+            
+            Returns:
+                tuple: (vizinho, ligação), ou (-1, None) se não houver vizinho livre
+            """
+            escolhido, ligacao = -1, None
+            for vizinho in vizinhos:
+                if visitados[vizinho]:
+                    continue
+                # Ponta de trecho: o trecho inteiro entra sem ser cortado
+                if para_frente and livre(anterior[vizinho]):
+                    return vizinho, seguinte
+                if not para_frente and livre(seguinte[vizinho]):
+                    return vizinho, anterior
+                if not orientado and livre(seguinte[vizinho] if para_frente else anterior[vizinho]):
+                    return vizinho, anterior if para_frente else seguinte
+                if escolhido == -1:
+                    escolhido, ligacao = vizinho, seguinte if para_frente else anterior
+            return escolhido, ligacao
+        
+        visitados = [False] * n
         if vertice_inicial is not None:
-            if 0 <= vertice_inicial < self.grafo.num_vertices:
-                if self._backtrack(vertice_inicial, 0):
-                    return True, self.caminho.copy()
-                else:
-                    return False, []
-            else:
-                print(f"Erro: Vértice inicial inválido ({vertice_inicial})")
-                return False, []
+            novo = trecho(vertice_inicial, seguinte)
+        else:
+            cabecas = [v for v in caminho if anterior[v] == -1]
+            comprimentos = {}
+            for cabeca in cabecas:
+                tamanho, v = 0, cabeca
+                while v != -1:
+                    tamanho += 1
+                    v = seguinte[v]
+                comprimentos[cabeca] = tamanho
+            novo = trecho(max(cabecas, key=comprimentos.get), seguinte)
         
-        # Tenta encontrar um caminho hamiltoniano começando de cada vértice
-        for vertice in range(self.grafo.num_vertices):
-            self.caminho = [-1] * self.grafo.num_vertices
-            self.visitados = [False] * self.grafo.num_vertices
+        aleatorio = random.Random(self.semente)
+        limite = n if max_rotacoes is None else max_rotacoes
+        rotacoes = 0
+        while len(novo) < n:
+            vizinho, ligacao = extensao(novo[-1], adjacentes[novo[-1]], True)
+            if vizinho != -1:
+                novo.extend(trecho(vizinho, ligacao))
+                continue
+            
+            if vertice_inicial is None:
+                vizinho, ligacao = extensao(novo[0], predecessores[novo[0]], False)
+                if vizinho != -1:
+                    acrescimo = trecho(vizinho, ligacao)
+                    acrescimo.reverse()
+                    novo = acrescimo + novo
+                    continue
+            
+            if orientado or rotacoes >= limite:
+                return None
             
-            if self._backtrack(vertice, 0):
-                return True, self.caminho.copy()
+            # Rotação de Pósa; prefere a que deixa a nova ponta com vizinho livre
+            posicao = {vertice: indice for indice, vertice in enumerate(novo)}
+            ponta = novo[-1]
+            candidatos = [posicao[u] for u in adjacentes[ponta]
+                          if u != ponta and posicao[u] < len(novo) - 2]
+            if not candidatos:
+                return None
+            promissores = [i for i in candidatos
+                           if any(not visitados[w] for w in adjacentes[novo[i + 1]])]
+            i = aleatorio.choice(promissores or candidatos)
+            novo[i + 1:] = novo[:i:-1]
+            rotacoes += 1
         
-        return False, []
+        return novo
     
-    def encontrar_todos_caminhos(self):
+    def iterar_caminhos(self, limite=None, canonico=False, automorfismos=False,
+                        timeout=None, max_nos=None):
         """
-        Encontra todos os caminhos hamiltonianos possíveis no grafo.
+        Gera os caminhos hamiltonianos do grafo sob demanda.
         
-        Returns:
-            list: Lista de todos os caminhos hamiltonianos encontrados
+        Nenhum caminho é armazenado: cada um é produzido assim que encontrado
+        e a busca para quando o consumidor deixa de pedir o próximo. O estado
+        da busca fica no próprio objeto, então o algoritmo não deve ser usado
+        para outras buscas enquanto a iteração estiver em andamento.
+        
+        Args:
+            limite (int, optional): Número máximo de caminhos a gerar
+            canonico (bool): Em grafos não orientados, gera cada caminho uma
+                             única vez, orientado com a menor ponta primeiro.
+                             Os ramos espelhados são podados durante a busca.
+            automorfismos (bool): Explora apenas uma ordem relativa dos vértices
+                                  de cada classe de gêmeos (ver
+                                  analise.classes_de_gemeos) e obtém os demais
+                                  caminhos permutando as classes. Útil em
+                                  grafos muito simétricos, como os completos.
+            timeout (float, optional): Tempo máximo da busca, em segundos
+            max_nos (int, optional): Número máximo de nós expandidos
+            
+        Ao final da iteração, self.status indica se ela terminou por esgotar
+        o orçamento ('orcamento_esgotado').
+        
+        Yields:
+            list: Cópia de cada caminho hamiltoniano encontrado
         """
-        todos_caminhos = []
+        if canonico and self.grafo.orientado:
+            raise ValueError("A enumeração canônica só se aplica a grafos não orientados")
+        
+        self._preparar_busca()
+        self._definir_orcamento(timeout, max_nos)
+        self.status = None
+        n = self.grafo.num_vertices
+        
+        self.motivo = analisar_viabilidade(self.grafo) if self.pre_analise else None
+        if self.motivo is not None:
+            self.status = STATUS_IMPOSSIVEL
+            return
+        
+        gerados = 0
+        if limite is not None and limite <= 0:
+            return
+        
+        classes = classes_de_gemeos(self.grafo) if automorfismos else []
+        if classes:
+            self._gemeo_anterior = [-1] * n
+            for classe in classes:
+                for anterior, vertice in zip(classe, classe[1:]):
+                    self._gemeo_anterior[vertice] = anterior
         
-        def _backtrack_todos(vertice_atual, posicao, caminho_atual):
-            """Backtracking modificado para encontrar todos os caminhos."""
-            self.visitados[vertice_atual] = True
-            caminho_atual[posicao] = vertice_atual
+        # Tenta todos os vértices como ponto de partida
+        for vertice_inicial in range(n):
+            if classes and self._gemeo_anterior[vertice_inicial] >= 0:
+                continue  # Só o menor gêmeo de cada classe pode iniciar o caminho
+            if canonico and not classes:
+                # Caminho canônico: a ponta final tem índice maior que a inicial
+                if n > 1 and vertice_inicial == n - 1:
+                    break
+                self._finais = [v > vertice_inicial for v in range(n)] if n > 1 else None
+                if self.memo is not None:
+                    # Os estados mortos dependem das pontas finais aceitas
+                    self.memo.limpar()
             
-            if posicao == self.grafo.num_vertices - 1:
-                # Encontrou um caminho completo, adiciona à lista
-                todos_caminhos.append(caminho_atual.copy())
-            else:
-                # Continua a busca
-                for proximo_vertice in self.grafo.obter_adjacentes(vertice_atual):
-                    if not self.visitados[proximo_vertice]:
-                        _backtrack_todos(proximo_vertice, posicao + 1, caminho_atual)
+            inicio = time.perf_counter()
+            for caminho in self._gerar_caminhos(vertice_inicial):
+                for variante in self._expandir_gemeos(caminho, classes):
+                    if canonico and classes and variante[0] > variante[-1]:
+                        continue
+                    yield variante
+                    gerados += 1
+                    if gerados == limite:
+                        self.status = STATUS_ENCONTRADO
+                        self._fechar_estatisticas()
+                        return
+            if self.estatisticas is not None:
+                self.estatisticas.tempo_por_inicio[vertice_inicial] = time.perf_counter() - inicio
             
-            # Backtrack
-            self.visitados[vertice_atual] = False
-            caminho_atual[posicao] = -1
+            if self._interrompido:
+                self.status = STATUS_ORCAMENTO_ESGOTADO
+                self._fechar_estatisticas()
+                return
         
-        # Tenta todos os vértices como ponto de partida
-        for vertice_inicial in range(self.grafo.num_vertices):
-            self.visitados = [False] * self.grafo.num_vertices
-            caminho_temp = [-1] * self.grafo.num_vertices
-            _backtrack_todos(vertice_inicial, 0, caminho_temp)
+        self.status = STATUS_ENCONTRADO if gerados else STATUS_IMPOSSIVEL
+        self._fechar_estatisticas()
+    
+    def _expandir_gemeos(self, caminho, classes):
+        """
+        Gera todos os caminhos obtidos permutando os vértices de cada classe de gêmeos.
+        
+        Args:
+            caminho (list): Caminho em que cada classe aparece em ordem crescente
+            classes (list): Classes de gêmeos
+            
+        Yields:
+            list: Cópias do caminho com cada combinação de permutações
+        """
+        if not classes:
+            yield caminho.copy()
+            return
+        
+        posicoes = {vertice: indice for indice, vertice in enumerate(caminho)}
+        lugares = [sorted(posicoes[v] for v in classe) for classe in classes]
+        for escolha in product(*(permutations(classe) for classe in classes)):
+            variante = caminho.copy()
+            for lugares_classe, ordem in zip(lugares, escolha):
+                for indice, vertice in zip(lugares_classe, ordem):
+                    variante[indice] = vertice
+            yield variante
+    
+    def contar_caminhos(self, vertice_inicial=None, timeout=None):
+        """
+        Conta os caminhos hamiltonianos sem enumerá-los.
+        
+        Programação dinâmica sobre pares (subconjunto visitado, vértice final):
+        o número de caminhos que cobrem um subconjunto e terminam em w é a soma,
+        sobre os predecessores v de w, dos caminhos que cobrem o subconjunto
+        sem w e terminam em v. Os inteiros do Python não transbordam, então a
+        contagem é exata qualquer que seja o número de caminhos.
+        
+        Tempo O(2^n · n²) e memória O(2^n · n), por isso o grafo é limitado a
+        LIMITE_VERTICES_CONTAGEM vértices. Cada caminho é contado como uma
+        sequência de vértices, como em encontrar_todos_caminhos: em grafos
+        não orientados, um caminho e seu reverso contam duas vezes.
+        
+        Args:
+            vertice_inicial (int, optional): Conta apenas caminhos que começam
+                                           neste vértice
+            timeout (float, optional): Tempo máximo da contagem, em segundos
+            
+        Returns:
+            int ou None: Número de caminhos hamiltonianos, ou None se o tempo
+                         se esgotou (self.status = 'orcamento_esgotado')
+        """
+        n = self.grafo.num_vertices
+        if n > LIMITE_VERTICES_CONTAGEM:
+            raise ValueError(f"Contagem limitada a {LIMITE_VERTICES_CONTAGEM} vértices "
+                             f"(grafo tem {n})")
+        if vertice_inicial is not None and not 0 <= vertice_inicial < n:
+            print(f"Erro: Vértice inicial inválido ({vertice_inicial})")
+            return 0
+        
+        # Nada de uma contagem anterior (como um orçamento esgotado) fica valendo
+        self.status = None
+        self._interrompido = False
+        self.motivo = analisar_viabilidade(self.grafo, vertice_inicial) if self.pre_analise else None
+        if self.motivo is not None:
+            self.status = STATUS_IMPOSSIVEL
+            return 0
+        
+        sucessores = [self.grafo.mascara_adjacentes(v) & ~(1 << v) for v in range(n)]
+        completo = (1 << n) - 1
+        
+        # O prazo é conferido antes de alocar a tabela, que é o passo mais caro
+        self._definir_orcamento(timeout)
+        self._nos_expandidos = 0
+        if self._deve_parar():
+            self._interrompido = True
+            self.status = STATUS_ORCAMENTO_ESGOTADO
+            return None
+        # contagens[mascara * n + v]: caminhos que cobrem mascara e terminam em v
+        contagens = [0] * (n << n)
+        inicios = range(n) if vertice_inicial is None else [vertice_inicial]
+        for vertice in inicios:
+            contagens[(1 << vertice) * n + vertice] = 1
+        
+        for mascara in range(1, completo):
+            # Consulta o prazo a cada 4096 subconjuntos, como a programação dinâmica
+            if not mascara & 0xFFF:
+                self._nos_expandidos = mascara
+                if self._deve_parar():
+                    self._interrompido = True
+                    self.status = STATUS_ORCAMENTO_ESGOTADO
+                    return None
+            
+            base = mascara * n
+            livres = completo & ~mascara
+            for vertice in _vertices_da_mascara(mascara):
+                quantidade = contagens[base + vertice]
+                if not quantidade:
+                    continue
+                for proximo in _vertices_da_mascara(sucessores[vertice] & livres):
+                    contagens[(mascara | 1 << proximo) * n + proximo] += quantidade
+        
+        total = sum(contagens[completo * n:(completo + 1) * n])
+        self.status = STATUS_ENCONTRADO if total else STATUS_IMPOSSIVEL
+        if total == 0:
+            self.motivo = MOTIVO_BUSCA_EXAUSTIVA
+        return total
+    
+    def encontrar_todos_caminhos(self, canonico=False, automorfismos=False,
+                                 timeout=None, max_nos=None):
+        """
+        Encontra todos os caminhos hamiltonianos possíveis no grafo.
+        
+        Args:
+            canonico (bool): Em grafos não orientados, retorna cada caminho uma
+                             única vez (ver iterar_caminhos)
+            automorfismos (bool): Usa a poda por classes de gêmeos
+            timeout (float, optional): Tempo máximo da busca, em segundos
+            max_nos (int, optional): Número máximo de nós expandidos
+        
+        Returns:
+            list: Lista dos caminhos hamiltonianos encontrados (parcial se
+                  self.status indicar orçamento esgotado)
+        """
+        return list(self.iterar_caminhos(canonico=canonico, automorfismos=automorfismos,
+                                         timeout=timeout, max_nos=max_nos))
+
+
+# Estado de cada processo trabalhador da busca paralela
+_TRABALHADOR = {}
+
+
+def _inicializar_trabalhador(grafo, configuracao, limite, max_nos=None):
+    """
+    Prepara um processo trabalhador da busca paralela.
+    
+    Args:
+        grafo (Grafo): Grafo a ser analisado (recebido uma única vez)
+        configuracao (dict): Parâmetros de construção do CaminhoHamiltoniano
+        limite (multiprocessing.Value): Menor início com caminho já encontrado
+        max_nos (int, optional): Limite de nós expandidos por vértice inicial
+    """
+    configuracao = dict(configuracao, pre_analise=False)
+    _TRABALHADOR['algoritmo'] = CaminhoHamiltoniano(grafo, **configuracao)
+    _TRABALHADOR['limite'] = limite
+    _TRABALHADOR['max_nos'] = max_nos
+
+
+def _buscar_a_partir_de(vertice_inicial):
+    """
+    Executa o backtracking a partir de um início dentro de um processo trabalhador.
+    
+    A busca é interrompida assim que algum início menor tiver sucesso.
+    
+    Args:
+        vertice_inicial (int): Vértice onde o caminho deve começar
+        
+    Returns:
+        tuple: (caminho ou None, maior caminho parcial, nós expandidos,
+                True se o orçamento de nós se esgotou)
+    """
+    algoritmo = _TRABALHADOR['algoritmo']
+    limite = _TRABALHADOR['limite']
+    if limite.value < vertice_inicial:
+        return None, [], 0, False
+    
+    algoritmo._verificar_parada = lambda: limite.value < vertice_inicial
+    algoritmo._preparar_busca()
+    algoritmo._definir_orcamento(max_nos=_TRABALHADOR['max_nos'])
+    caminho = None
+    if algoritmo._backtrack(vertice_inicial):
+        caminho = algoritmo.caminho.copy()
+    esgotado = algoritmo._interrompido and limite.value >= vertice_inicial
+    return caminho, algoritmo._maior_caminho, algoritmo._nos_expandidos, esgotado
+
+
+def _inicializar_blocos(parar):
+    """
+    Prepara um processo trabalhador da resolução em paralelo dos blocos.
+    
+    Args:
+        parar (multiprocessing.Value): Sinal de que algum bloco não tem caminho
+    """
+    _TRABALHADOR['parar'] = parar
+
+
+def _resolver_bloco(grafo, vertice_inicial, vertice_final, configuracao, timeout=None,
+                    max_nos=None, verificar_parada=None):
+    """
+    Resolve um bloco de CaminhoHamiltoniano._resolver_por_blocos.
+    
+    Args:
+        grafo (Grafo): Subgrafo do bloco, com os vértices renumerados
+        vertice_inicial (int, optional): Vértice onde o caminho do bloco começa
+        vertice_final (int, optional): Vértice onde o caminho do bloco termina
+        configuracao (dict): Parâmetros de construção do CaminhoHamiltoniano
+        timeout (float, optional): Tempo máximo da busca, em segundos
+        max_nos (int, optional): Número máximo de nós expandidos
+        verificar_parada (callable, optional): Critério de parada externo (na
+                                               resolução em paralelo, o sinal
+                                               do processo trabalhador)
         
-        return todos_caminhos
+    Returns:
+        ResultadoBusca: Resultado da busca no bloco
+    """
+    algoritmo = CaminhoHamiltoniano(grafo, **configuracao)
+    if verificar_parada is None and 'parar' in _TRABALHADOR:
+        parar = _TRABALHADOR['parar']
+        verificar_parada = lambda: parar.value != 0
+    algoritmo._verificar_parada = verificar_parada
+    return algoritmo.resolver(vertice_inicial, timeout=timeout, max_nos=max_nos,
+                              vertice_final=vertice_final)
 
 
 def criar_grafo_exemplo_1():
@@ -284,25 +3379,25 @@ def criar_grafo_exemplo_3():
     return grafo
 
 
-def criar_grafo_completo(n):
+def criar_grafo_completo(n, silencioso=False):
     """
     Cria um grafo completo com n vértices.
     
     Args:
         n (int): Número de vértices
+        silencioso (bool): Se True, não imprime o grafo criado
         
     Returns:
         Grafo: Instância do grafo completo criado
     """
-    print(f"\n=== Grafo Completo com {n} vértices ===")
     grafo = Grafo(n, orientado=False)
     
-    # Conecta todos os vértices entre si
-    for i in range(n):
-        for j in range(i + 1, n):
-            grafo.adicionar_aresta(i, j)
+    # Conecta todos os vértices entre si (sem laços)
+    grafo.matriz_adj = [[i != j for j in range(n)] for i in range(n)]
     
-    grafo.imprimir_grafo()
+    if not silencioso:
+        print(f"\n=== Grafo Completo com {n} vértices ===")
+        grafo.imprimir_grafo()
     return grafo
 
 
@@ -366,19 +3461,27 @@ def executar_busca_caminho(grafo, nome_exemplo, mostrar_visualizacao=True):
     if encontrou:
         print(f"✓ Caminho Hamiltoniano encontrado: {' -> '.join(map(str, caminho))}")
         
-        # Verifica se queremos encontrar todos os caminhos (apenas para grafos pequenos)
-        if grafo.num_vertices <= 5:
-            todos_caminhos = algoritmo.encontrar_todos_caminhos()
-            if len(todos_caminhos) > 1:
-                print(f"  Total de caminhos hamiltonianos: {len(todos_caminhos)}")
-                print("  Outros caminhos encontrados:")
-                for i, caminho_alt in enumerate(todos_caminhos[1:6], 1):  # Mostra até 5 alternativos
-                    print(f"    {i}: {' -> '.join(map(str, caminho_alt))}")
-                if len(todos_caminhos) > 6:
-                    print(f"    ... e mais {len(todos_caminhos) - 6} caminhos")
+        # O total vem da contagem por programação dinâmica, sem enumerar caminhos
+        total = None
+        if grafo.num_vertices <= LIMITE_VERTICES_CONTAGEM_EXIBICAO:
+            total = algoritmo.contar_caminhos()
+            print(f"  Total de caminhos hamiltonianos: {total}")
+        
+        # Busca apenas os caminhos que serão exibidos: o gerador para depois do sexto
+        primeiros_caminhos = list(algoritmo.iterar_caminhos(limite=6))
+        if len(primeiros_caminhos) > 1:
+            print("  Outros caminhos encontrados:")
+            for i, caminho_alt in enumerate(primeiros_caminhos[1:], 1):  # Mostra até 5 alternativos
+                print(f"    {i}: {' -> '.join(map(str, caminho_alt))}")
+            if total is not None and total > 6:
+                print(f"    ... e mais {total - 6} caminhos")
+            elif total is None and len(primeiros_caminhos) == 6:
+                print("    ... (busca encerrada após 6 caminhos)")
         
     else:
         print("✗ Nenhum Caminho Hamiltoniano encontrado")
+        if algoritmo.motivo is not None:
+            print(f"  Motivo: {descrever_motivo(algoritmo.motivo)}")
     
     # Tentativa de visualização (se bibliotecas estiverem disponíveis)
     if mostrar_visualizacao and grafo.num_vertices <= 10:  # Limita visualização para grafos pequenos
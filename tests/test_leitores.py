@@ -0,0 +1,66 @@
+"""
+Testes da leitura de listas de arestas e arquivos DIMACS (leitores).
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from leitores import ler_dimacs, ler_lista_arestas  # noqa: E402
+
+
+def _escrever(tmp_path, texto, nome='arestas.txt'):
+    caminho = tmp_path / nome
+    caminho.write_text(texto, encoding='utf-8')
+    return str(caminho)
+
+
+def test_lista_com_pesos_e_rejeitada(tmp_path):
+    caminho = _escrever(tmp_path, "0 1 5\n1 2 7\n2 3 1\n3 0 2\n")
+    with pytest.raises(ValueError, match="Linha 1: 3 colunas"):
+        ler_lista_arestas(caminho)
+
+
+def test_lista_com_pesos_ignorados(tmp_path):
+    caminho = _escrever(tmp_path, "0 1 5\n1 2 7\n2 3 1\n3 0 2")
+    grafo = ler_lista_arestas(caminho, ignorar_pesos=True)
+    assert grafo.num_vertices == 4
+    assert sorted(grafo.obter_adjacentes(0)) == [1, 3]
+    assert sorted(grafo.obter_adjacentes(2)) == [1, 3]
+
+
+def test_linha_mal_formada_entre_blocos(tmp_path):
+    # Comentários e a divisão em blocos não alteram a numeração das linhas
+    texto = "# comentario\n0 1\n\n1,2\n" + "2 3\n" * 50 + "3 4 9\n4 5\n"
+    caminho = _escrever(tmp_path, texto)
+    with pytest.raises(ValueError, match="Linha 55: 3 colunas"):
+        ler_lista_arestas(caminho, tamanho_bloco=16)
+    grafo = ler_lista_arestas(caminho, tamanho_bloco=16, ignorar_pesos=True)
+    assert grafo.num_vertices == 6
+
+
+def test_linha_com_uma_coluna(tmp_path):
+    caminho = _escrever(tmp_path, "0 1\n2\n3 0\n")
+    with pytest.raises(ValueError, match="Linha 2: 1 colunas"):
+        ler_lista_arestas(caminho, ignorar_pesos=True)
+
+
+def test_dimacs_aresta_com_uma_coluna(tmp_path):
+    caminho = _escrever(tmp_path, "p edge 2 1\ne 1\ne 2\n", 'grafo.col')
+    with pytest.raises(ValueError, match="Linha 2: 1 colunas"):
+        ler_dimacs(caminho)
+
+
+def test_dimacs_colunas_por_tipo(tmp_path):
+    # O peso é aceito (e descartado) só em arcos
+    caminho = _escrever(tmp_path, "c arcos\np sp 3 2\na 1 2 7\na 2 3\n", 'grafo.gr')
+    grafo = ler_dimacs(caminho)
+    assert grafo.orientado
+    assert grafo.obter_adjacentes(0) == [1]
+    assert grafo.obter_adjacentes(1) == [2]
+    caminho = _escrever(tmp_path, "p edge 3 1\ne 1 2 7\n", 'grafo.col')
+    with pytest.raises(ValueError, match="Linha 2: 3 colunas"):
+        ler_dimacs(caminho)
@@ -81,13 +81,12 @@ class VisualizadorGrafo:
         for i in range(grafo_obj.num_vertices):
             self.nx_graph.add_node(i)
         
-        # Adiciona arestas
+        # Adiciona arestas (via obter_adjacentes, comum a todas as representações)
         for i in range(grafo_obj.num_vertices):
-            for j in range(grafo_obj.num_vertices):
-                if grafo_obj.matriz_adj[i][j]:
-                    if not grafo_obj.orientado and i > j:
-                        continue  # Evita arestas duplicadas em grafos não orientados
-                    self.nx_graph.add_edge(i, j)
+            for j in grafo_obj.obter_adjacentes(i):
+                if not grafo_obj.orientado and i > j:
+                    continue  # Evita arestas duplicadas em grafos não orientados
+                self.nx_graph.add_edge(i, j)
         
         return self.nx_graph
     